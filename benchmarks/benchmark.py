@@ -0,0 +1,206 @@
+# benchmark.py
+#
+# Scenario benchmarks for the game loop, run with SDL's dummy drivers.
+#
+#   python -m benchmarks.benchmark                   # run every scenario and compare with the baseline
+#   python -m benchmarks.benchmark --save-baseline   # store the results as the new baseline
+#   python -m benchmarks.benchmark zombies_500 shop_open --frames 100
+#
+# Each scenario reports the mean milliseconds per frame spent in events, update,
+# collisions and render, plus frames per second. A phase that is slower than the
+# baseline by more than the threshold is flagged as a regression (exit status 1).
+
+import argparse
+import json
+import math
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+from scripts.game import Game
+
+PHASES = ('events', 'update', 'collisions', 'render')
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+
+def start_game(roles=("Sniper",), zombies=0):
+    """Return a headless game in the gameplay step with the given team and extra zombies."""
+    game = Game(headless=True)
+    game.team_selection_step.selected_roles = list(roles)
+    game.team_selection_step.apply_team_boosts(game.team_selection_step.selected_roles)
+    game.start_game_after_team_selection()
+    game.waves.clear()
+    game.zombies.clear()
+    game.spawn_zombies(zombies)
+    return game
+
+
+def bullet_stream(game, frame, shots_per_frame=20):
+    """Hold the fire button and add a fan of bullets from the character every frame."""
+    game.input.mouse_buttons[0] = True
+    character = game.character
+    for i in range(shots_per_frame):
+        angle = (frame * 7 + i * 360 / shots_per_frame) % 360
+        game.bullets.spawn(character.x, character.y,
+                           character.x + 100 * math.cos(math.radians(angle)),
+                           character.y + 100 * math.sin(math.radians(angle)), game.zoom_level)
+
+
+def setup_shop(game):
+    game.shop.shop_open = True
+
+
+def setup_stat_window(game):
+    game.stat_window.set_visibility(True)
+
+
+# name: (roles, zombies, setup(game) or None, per-frame driver(game, frame) or None)
+SCENARIOS = {
+    'zombies_50': (("Sniper",), 50, None, None),
+    'zombies_500': (("Sniper",), 500, None, None),
+    'zombies_5000': (("Sniper",), 5000, None, None),
+    'machine_gunner_stream': (("Machine Gunner",), 500, None, bullet_stream),
+    'shop_open': (("Sniper",), 500, setup_shop, None),
+    'stat_window': (("Sniper",), 500, setup_stat_window, None),
+}
+
+
+class PhaseTimer:
+    """Accumulates the time spent in a method of the game by wrapping it on the instance."""
+
+    def __init__(self):
+        self.elapsed = 0.0
+
+    def wrap(self, obj, name):
+        method = getattr(obj, name)
+
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self.elapsed += time.perf_counter() - start
+
+        setattr(obj, name, timed)
+
+
+def run_scenario(name, frames=300, warmup=20, seed=1):
+    """Run one scenario and return its mean milliseconds per frame for each phase, and its FPS."""
+    roles, zombies, setup, driver = SCENARIOS[name]
+    random.seed(seed)
+    game = start_game(roles, zombies)
+    if setup:
+        setup(game)
+
+    # Collisions are timed inside update_game and taken out of the update phase
+    collisions = PhaseTimer()
+    collisions.wrap(game, 'check_bullet_collisions')
+    collisions.wrap(game, 'check_for_drop_collection')
+
+    totals = dict.fromkeys(PHASES, 0.0)
+    for frame in range(warmup + frames):
+        if driver:
+            driver(game, frame)
+
+        start = time.perf_counter()
+        game.handle_events()
+        events_done = time.perf_counter()
+
+        collisions.elapsed = 0.0
+        game.clock.tick()
+        for _ in game.clock.steps():
+            game.update_game()
+        update_done = time.perf_counter()
+
+        game.render_game()
+        render_done = time.perf_counter()
+
+        if frame >= warmup:
+            totals['events'] += events_done - start
+            totals['update'] += update_done - events_done - collisions.elapsed
+            totals['collisions'] += collisions.elapsed
+            totals['render'] += render_done - update_done
+
+    result = {phase: totals[phase] / frames * 1000 for phase in PHASES}
+    result['frame'] = sum(result[phase] for phase in PHASES)
+    result['fps'] = 1000 / result['frame'] if result['frame'] else 0.0
+    return result
+
+
+def compare(results, baseline, threshold, min_ms=0.05):
+    """Return a line for every phase that got slower than the baseline by more than threshold."""
+    regressions = []
+    for name, result in results.items():
+        previous = baseline.get(name)
+        if not previous:
+            continue
+        for phase in PHASES + ('frame',):
+            before, after = previous.get(phase), result[phase]
+            # Ignore phases too short to time reliably
+            if before is None or after - before < min_ms:
+                continue
+            if after > before * (1 + threshold):
+                regressions.append(f"{name} {phase}: {before:.3f} ms -> {after:.3f} ms (+{(after / before - 1) * 100:.0f}%)")
+    return regressions
+
+
+def format_results(results):
+    lines = [f"{'scenario':<24}" + ''.join(f"{phase:>12}" for phase in PHASES) + f"{'frame':>12}{'fps':>10}"]
+    for name, result in results.items():
+        lines.append(f"{name:<24}" + ''.join(f"{result[phase]:>12.3f}" for phase in PHASES + ('frame',)) + f"{result['fps']:>10.1f}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the game loop in fixed scenarios")
+    parser.add_argument('scenarios', nargs='*', help="scenarios to run (default: all): " + ", ".join(SCENARIOS))
+    parser.add_argument('--frames', type=int, default=300, help="timed frames per scenario")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help="baseline file to compare with or save to")
+    parser.add_argument('--save-baseline', action='store_true', help="store these results as the baseline")
+    parser.add_argument('--threshold', type=float, default=0.15, help="slowdown that counts as a regression (0.15 = 15%%)")
+    args = parser.parse_args(argv)
+
+    names = args.scenarios or list(SCENARIOS)
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown:
+        parser.error("unknown scenario: " + ", ".join(unknown))
+
+    results = {}
+    for name in names:
+        results[name] = run_scenario(name, frames=args.frames)
+    print("Mean milliseconds per frame")
+    print(format_results(results))
+
+    if args.save_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as baseline_file:
+                baseline = json.load(baseline_file)
+        baseline.update(results)
+        with open(args.baseline, 'w') as baseline_file:
+            json.dump(baseline, baseline_file, indent=2, sort_keys=True)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("No baseline yet, run with --save-baseline to create one")
+        return 0
+
+    with open(args.baseline) as baseline_file:
+        baseline = json.load(baseline_file)
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print(f"Regressions (slower than the baseline by more than {args.threshold:.0%}):")
+        for line in regressions:
+            print("  " + line)
+        return 1
+    print("No regressions against the baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
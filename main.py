@@ -1,7 +1,44 @@
 # main.py
 
+import argparse
+import atexit
+import time
 from scripts.game import Game
+from scripts.game_input import defend_house_script
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Fortress of the Undead")
+    parser.add_argument('--headless', action='store_true', help="simulate without a window, as fast as the CPU allows")
+    parser.add_argument('--days', type=int, default=10, help="headless: number of days to simulate")
+    parser.add_argument('--max-ticks', type=int, default=None, help="headless: stop after this many simulation ticks")
+    parser.add_argument('--roles', default="Sniper,Machine Gunner", help="headless: comma-separated team roles")
+    parser.add_argument('--seed', type=int, default=None, help="random seed (a replay uses its recorded seed)")
+    parser.add_argument('--record', metavar='PATH', default=None, help="record the seed and input to a replay file")
+    parser.add_argument('--replay', metavar='PATH', default=None, help="play back a recorded game")
+    parser.add_argument('--unthrottled', action='store_true', help="replay: run as fast as possible instead of in real time")
+    args = parser.parse_args()
+    # Headless runs skip the menus and are driven by a script, so they are neither recorded nor replayed
+    if args.headless and (args.record or args.replay):
+        parser.error("--record and --replay cannot be combined with --headless")
+    return args
 
 if __name__ == "__main__":
-    game = Game()
-    game.run()
+    args = parse_args()
+
+    if args.headless:
+        game = Game(headless=True, seed=args.seed)
+        start_time = time.perf_counter()
+        summary = game.run_headless(max_days=args.days, max_ticks=args.max_ticks,
+                                    script=defend_house_script, roles=args.roles.split(','))
+        elapsed = time.perf_counter() - start_time
+        for name, value in summary.items():
+            print(f"{name}: {value}")
+        print(f"wall_seconds: {elapsed:.2f}")
+    else:
+        game = Game(seed=args.seed, record_path=args.record, replay_path=args.replay,
+                    realtime=not args.unthrottled)
+        if game.recorder:
+            atexit.register(game.recorder.close)
+        summary = game.run()
+        for name, value in summary.items():
+            print(f"{name}: {value}")
@@ -0,0 +1,116 @@
+# animation.py
+
+import numpy as np
+import pygame
+from scripts.asset_registry import asset_registry
+
+ZOMBIE_SHEET = 'assets/ZombiesAssets.png'
+CHARACTER_SHEET = 'assets/CharacterAssets.png'
+
+class Clip:
+    """Frames of one animation (rects on a sprite sheet), each shown for frame_ms.
+    A clip that does not loop holds its last frame."""
+
+    def __init__(self, rects, frame_ms, loop=True):
+        self.rects = [pygame.Rect(rect) for rect in rects]
+        self.frame_ms = frame_ms
+        self.loop = loop
+
+    def frame_index(self, elapsed_ms):
+        index = int(elapsed_ms // self.frame_ms)
+        if self.loop:
+            return index % len(self.rects)
+        return min(index, len(self.rects) - 1)
+
+
+# Frame rects on the sheets, measured from the art (the sheets have no regular grid)
+WALKER_WALK = ((31, 603, 81, 167), (131, 601, 82, 168), (232, 601, 81, 169),
+               (330, 602, 86, 167), (432, 602, 80, 167), (531, 599, 92, 170))
+RUNNER_WALK = ((32, 799, 80, 176), (133, 798, 80, 177), (232, 799, 80, 175),
+               (331, 797, 81, 179), (434, 799, 75, 175), (533, 798, 70, 177))
+WALKER_ATTACK = ((642, 603, 118, 165), (776, 603, 123, 165), (904, 600, 120, 168))
+RUNNER_ATTACK = ((620, 795, 143, 180), (770, 795, 135, 181), (913, 795, 111, 181))
+ZOMBIE_DIE = ((300, 480, 156, 95), (471, 486, 169, 97))
+CHARACTER_WALK = ((1, 795, 139, 175), (150, 795, 115, 175))
+CHARACTER_ATTACK = ((265, 795, 211, 175),)
+CHARACTER_DIE = ((795, 780, 99, 190), (906, 790, 106, 180))
+
+# Archetype -> (sprite sheet, clips). Zombies attack once a second, so their attack clip lasts a second.
+ANIMATIONS = {
+    'walker': (ZOMBIE_SHEET, {'walk': Clip(WALKER_WALK, 120), 'attack': Clip(WALKER_ATTACK, 1000 / 3),
+                              'die': Clip(ZOMBIE_DIE, 200, loop=False)}),
+    'runner': (ZOMBIE_SHEET, {'walk': Clip(RUNNER_WALK, 80), 'attack': Clip(RUNNER_ATTACK, 1000 / 3),
+                              'die': Clip(ZOMBIE_DIE, 200, loop=False)}),
+    'character': (CHARACTER_SHEET, {'walk': Clip(CHARACTER_WALK, 200), 'attack': Clip(CHARACTER_ATTACK, 250),
+                                    'die': Clip(CHARACTER_DIE, 300, loop=False)}),
+}
+
+# Zombie archetypes by the number ZombieHorde stores for each zombie
+ZOMBIE_ARCHETYPES = ('walker', 'runner')
+ARCHETYPE_IDS = {name: index for index, name in enumerate(ZOMBIE_ARCHETYPES)}
+
+
+class AnimationSet:
+    """Every frame of one archetype's clips, shared by all of its instances.
+
+    Frames are subsurfaces of the sprite sheet, so slicing copies no pixels; fitted()
+    scales a frame once per box size and keeps the result.
+    """
+
+    def __init__(self, sheet_path, clips):
+        sheet = asset_registry.get_image(sheet_path, scene="game")
+        self.clips = clips
+        # A missing sheet is a grey placeholder, which then stands in for every frame
+        self.frames = {name: [sheet.subsurface(rect.clip(sheet.get_rect()) or sheet.get_rect()) for rect in clip.rects]
+                       for name, clip in clips.items()}
+        self.fitted_frames = {}  # (clip, frame, box width, box height) -> (surface, x offset, y offset)
+
+    def fitted(self, clip, index, width, height):
+        """Return a frame scaled to fit a box of height x height (keeping its shape) and its
+        offset from the top-left of a width x height box, so it stands on the box's bottom centre."""
+        key = (clip, index, width, height)
+        fitted = self.fitted_frames.get(key)
+        if fitted is None:
+            frame = self.frames[clip][index]
+            frame_width, frame_height = frame.get_size()
+            scale = height / max(frame_width, frame_height)
+            size = (max(1, int(frame_width * scale)), max(1, int(frame_height * scale)))
+            fitted = (pygame.transform.smoothscale(frame, size), (width - size[0]) // 2, height - size[1])
+            self.fitted_frames[key] = fitted
+        return fitted
+
+    def frame_at(self, clip, elapsed_ms, width, height):
+        """fitted() for the frame of a clip elapsed_ms after it started."""
+        return self.fitted(clip, self.clips[clip].frame_index(elapsed_ms), width, height)
+
+
+class AnimationLibrary:
+    """Animation sets by archetype, built on first use (the sprite sheets load then)."""
+
+    def __init__(self):
+        self.sets = {}
+        self.timings = {}
+
+    def get(self, archetype):
+        animation = self.sets.get(archetype)
+        if animation is None:
+            animation = self.sets[archetype] = AnimationSet(*ANIMATIONS[archetype])
+        return animation
+
+    def timing(self, clip):
+        """Frame length and frame count of a looping clip for every zombie archetype, as arrays
+        indexed by archetype number (needs no sprite sheet)."""
+        timing = self.timings.get(clip)
+        if timing is None:
+            clips = [ANIMATIONS[name][1][clip] for name in ZOMBIE_ARCHETYPES]
+            timing = self.timings[clip] = (np.array([timed.frame_ms for timed in clips], dtype=np.float64),
+                                           np.array([len(timed.rects) for timed in clips]))
+        return timing
+
+    def clear(self):
+        """Drop every animation set and its scaled frames."""
+        self.sets.clear()
+
+
+# Shared animation sets used by the character and every zombie
+animations = AnimationLibrary()
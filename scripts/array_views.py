@@ -0,0 +1,14 @@
+# array_views.py
+
+def array_property(name, owner='horde'):
+    """Expose one NumPy array of a structure-of-arrays store as an attribute of a view.
+
+    The view must have an `index` attribute and an attribute named `owner` pointing at the store.
+    """
+    def getter(self):
+        return getattr(getattr(self, owner), name)[self.index]
+
+    def setter(self, value):
+        getattr(getattr(self, owner), name)[self.index] = value
+
+    return property(getter, setter)
@@ -0,0 +1,89 @@
+# asset_loader.py
+
+import threading
+from collections import deque
+import pygame
+
+def decode_image(path):
+    """Read and decode an image file (no display needed); None if it cannot be loaded."""
+    try:
+        return pygame.image.load(path)
+    except (pygame.error, FileNotFoundError):
+        return None
+
+
+class AssetLoader:
+    """Decodes image files on a worker thread, ahead of their first use.
+
+    The worker only decodes. Converting to the display's pixel format and scaling stay on
+    the main thread, in AssetRegistry.get_image, which takes the decoded surface from here
+    instead of reading the file again.
+    """
+
+    def __init__(self):
+        self.condition = threading.Condition()
+        self.queue = deque()  # Paths waiting for the worker, in request order
+        self.decoding = None  # Path the worker is decoding right now
+        self.decoded = {}  # path -> decoded surface, or None if it could not be loaded
+        self.thread = None
+
+    def request(self, paths):
+        """Queue image files for decoding, in order (the worker starts with the first request)."""
+        with self.condition:
+            for path in paths:
+                if path not in self.decoded and path not in self.queue and path != self.decoding:
+                    self.queue.append(path)
+            self.condition.notify_all()
+        if self.thread is None:
+            self.thread = threading.Thread(target=self.work, name="asset-loader", daemon=True)
+            self.thread.start()
+
+    def work(self):
+        while True:
+            with self.condition:
+                while not self.queue:
+                    self.condition.wait()
+                path = self.decoding = self.queue.popleft()
+            image = decode_image(path)
+            with self.condition:
+                self.decoded[path] = image
+                self.decoding = None
+                self.condition.notify_all()
+
+    def get_decoded(self, path):
+        """Return the decoded image, waiting for the worker if it is decoding it right now.
+
+        A path still in the queue is decoded here instead of waiting behind the others; a path
+        never requested (or one that failed) returns None.
+        """
+        with self.condition:
+            if path in self.queue:
+                self.queue.remove(path)
+            else:
+                while path == self.decoding:
+                    self.condition.wait()
+                return self.decoded.get(path)
+        image = decode_image(path)
+        with self.condition:
+            self.decoded[path] = image
+        return image
+
+    def is_ready(self, paths):
+        """Whether every one of the paths has been decoded."""
+        with self.condition:
+            return all(path in self.decoded for path in paths)
+
+    def progress(self, paths):
+        """Fraction of the paths decoded so far."""
+        with self.condition:
+            return sum(path in self.decoded for path in paths) / max(1, len(paths))
+
+    def release(self):
+        """Drop the decoded surfaces and anything still queued (the worker goes back to waiting)."""
+        with self.condition:
+            self.queue.clear()
+            self.decoded.clear()
+
+
+# Shared loader, attached to the asset registry while the game starts up
+asset_loader = AssetLoader()
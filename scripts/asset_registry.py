@@ -0,0 +1,79 @@
+# asset_registry.py
+
+import pygame
+
+class AssetRegistry:
+    def __init__(self):
+        # Loaded surfaces keyed by (path, size, alpha)
+        self.images = {}
+        # Scenes that currently hold a reference to each key
+        self.scenes = {}
+
+        # Pre-scaled images from the offline atlas, used instead of decoding the PNGs
+        self.atlas = None
+
+        # AssetLoader decoding images in the background, while the game starts up
+        self.loader = None
+
+        # Cache statistics
+        self.hits = 0
+        self.misses = 0
+
+    def get_image(self, path, size=None, alpha=True, scene="global"):
+        """Return a shared, converted (and optionally pre-scaled) surface for the given image."""
+        key = (path, tuple(size) if size else None, alpha)
+        image = self.images.get(key)
+
+        if image is None:
+            self.misses += 1
+            image = self.atlas.get(key) if self.atlas else None
+            if image is None:
+                image = self.load_image(path, size, alpha)
+            self.images[key] = image
+        else:
+            self.hits += 1
+
+        self.scenes.setdefault(key, set()).add(scene)
+        return image
+
+    def load_image(self, path, size, alpha):
+        """Decode, convert and scale an image once (the decoding may already be done by the loader)."""
+        image = self.loader.get_decoded(path) if self.loader else None
+        if image is None:
+            try:
+                image = pygame.image.load(path)
+            except (pygame.error, FileNotFoundError) as e:
+                print(f"Unable to load image: {e}")
+                image = pygame.Surface(size or (1, 1))
+                image.fill((100, 100, 100))  # Default to grey if image not found
+                return image
+
+        # Convert to the display's pixel format when a display is available
+        if pygame.display.get_surface() is not None:
+            image = image.convert_alpha() if alpha else image.convert()
+
+        if size:
+            image = pygame.transform.scale(image, size)
+        return image
+
+    def evict_scene(self, scene):
+        """Release every surface that is only referenced by the given scene."""
+        for key in list(self.scenes):
+            owners = self.scenes[key]
+            owners.discard(scene)
+            if not owners:
+                del self.scenes[key]
+                del self.images[key]
+
+    def clear(self):
+        """Drop every cached surface."""
+        self.images.clear()
+        self.scenes.clear()
+
+    def stats(self):
+        """Return cache statistics."""
+        return {'hits': self.hits, 'misses': self.misses, 'loaded': len(self.images)}
+
+
+# Shared registry used by every game element
+asset_registry = AssetRegistry()
@@ -0,0 +1,189 @@
+# atlas.py
+#
+# Offline asset pipeline: every image the game loads, pre-scaled to the size the code asks
+# for and packed as raw pixels into one file, which the game memory-maps at startup instead
+# of decoding PNGs.
+#
+#   python -m scripts.atlas            build assets/atlas.bin
+#   python -m scripts.atlas --check    report which entries are out of date
+#
+# The file starts with a small header and a JSON index (entry keys, their place in the
+# atlas, and the size and modification time of each source PNG), followed by the atlas
+# pixels in BGRA order, the layout of converted surfaces. An entry whose PNG changed since
+# the build is stale and loads from the PNG as before; so does any image not listed here.
+
+import argparse
+import json
+import mmap
+import os
+import struct
+import sys
+import pygame
+
+ATLAS_PATH = 'assets/atlas.bin'
+MAGIC = b'UFAT'
+VERSION = 1
+HEADER = struct.Struct('<4sHI')  # Magic, version, index length in bytes
+PIXEL_FORMAT = 'BGRA'
+ATLAS_WIDTH = 2048
+
+# (path, size or None for the full image, alpha): the keys the game asks the asset registry for
+ATLAS_IMAGES = [
+    ('assets/grass.png', (64, 64), False),
+    ('assets/starterhouseIMG.png', (200, 200), True),
+    ('assets/starterhouseIMG.png', (60, 60), True),
+    ('assets/ShoppingIMG.png', (80, 50), True),
+    ('assets/settingsIMG.png', (36, 36), True),
+    ('assets/5.56Ammo.png', (10, 30), True),
+    ('assets/AmmoCrateIMG.png', (30, 30), True),
+    ('assets/FoodBagIMG.png', (30, 30), True),
+    ('assets/scrapIMG.png', (30, 30), True),
+    ('assets/Barrel1IMG.png', (40, 40), True),
+    ('assets/rubbleIMG.png', (90, 60), True),
+    ('assets/CharacterAssets.png', None, True),
+    ('assets/ZombiesAssets.png', None, True),
+]
+
+def source_stamp(path):
+    """Size and modification time of a source file, or None if it is missing."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def pack_shelves(sizes, width):
+    """Place rectangles of the given sizes on shelves, tallest first; returns their
+    positions (in the order of sizes) and the height used."""
+    order = sorted(range(len(sizes)), key=lambda i: (-sizes[i][1], -sizes[i][0]))
+    positions = [None] * len(sizes)
+    x = y = shelf_height = 0
+    for i in order:
+        w, h = sizes[i]
+        if x + w > width:
+            x, y, shelf_height = 0, y + shelf_height, 0
+        positions[i] = (x, y)
+        x += w
+        shelf_height = max(shelf_height, h)
+    return positions, y + shelf_height
+
+
+def build_atlas(images=ATLAS_IMAGES, path=ATLAS_PATH, width=ATLAS_WIDTH):
+    """Scale every image the way AssetRegistry.get_image does, pack them and write the atlas."""
+    sprites = []
+    for source, size, alpha in images:
+        image = pygame.image.load(source)
+        if size:
+            image = pygame.transform.scale(image, size)
+        sprites.append(image)
+
+    # Copy each sprite's pixels, row by row, into the atlas (no blending, alpha kept as is)
+    positions, height = pack_shelves([sprite.get_size() for sprite in sprites], width)
+    pixels = bytearray(width * height * 4)
+    for sprite, (x, y) in zip(sprites, positions):
+        sprite_width, sprite_height = sprite.get_size()
+        sprite_pixels = pygame.image.tobytes(sprite, PIXEL_FORMAT)
+        row_length = sprite_width * 4
+        for row in range(sprite_height):
+            start = ((y + row) * width + x) * 4
+            pixels[start:start + row_length] = sprite_pixels[row * row_length:(row + 1) * row_length]
+
+    index = {
+        'width': width,
+        'height': height,
+        'sources': {source: source_stamp(source) for source, _, _ in images},
+        'entries': [[source, size, alpha, list(position) + list(sprite.get_size())]
+                    for (source, size, alpha), position, sprite in zip(images, positions, sprites)],
+    }
+    index_bytes = json.dumps(index).encode()
+    # Pixels start on a 4-byte boundary
+    index_bytes += b' ' * (-(HEADER.size + len(index_bytes)) % 4)
+    with open(path, 'wb') as atlas_file:
+        atlas_file.write(HEADER.pack(MAGIC, VERSION, len(index_bytes)))
+        atlas_file.write(index_bytes)
+        atlas_file.write(pixels)
+    return index
+
+
+class Atlas:
+    """A built atlas, memory-mapped: each entry is a subsurface of one surface wrapped
+    around the mapped pixels, so nothing is decoded or copied until it is drawn."""
+
+    def __init__(self, path, atlas_file, mapping, index, offset):
+        self.path = path
+        self.file = atlas_file
+        self.mapping = mapping
+        self.index = index
+        # Copy-on-write mapping: the pixels stay shared with the page cache unless written to
+        pixels = memoryview(mapping)[offset:offset + index['width'] * index['height'] * 4]
+        self.surface = pygame.image.frombuffer(pixels, (index['width'], index['height']), PIXEL_FORMAT)
+
+        # Sources unchanged since the build, and the rect of each of their entries by registry key
+        self.fresh_sources = {source for source, stamp in index['sources'].items()
+                              if stamp is not None and source_stamp(source) == stamp}
+        self.rects = {}
+        for source, size, alpha, rect in index['entries']:
+            if source in self.fresh_sources:
+                self.rects[(source, tuple(size) if size else None, alpha)] = pygame.Rect(rect)
+
+    @classmethod
+    def open(cls, path=ATLAS_PATH):
+        """Map the atlas file; None if there is none or it is from another version of the pipeline."""
+        try:
+            atlas_file = open(path, 'rb')
+        except OSError:
+            return None
+        try:
+            magic, version, index_length = HEADER.unpack(atlas_file.read(HEADER.size))
+            if magic != MAGIC or version != VERSION:
+                atlas_file.close()
+                return None
+            index = json.loads(atlas_file.read(index_length))
+            mapping = mmap.mmap(atlas_file.fileno(), 0, access=mmap.ACCESS_COPY)
+        except (struct.error, ValueError, OSError):
+            atlas_file.close()
+            return None
+        return cls(path, atlas_file, mapping, index, HEADER.size + index_length)
+
+    def get(self, key):
+        """Return the image for an asset registry key (path, size, alpha), or None if the
+        atlas does not have it or its PNG changed since the build."""
+        rect = self.rects.get(key)
+        return self.surface.subsurface(rect) if rect else None
+
+    def provides(self, path):
+        """Whether the atlas has up-to-date images of the given file."""
+        return path in self.fresh_sources
+
+    def stale_entries(self):
+        """Entry keys whose PNG changed (or is missing) since the build."""
+        return [(source, tuple(size) if size else None, alpha) for source, size, alpha, _ in self.index['entries']
+                if source not in self.fresh_sources]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pack the game's pre-scaled images into a memory-mapped atlas")
+    parser.add_argument('--output', default=ATLAS_PATH, help="atlas file to write")
+    parser.add_argument('--check', action='store_true', help="only report entries that are out of date")
+    args = parser.parse_args(argv)
+
+    if args.check:
+        atlas = Atlas.open(args.output)
+        if atlas is None:
+            print(f"No usable atlas at {args.output}")
+            return 1
+        stale = atlas.stale_entries()
+        for key in stale:
+            print(f"stale: {key}")
+        print(f"{len(atlas.rects)} entries up to date, {len(stale)} stale")
+        return 1 if stale else 0
+
+    index = build_atlas(path=args.output)
+    print(f"{len(index['entries'])} images packed into {args.output} "
+          f"({index['width']}x{index['height']}, {os.path.getsize(args.output) / 1e6:.1f} MB)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,190 @@
+# batch_runner.py
+#
+# Balance sweeps: many seeded headless games in a process pool, one per parameter
+# combination and seed, played by a scripted policy.
+#
+#   python -m scripts.batch_runner --seeds 20 --days 10
+#   python -m scripts.batch_runner --set zombie.health=80,100,120 --set upgrade_prices.Speed=40,60 --seeds 50
+#   python -m scripts.batch_runner --grid sweep.json --csv runs.csv
+#
+# Parameters are dotted names:
+#   upgrade_prices.<stat>      starting price of a shop upgrade
+#   team_boosts.<role>.<stat>  TeamSelectionStep.TEAM_BOOSTS entry
+#   zombie.<stat>              Zombie argument (width, height, health, speed)
+#   roles                      comma-separated team roles
+# A grid file is a JSON object mapping parameter names to lists of values.
+
+import argparse
+import csv
+import itertools
+import json
+import multiprocessing
+import os
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+from scripts.game import Game
+from scripts.game_input import upgrading_script
+
+OUTCOMES = ('days', 'house_health', 'money', 'kills')
+DEFAULT_GRID = {
+    'zombie.health': [80, 100, 120],
+    'zombie.speed': [1, 1.25],
+    'upgrade_prices.Speed': [40, 50, 60],
+}
+DEFAULT_ROLES = "Sniper,Machine Gunner"
+
+
+def apply_params(game, params):
+    """Apply (name, value) parameter pairs to a game that has not started yet; returns its roles."""
+    roles = DEFAULT_ROLES
+    team_boosts = None
+    for name, value in params:
+        kind, _, key = name.partition('.')
+        if kind == 'upgrade_prices':
+            game.shop.upgrade_prices[key] = value
+        elif kind == 'team_boosts':
+            # Copied onto the instance, the class table stays the game's default
+            if team_boosts is None:
+                step = game.team_selection_step
+                team_boosts = step.TEAM_BOOSTS = {role: dict(boosts) for role, boosts in step.TEAM_BOOSTS.items()}
+            role, _, stat = key.partition('.')
+            team_boosts.setdefault(role, {})[stat] = value
+        elif kind == 'zombie':
+            game.zombie_stats[key] = value
+        elif kind == 'roles':
+            roles = value
+        else:
+            raise ValueError(f"Unknown sweep parameter: {name}")
+    return roles.split(',')
+
+
+def init_worker():
+    """Load every asset once per worker process; later games in the worker reuse the registries."""
+    Game(headless=True)
+
+
+def run_job(job):
+    """Play one seeded game and return (params, seed, outcome)."""
+    params, seed, days, max_ticks = job
+    game = Game(headless=True, seed=seed)
+    roles = apply_params(game, params)
+    summary = game.run_headless(max_days=days, max_ticks=max_ticks, script=upgrading_script, roles=roles)
+    return params, seed, {name: summary[name] for name in OUTCOMES}
+
+
+def make_jobs(grid, seeds, days, max_ticks):
+    """Return one job for every combination of the grid's values and every seed."""
+    names = sorted(grid)
+    jobs = []
+    for values in itertools.product(*(grid[name] for name in names)):
+        params = tuple(zip(names, values))
+        for seed in range(seeds):
+            jobs.append((params, seed, days, max_ticks))
+    return jobs
+
+
+class SweepTable:
+    """Outcomes aggregated per parameter combination as the runs come in."""
+
+    def __init__(self, combinations):
+        # params -> {'runs', 'survived', outcome totals}, in grid order
+        self.rows = {params: dict(runs=0, survived=0, **dict.fromkeys(OUTCOMES, 0)) for params in combinations}
+
+    def add(self, params, outcome):
+        row = self.rows[params]
+        row['runs'] += 1
+        if outcome['house_health'] > 0:
+            row['survived'] += 1
+        for name in OUTCOMES:
+            row[name] += outcome[name]
+
+    def format(self):
+        if not self.rows:
+            return "No runs"
+        names = [name for name, _ in next(iter(self.rows))]
+        widths = [max(len(name), 10) + 2 for name in names]
+        lines = [''.join(f"{name:>{width}}" for name, width in zip(names, widths))
+                 + f"{'runs':>7}{'survived':>10}" + ''.join(f"{'mean ' + name:>18}" for name in OUTCOMES)]
+        for params, row in self.rows.items():
+            if not row['runs']:
+                continue
+            line = ''.join(f"{str(value):>{width}}" for (_, value), width in zip(params, widths))
+            line += f"{row['runs']:>7}{row['survived'] / row['runs']:>10.0%}"
+            line += ''.join(f"{row[name] / row['runs']:>18.1f}" for name in OUTCOMES)
+            lines.append(line)
+        return "\n".join(lines)
+
+
+def parse_values(text):
+    """Turn "80,100,1.5,Sniper" into [80, 100, 1.5, 'Sniper']."""
+    values = []
+    for item in text.split(','):
+        try:
+            values.append(json.loads(item))
+        except ValueError:
+            values.append(item)
+    return values
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run seeded headless games over a grid of balance parameters")
+    parser.add_argument('--grid', help="JSON file mapping parameter names to lists of values")
+    parser.add_argument('--set', action='append', default=[], metavar='NAME=V1,V2',
+                        help="sweep a parameter over values (repeatable, added to the grid)")
+    parser.add_argument('--seeds', type=int, default=10, help="seeded runs per parameter combination")
+    parser.add_argument('--days', type=int, default=10, help="days to simulate per run")
+    parser.add_argument('--max-ticks', type=int, default=None, help="stop each run after this many ticks")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help="worker processes (default: every core)")
+    parser.add_argument('--csv', help="also write every run to this CSV file")
+    args = parser.parse_args(argv)
+
+    grid = {}
+    if args.grid:
+        with open(args.grid) as grid_file:
+            grid.update(json.load(grid_file))
+    for entry in args.set:
+        name, _, values = entry.partition('=')
+        grid[name] = parse_values(values)
+    if not grid:
+        grid = DEFAULT_GRID
+    # Roles are written as one comma-separated string, so keep each value whole
+    if 'roles' in grid:
+        grid['roles'] = [','.join(value) if isinstance(value, list) else str(value) for value in grid['roles']]
+
+    jobs = make_jobs(grid, args.seeds, args.days, args.max_ticks)
+    table = SweepTable(dict.fromkeys(params for params, _, _, _ in jobs))
+    csv_file = open(args.csv, 'w', newline='') if args.csv else None
+    writer = None
+    if csv_file:
+        writer = csv.writer(csv_file)
+        writer.writerow(sorted(grid) + ['seed'] + list(OUTCOMES))
+
+    print(f"{len(jobs)} runs on {args.workers} workers")
+    start_time = time.perf_counter()
+    with multiprocessing.Pool(args.workers, initializer=init_worker) as pool:
+        # Small chunks keep every worker busy while results stream back in completion order
+        chunksize = max(1, len(jobs) // (args.workers * 16))
+        for done, (params, seed, outcome) in enumerate(pool.imap_unordered(run_job, jobs, chunksize), 1):
+            table.add(params, outcome)
+            if writer:
+                writer.writerow([value for _, value in params] + [seed] + [outcome[name] for name in OUTCOMES])
+            if done % 100 == 0 or done == len(jobs):
+                elapsed = time.perf_counter() - start_time
+                print(f"\r{done}/{len(jobs)} runs, {done / elapsed:.1f} runs/s", end='', flush=True)
+        # Let the workers exit on their own, terminating them can hang inside SDL
+        pool.close()
+        pool.join()
+    print()
+    if csv_file:
+        csv_file.close()
+
+    print(table.format())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,46 +1,62 @@
-import pygame
 import math
+from scripts.asset_registry import asset_registry
+from scripts.transform_cache import transform_cache
 
 class Bullet:
+    __slots__ = ('x', 'y', 'zoom_level', 'speed', 'base_width', 'base_height', 'bullet_image',
+                 'angle', 'velocity_x', 'velocity_y')
+
     def __init__(self, start_x, start_y, target_x, target_y, zoom_level, speed=10):
+        self.reset(start_x, start_y, target_x, target_y, zoom_level, speed)
+
+    def reset(self, start_x, start_y, target_x, target_y, zoom_level, speed=10):
+        """(Re)initialize the bullet so a pooled instance can be reused."""
         self.x = start_x
         self.y = start_y
         self.zoom_level = zoom_level
         self.speed = speed
 
-        # Load the bullet image and set its base size (adjust as needed)
-        self.bullet_image = pygame.image.load('assets/5.56Ammo.png').convert_alpha()
+        # Shared bullet image, decoded and scaled once by the asset registry
         self.base_width, self.base_height = 10, 30  # Adjust width and height based on the image size
-        self.bullet_image = pygame.transform.scale(self.bullet_image, (self.base_width, self.base_height))
+        self.bullet_image = asset_registry.get_image('assets/5.56Ammo.png', (self.base_width, self.base_height), scene="game")
+
+        # Calculate direction and velocity of the bullet
+        self.angle, self.velocity_x, self.velocity_y = self.aim(start_x, start_y, target_x, target_y, self.speed)
 
-        # Calculate direction of the bullet
+    @staticmethod
+    def aim(start_x, start_y, target_x, target_y, speed):
+        """Return the (angle, velocity_x, velocity_y) of a bullet fired from start toward target."""
         delta_x = target_x - start_x
         delta_y = target_y - start_y
 
         # Adjust angle calculation by adding 90 degrees to align the top correctly
-        self.angle = math.degrees(math.atan2(-delta_y, delta_x)) - 90  # Subtract 90 degrees to fix orientation
+        angle = math.degrees(math.atan2(-delta_y, delta_x)) - 90  # Subtract 90 degrees to fix orientation
 
         # Calculate distance and velocity
         distance = math.hypot(delta_x, delta_y)
-        self.velocity_x = (delta_x / distance) * self.speed
-        self.velocity_y = (delta_y / distance) * self.speed
+        velocity_x = (delta_x / distance) * speed
+        velocity_y = (delta_y / distance) * speed
+        return angle, velocity_x, velocity_y
 
     def update(self):
         """Update the bullet's position."""
         self.x += self.velocity_x
         self.y += self.velocity_y
 
+    def get_hitbox(self):
+        """Return the bullet's bounding box (x, y, width, height) centered on its position."""
+        width = self.bullet_image.get_width() * self.zoom_level
+        height = self.bullet_image.get_height() * self.zoom_level
+        return self.x - width // 2, self.y - height // 2, width, height
+
     def is_off_screen(self, screen_width, screen_height):
         """Check if the bullet is off the screen."""
         return self.x < 0 or self.x > screen_width or self.y < 0 or self.y > screen_height
 
     def draw(self, surface, zoom_level):
         """Draw the bullet on the screen."""
-        # Scale the bullet image based on the zoom level
-        scaled_image = pygame.transform.scale(self.bullet_image, (int(self.base_width * zoom_level), int(self.base_height * zoom_level)))
-
-        # Rotate the bullet image to face the direction of movement
-        rotated_image = pygame.transform.rotate(scaled_image, self.angle)
+        # Scale the bullet image based on the zoom level and rotate it to face the direction of movement
+        rotated_image = transform_cache.get(self.bullet_image, zoom_level, self.angle)
 
         # Get the rectangle of the rotated image and center it on the bullet's current position
         rect = rotated_image.get_rect(center=(self.x, self.y))
@@ -0,0 +1,191 @@
+# bullet_pool.py
+
+import math
+import numpy as np
+from scripts.bullet import Bullet
+from scripts.asset_registry import asset_registry
+from scripts.transform_cache import transform_cache
+from scripts.array_views import array_property
+from scripts.object_pool import ObjectPool
+
+# Per-bullet state stored as one NumPy array per field
+FIELDS = ('x', 'y', 'velocity_x', 'velocity_y', 'angle', 'zoom_level', 'speed', 'traveled', 'age',
+          'previous_x', 'previous_y')
+
+class PooledBullet(Bullet):
+    """A Bullet whose state lives in a BulletPool, so Zombie.check_collision and Bullet methods keep working.
+
+    Views are recycled once their bullet is removed, so do not keep them around.
+    """
+    __slots__ = ('pool', 'index')
+
+    def __init__(self, pool, index):
+        # Bullet.__init__ is not called, the state is already in the pool arrays
+        self.reset(pool, index)
+
+    def reset(self, pool, index):
+        """Point the view at a pool slot."""
+        self.pool = pool
+        self.index = index
+        self.base_width, self.base_height = 10, 30
+        self.bullet_image = asset_registry.get_image('assets/5.56Ammo.png', (self.base_width, self.base_height), scene="game")
+
+    x = array_property('x', 'pool')
+    y = array_property('y', 'pool')
+    velocity_x = array_property('velocity_x', 'pool')
+    velocity_y = array_property('velocity_y', 'pool')
+    angle = array_property('angle', 'pool')
+    zoom_level = array_property('zoom_level', 'pool')
+    speed = array_property('speed', 'pool')
+
+
+class BulletPool:
+    """Fixed-capacity structure-of-arrays storage for every bullet in flight.
+
+    All bullets move in one vector operation per tick, and off-screen or expired bullets
+    are culled with a mask and compacted by swapping live bullets from the end into the holes.
+    """
+
+    def __init__(self, capacity=1024, max_range=None, lifetime=None):
+        self.capacity = capacity
+        self.count = 0
+
+        # Optional limits: distance in pixels and age in ticks (None means until off screen)
+        self.max_range = max_range
+        self.lifetime = lifetime
+
+        for name in FIELDS:
+            setattr(self, name, np.zeros(capacity, dtype=np.float64))
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.views = []
+        self.view_pool = ObjectPool(PooledBullet)
+
+    def __len__(self):
+        return self.count
+
+    def __bool__(self):
+        return self.count > 0
+
+    def __iter__(self):
+        return iter(self.views[:self.count])
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.views[:self.count][index]
+        # Index the views directly, without copying the list
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("bullet index out of range")
+        return self.views[index]
+
+    def spawn(self, start_x, start_y, target_x, target_y, zoom_level, speed=10):
+        """Fire a bullet from start toward target; returns its view.
+
+        When the pool is full the bullet that has travelled the farthest is recycled.
+        """
+        if self.count == self.capacity:
+            self.alive[int(np.argmax(self.traveled[:self.count]))] = False
+            self.compact()
+
+        index = self.count
+        angle, velocity_x, velocity_y = Bullet.aim(start_x, start_y, target_x, target_y, speed)
+        self.x[index] = self.previous_x[index] = start_x
+        self.y[index] = self.previous_y[index] = start_y
+        self.velocity_x[index] = velocity_x
+        self.velocity_y[index] = velocity_y
+        self.angle[index] = angle
+        self.zoom_level[index] = zoom_level
+        self.speed[index] = math.hypot(velocity_x, velocity_y)
+        self.traveled[index] = 0
+        self.age[index] = 0
+        self.alive[index] = True
+
+        view = self.view_pool.acquire(self, index)
+        self.views.append(view)
+        self.count += 1
+        return view
+
+    def kill(self, bullet):
+        """Mark a bullet for removal at the next compaction (safe to call more than once)."""
+        if bullet.pool is self and 0 <= bullet.index < self.count:
+            self.alive[bullet.index] = False
+
+    def update(self, screen_width, screen_height):
+        """Move every bullet, then cull the ones that left the screen or expired."""
+        n = self.count
+        if n == 0:
+            return
+
+        x, y = self.x[:n], self.y[:n]
+        self.previous_x[:n] = x
+        self.previous_y[:n] = y
+        x += self.velocity_x[:n]
+        y += self.velocity_y[:n]
+        self.traveled[:n] += self.speed[:n]
+        self.age[:n] += 1
+
+        alive = self.alive[:n]
+        alive &= (x >= 0) & (x <= screen_width) & (y >= 0) & (y <= screen_height)
+        if self.max_range is not None:
+            alive &= self.traveled[:n] <= self.max_range
+        if self.lifetime is not None:
+            alive &= self.age[:n] < self.lifetime
+
+        self.compact()
+
+    def compact(self):
+        """Remove dead bullets by moving live bullets from the end of the arrays into their slots."""
+        n = self.count
+        dead = np.flatnonzero(~self.alive[:n])
+        if len(dead) == 0:
+            return
+
+        new_count = n - len(dead)
+        holes = dead[dead < new_count]
+        sources = np.flatnonzero(self.alive[new_count:n]) + new_count
+
+        for index in dead:
+            view = self.views[index]
+            view.index = -1
+            self.view_pool.release(view)
+        for name in FIELDS:
+            array = getattr(self, name)
+            array[holes] = array[sources]
+        self.alive[holes] = True
+        self.alive[new_count:n] = False
+
+        for hole, source in zip(holes.tolist(), sources.tolist()):
+            view = self.views[source]
+            view.index = hole
+            self.views[hole] = view
+        del self.views[new_count:]
+        self.count = new_count
+
+    def clear(self):
+        """Remove every bullet."""
+        self.alive[:self.count] = False
+        self.compact()
+
+    def draw(self, surface, zoom_level, alpha=1.0):
+        """Draw every bullet rotated to face its direction of movement; returns the areas drawn.
+
+        alpha places each bullet between its previous and current position (1.0 is the current one).
+        """
+        n = self.count
+        if n == 0:
+            return []
+
+        x, y = self.x[:n], self.y[:n]
+        if alpha != 1.0:
+            previous_x, previous_y = self.previous_x[:n], self.previous_y[:n]
+            x = previous_x + (x - previous_x) * alpha
+            y = previous_y + (y - previous_y) * alpha
+
+        bullet_image = self.views[0].bullet_image
+        blits = []
+        for x, y, angle in zip(x.tolist(), y.tolist(), self.angle[:n].tolist()):
+            rotated_image = transform_cache.get(bullet_image, zoom_level, angle)
+            rect = rotated_image.get_rect(center=(x, y))
+            blits.append((rotated_image, rect.topleft))
+        return surface.blits(blits)
@@ -1,17 +1,26 @@
 import pygame
 import random
 import time
+from scripts.font_registry import font_registry
+from scripts.hud import render_health_bar
+from scripts.animation import animations
+from scripts.trace import tracer
 
 class Character:
-    def __init__(self, start_x, start_y, width=20, height=40, speed=1.2, health=100, accuracy=10, player_stats=None, selected_roles=None):
+    def __init__(self, start_x, start_y, width=20, height=40, speed=1.2, health=100, accuracy=10, player_stats=None, selected_roles=None, clock=None):
+        # Clock for timers (the wall clock when none is given)
+        self.clock = clock
+
         self.x = start_x  # Player's x position
         self.y = start_y  # Player's y position
+        self.previous_x, self.previous_y = start_x, start_y  # Position before the last step, for interpolation
         self.base_width = width  # Store base width for scaling
         self.base_height = height  # Store base height for scaling
         self.speed = speed  # Base speed of movement (upgradable)
         self.max_health = health
         self.current_health = health
-        self.color = (0, 0, 255)  # Character color (blue for now)
+        self.last_shot_at = None  # Time of the last shot, for the attack clip
+        self.died_at = None  # Time health ran out, for the die clip
         self.velocity_x = 0  # Horizontal movement velocity
         self.velocity_y = 0  # Vertical movement velocity
         self.in_house = True  # Start the player inside the house and invisible
@@ -28,10 +37,10 @@ class Character:
 
         # Apply fire rate bonus and recalculate shooting interval
         self.shooting_interval = 1 / (self.fire_rate + self.fire_rate_bonus)
-        self.last_auto_shot_time = time.time()  # For automatic shooting
+        self.last_auto_shot_time = self.now()  # For automatic shooting
 
         # Track time for medic healing and automatic shooting
-        self.last_health_regen_time = time.time()
+        self.last_health_regen_time = self.now()
 
         # Abilities attributes (initial state with no bonuses)
         self.accuracy_bonus = 0.0  # Accuracy bonus for snipers
@@ -43,29 +52,38 @@ class Character:
             
         self.in_house = True  # Start the player inside the house and invisible
         self.is_visible = False  # Player is invisible when inside the house
-        self.house_entry_time = pygame.time.get_ticks() / 1000.0  # Time when the player enters the house
+        self.house_entry_time = self.now()  # Time when the player enters the house
         self.near_house_time = None  # Track the time when the player gets near the house
 
-        print(f"Character initialized with fire rate: {self.fire_rate}, fire rate bonus: {self.fire_rate_bonus}, shooting interval: {self.shooting_interval}")
+        # Font for the health bar label
+        self.label_font = font_registry.get_font(None, 36)
+
+        tracer.info('character', "Character initialized with fire rate: %s, fire rate bonus: %s, shooting interval: %s", self.fire_rate, self.fire_rate_bonus, self.shooting_interval)
+
+    def now(self):
+        """Current time in seconds."""
+        if self.clock is not None:
+            return self.clock.get_ticks() / 1000.0
+        return time.time()
 
     def update_stat(self, stat_name, new_value):
         """Update the character's stat dynamically."""
         if stat_name == "Speed":
             self.speed = new_value
-            print(f"Speed updated to {self.speed}")
+            tracer.info('character', "Speed updated to %s", self.speed)
         elif stat_name == "Accuracy":
             self.accuracy_bonus += new_value
-            print(f"Accuracy updated by {new_value}, total bonus: {self.accuracy_bonus}")
+            tracer.info('character', "Accuracy updated by %s, total bonus: %s", new_value, self.accuracy_bonus)
         elif stat_name == "Health Regen Rate":
             self.health_regen_rate = new_value
-            print(f"Health Regen Rate updated to {self.health_regen_rate}")
+            tracer.info('character', "Health Regen Rate updated to %s", self.health_regen_rate)
         elif stat_name == "Fire Rate":
             self.fire_rate_bonus += new_value
             self.shooting_interval = 1 / (self.fire_rate + self.fire_rate_bonus)  # Recalculate shooting interval
-            print(f"Fire Rate updated: base {self.fire_rate}, bonus applied: {self.fire_rate_bonus}, new interval: {self.shooting_interval}")
+            tracer.info('character', "Fire Rate updated: base %s, bonus applied: %s, new interval: %s", self.fire_rate, self.fire_rate_bonus, self.shooting_interval)
         elif stat_name == "Damage":
             self.damage_bonus += new_value  # Update the damage bonus
-            print(f"Damage updated by {new_value}, total bonus: {self.damage_bonus}")
+            tracer.info('character', "Damage updated by %s, total bonus: %s", new_value, self.damage_bonus)
 
 
 
@@ -91,7 +109,8 @@ class Character:
             move_x /= 1.414  # Divide by sqrt(2) to normalize diagonal speed
             move_y /= 1.414
 
-        # Apply the movement to the character's position
+        # Apply the movement to the character's position (speed is in pixels per simulation step)
+        self.previous_x, self.previous_y = self.x, self.y
         self.x += move_x
         self.y += move_y
 
@@ -102,13 +121,15 @@ class Character:
 
         if self.in_house:
             # Set the entry time when the player enters the house
-            self.house_entry_time = pygame.time.get_ticks() / 1000.0
+            self.house_entry_time = self.now()
 
     def take_damage(self, damage):
         """Reduce the character's health."""
         self.current_health -= damage
-        if self.current_health < 0:
+        if self.current_health <= 0:
             self.current_health = 0  # Prevent health from going negative
+            if self.died_at is None:
+                self.died_at = self.now()
 
     def is_dead(self):
         """Check if the character's health is 0 or below."""
@@ -123,57 +144,62 @@ class Character:
 
     def heal_over_time(self):
         """For Medic: Regenerate health every second if not at max health."""
-        current_time = time.time()
+        current_time = self.now()
         if self.current_health < self.max_health and current_time - self.last_health_regen_time >= 1:
             self.current_health += 1
             if self.current_health > self.max_health:
                 self.current_health = self.max_health
             self.last_health_regen_time = current_time
 
-    def draw(self, surface, zoom_level):
-        """Draw the character on the screen if they are visible with zoom."""
+    def draw(self, surface, zoom_level, alpha=1.0):
+        """Draw the character on the screen if they are visible with zoom; returns the area drawn (or None).
+
+        alpha places the character between its previous and current position (1.0 is the current one).
+        """
         if self.is_visible:
+            x = self.previous_x + (self.x - self.previous_x) * alpha
+            y = self.previous_y + (self.y - self.previous_y) * alpha
+
             # Scale the character based on the zoom level
             scaled_width = int(self.base_width * zoom_level)
             scaled_height = int(self.base_height * zoom_level)
             # Adjust the character's position to account for zooming
-            scaled_x = self.x - (scaled_width - self.base_width) // 2
-            scaled_y = self.y - (scaled_height - self.base_height) // 2
-
-            # Draw the character
-            pygame.draw.rect(surface, self.color, (scaled_x, scaled_y, scaled_width, scaled_height))
+            scaled_x = x - (scaled_width - self.base_width) // 2
+            scaled_y = y - (scaled_height - self.base_height) // 2
+
+            # Die once health runs out, attack just after a shot, walk while moving, otherwise stand
+            now = self.now()
+            animation = animations.get('character')
+            if self.died_at is not None:
+                clip, elapsed = 'die', now - self.died_at
+            elif self.last_shot_at is not None and now - self.last_shot_at < 0.25:
+                clip, elapsed = 'attack', now - self.last_shot_at
+            elif (self.x, self.y) != (self.previous_x, self.previous_y):
+                clip, elapsed = 'walk', now
+            else:
+                clip, elapsed = 'walk', 0
+            sprite, offset_x, offset_y = animation.frame_at(clip, elapsed * 1000, scaled_width, scaled_height)
+            return surface.blit(sprite, (int(scaled_x) + offset_x, int(scaled_y) + offset_y))
             
+    def render_health_bar(self, screen_width):
+        """Return the character's health bar and its label as one surface."""
+        return render_health_bar(screen_width, self.current_health / self.max_health, "Character Health", self.label_font)
+
     def draw_health_bar_bottom(self, surface, screen_width, screen_height):
         """Draw the character's health bar across the bottom of the screen."""
-        bar_height = 30
-        health_bar_width = int((self.current_health / self.max_health) * screen_width)
-        
-        # Create a transparent surface for the health bar
-        bar_surface = pygame.Surface((screen_width, bar_height), pygame.SRCALPHA)
-        bar_surface.fill((255, 0, 0, 150))  # Red with 150 alpha for transparency
-
-        # Foreground (Green) for remaining health
-        health_surface = pygame.Surface((health_bar_width, bar_height), pygame.SRCALPHA)
-        health_surface.fill((0, 255, 0, 150))  # Green with 150 alpha for transparency
-
-        # Draw the health bar background and foreground on the screen
-        surface.blit(bar_surface, (0, screen_height - bar_height))
-        surface.blit(health_surface, (0, screen_height - bar_height))
-
-        # Draw the text label "Character Health" above the health bar
-        font = pygame.font.Font(None, 36)
-        label_surface = font.render("Character Health", True, (255, 255, 255))
-        label_rect = label_surface.get_rect(center=(screen_width // 2, screen_height - bar_height - 20))
-        surface.blit(label_surface, label_rect)
+        bar_surface = self.render_health_bar(screen_width)
+        return surface.blit(bar_surface, (0, screen_height - bar_surface.get_height()))
         
     def shoot(self, mouse_x, mouse_y):
         """Return the information needed to create a bullet with slight randomness."""
         
         # Debugging to ensure `self.base_width` is correct
         if not isinstance(self.base_width, (int, float)):
-            print(f"Error: self.base_width is {type(self.base_width)} instead of int or float!")
+            tracer.error('character', "self.base_width is %s instead of int or float!", type(self.base_width))
             self.base_width = 20  # Safeguard value in case it gets corrupted
 
+        self.last_shot_at = self.now()
+
         # Introduce randomness for shooting inaccuracy
         random_offset_x = random.uniform(-self.accuracy_offset, self.accuracy_offset)
         random_offset_y = random.uniform(-self.accuracy_offset, self.accuracy_offset)
@@ -197,7 +223,7 @@ def auto_shoot(self):
         self.is_shooting = False
 
     if self.is_shooting and current_time - self.last_shot_time >= self.character.shooting_interval:
-        print(f"Shooting with interval: {self.character.shooting_interval}")  # Debugging line to check interval
+        tracer.debug('shooting', "Shooting with interval: %s", self.character.shooting_interval)
         self.shoot_bullet()  # Shoot a bullet
         
         # If Machine Gunner is selected, reduce the time to simulate faster shooting
@@ -205,7 +231,7 @@ def auto_shoot(self):
             # Subtract a small amount of time to speed up shooting (e.g., 0.1 seconds)
             reduced_time = 0.1
             self.last_shot_time = current_time - reduced_time
-            print(f"Machine Gunner active, reducing shot time by {reduced_time} seconds")
+            tracer.debug('shooting', "Machine Gunner active, reducing shot time by %s seconds", reduced_time)
         else:
             # Otherwise, just set the last shot time to current time
             self.last_shot_time = current_time
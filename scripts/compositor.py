@@ -0,0 +1,94 @@
+# compositor.py
+
+import pygame
+
+class Compositor:
+    """Draws the screen as a stack of named layers, bottom to top.
+
+    Each layer has a draw(surface) function. Cached layers are painted once into an
+    off-screen surface and reused until they are invalidated; the cached layers at the
+    bottom of the stack are flattened into a single opaque background, so a frame starts
+    with one blit instead of repainting the static scene. Other layers draw straight onto
+    the screen every frame.
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.layers = []  # (name, draw, cached) in drawing order
+        self.surfaces = {}  # Baked surface of each cached layer (the flattened background is under 'background')
+        self.states = {}  # Last state seen by invalidate_if_changed, keyed by layer name
+
+        # Number of times a cached layer was repainted
+        self.rebuilds = 0
+
+        # FrameProfiler timing each layer while profiling (None when off)
+        self.profiler = None
+
+    def add_layer(self, name, draw, cached=False):
+        """Add a layer on top of the existing ones."""
+        self.layers.append((name, draw, cached))
+        self.invalidate(name)
+
+    def background_layers(self):
+        """Names of the cached layers at the bottom of the stack, which are flattened together."""
+        names = []
+        for name, _, cached in self.layers:
+            if not cached:
+                break
+            names.append(name)
+        return names
+
+    def invalidate(self, name=None):
+        """Repaint a cached layer (or every cached layer) the next time it is composed."""
+        if name is None:
+            self.surfaces.clear()
+            return
+        self.surfaces.pop(name, None)
+        if name in self.background_layers():
+            self.surfaces.pop('background', None)
+
+    def invalidate_if_changed(self, name, state):
+        """Invalidate a layer when the state it was baked from changed; returns True if it was invalidated."""
+        if name in self.states and self.states[name] == state:
+            return False
+        self.states[name] = state
+        self.invalidate(name)
+        return True
+
+    def bake(self, draw):
+        """Paint a layer into a new transparent off-screen surface."""
+        surface = pygame.Surface(self.size, pygame.SRCALPHA)
+        draw(surface)
+        self.rebuilds += 1
+        return surface
+
+    def compose(self, surface):
+        """Draw every layer onto surface."""
+        profiler = self.profiler
+        if profiler is not None:
+            profiler.begin('layer:background')
+        background_layers = self.background_layers()
+        background = self.surfaces.get('background')
+        if background is None and background_layers:
+            background = pygame.Surface(self.size).convert()
+            for name, draw, _ in self.layers[:len(background_layers)]:
+                draw(background)
+                self.rebuilds += 1
+            self.surfaces['background'] = background
+        if background is not None:
+            surface.blit(background, (0, 0))
+        if profiler is not None:
+            profiler.end('layer:background')
+
+        for name, draw, cached in self.layers[len(background_layers):]:
+            if profiler is not None:
+                profiler.begin('layer:' + name)
+            if not cached:
+                draw(surface)
+            else:
+                layer_surface = self.surfaces.get(name)
+                if layer_surface is None:
+                    layer_surface = self.surfaces[name] = self.bake(draw)
+                surface.blit(layer_surface, (0, 0))
+            if profiler is not None:
+                profiler.end('layer:' + name)
@@ -2,12 +2,17 @@
 
 import pygame
 import time
+from scripts.font_registry import font_registry
 
 class DayCounter:
-    def __init__(self, initial_day=1):
+    def __init__(self, initial_day=1, clock=None):
+        # Clock used for the countdown (the wall clock when none is given)
+        self.clock = clock
+        self.current_day = initial_day
+
         # Load PixelifySans-Regular font for both the timer and button
-        self.font = pygame.font.Font('assets/pixelify_font/PixelifySans-Regular.ttf', 30)
-        self.button_font = pygame.font.Font('assets/pixelify_font/PixelifySans-Regular.ttf', 28)  # Same font for button
+        self.font = font_registry.get_font('assets/pixelify_font/PixelifySans-Regular.ttf', 30)
+        self.button_font = font_registry.get_font('assets/pixelify_font/PixelifySans-Regular.ttf', 28)  # Same font for button
         self.button_color = (70, 130, 180)  # Blue for the button
         self.button_hover_color = (100, 149, 237)
         self.button_text_color = (255, 255, 255)
@@ -23,38 +28,53 @@ class DayCounter:
         self.button_rect.centerx = pygame.display.get_surface().get_width() // 2
         self.button_rect.top = 20
 
+    def now(self):
+        """Current time in seconds."""
+        if self.clock is not None:
+            return self.clock.get_ticks() / 1000.0
+        return time.time()
+
     def start_timer(self):
         """Start the countdown timer when the button appears."""
         if not self.timer_start_time:  # Ensure the timer starts only once
-            self.timer_start_time = time.time()
+            self.timer_start_time = self.now()
 
     def update_timer(self):
         """Update the countdown timer."""
         if self.timer_start_time:
-            elapsed_time = time.time() - self.timer_start_time
+            elapsed_time = self.now() - self.timer_start_time
             self.time_left = max(0, self.timer_duration - int(elapsed_time))  # Ensure time doesn't go negative
 
+    def render_day(self):
+        """Return the current day text."""
+        return font_registry.render(self.font, f"Day {self.current_day}", (0, 0, 0))
+
+    def render_button(self):
+        """Return the "Start Next Day" button with its countdown, the size of button_rect."""
+        button = pygame.Surface(self.button_rect.size)
+        button.fill(self.button_color)
+
+        # Draw "Start Next Day" text using the button font
+        button_text = font_registry.render(self.button_font, "Start Next Day", self.button_text_color)
+        button.blit(button_text, (20, 10))
+
+        # Draw the countdown timer using the same font
+        minutes = self.time_left // 60
+        seconds = self.time_left % 60
+        timer_text = f"({minutes}:{seconds:02d})"
+        timer_rendered = font_registry.render(self.button_font, timer_text, self.button_text_color)
+        button.blit(timer_rendered, (50, 40))  # Position below button text
+        return button
+
     def draw(self, surface):
         """Draw the day counter and button with a countdown timer if needed."""
         # Display the current day
-        day_text = self.font.render(f"Day {self.current_day}", True, (0, 0, 0))
-        surface.blit(day_text, (20, 20))
+        surface.blit(self.render_day(), (20, 20))
 
         # Display the "Start Next Day" button if all zombies are killed
         if self.show_next_day_button:
-            pygame.draw.rect(surface, self.button_color, self.button_rect)
-
-            # Draw "Start Next Day" text using the button font
-            button_text = self.button_font.render("Start Next Day", True, self.button_text_color)
-            surface.blit(button_text, (self.button_rect.x + 20, self.button_rect.y + 10))
-
-            # Update and draw the countdown timer using the same font
             self.update_timer()
-            minutes = self.time_left // 60
-            seconds = self.time_left % 60
-            timer_text = f"({minutes}:{seconds:02d})"
-            timer_rendered = self.button_font.render(timer_text, True, self.button_text_color)
-            surface.blit(timer_rendered, (self.button_rect.x + 50, self.button_rect.y + 40))  # Position below button text
+            surface.blit(self.render_button(), self.button_rect)
 
     def advance_day(self):
         """Increase the day counter and hide the button."""
@@ -66,7 +86,7 @@ class DayCounter:
     def check_button_click(self, event):
         """Check if the next day button is clicked."""
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            mouse_pos = pygame.mouse.get_pos()
+            mouse_pos = event.pos
             if self.show_next_day_button and self.button_rect.collidepoint(mouse_pos):
                 return True
         return False
@@ -1,34 +1,41 @@
 import pygame
 import random
+from scripts.asset_registry import asset_registry
+from scripts.trace import tracer
 
 class Drop:
+    __slots__ = ('screen_width', 'screen_height', 'type_of_drop', 'width', 'height', 'image', 'x', 'y')
+
     def __init__(self, screen_width, screen_height, type_of_drop):
+        self.reset(screen_width, screen_height, type_of_drop)
+
+    def reset(self, screen_width, screen_height, type_of_drop):
+        """(Re)initialize the drop so a pooled instance can be reused."""
         self.screen_width = screen_width
         self.screen_height = screen_height
         self.type_of_drop = type_of_drop
 
-        # Load images for different types of drops
+        # Set the default width and height for all drops (adjust as needed)
+        self.width, self.height = 30, 30
+
+        # Shared images for different types of drops
         if self.type_of_drop == 'ammo':
-            self.image = pygame.image.load('assets/AmmoCrateIMG.png').convert_alpha()
+            self.image = asset_registry.get_image('assets/AmmoCrateIMG.png', (self.width, self.height), scene="game")
         elif self.type_of_drop == 'food':
-            self.image = pygame.image.load('assets/FoodBagIMG.png').convert_alpha()
+            self.image = asset_registry.get_image('assets/FoodBagIMG.png', (self.width, self.height), scene="game")
         elif self.type_of_drop == 'scrap':
-            self.image = pygame.image.load('assets/scrapIMG.png').convert_alpha()
+            self.image = asset_registry.get_image('assets/scrapIMG.png', (self.width, self.height), scene="game")
         elif self.type_of_drop == 'rare_speed':
-            self.image = pygame.Surface((30, 30))
+            self.image = pygame.Surface((self.width, self.height))
             self.image.fill((255, 255, 0))  # Yellow box for rare speed drop
 
-        # Set the default width and height for all drops (adjust as needed)
-        self.width, self.height = 30, 30
-        self.image = pygame.transform.scale(self.image, (self.width, self.height))
-
         # Randomly place the drop on the map
         self.x = random.randint(0, self.screen_width - self.width)
         self.y = random.randint(0, self.screen_height - self.height)
 
     def draw(self, surface):
-        """Draw the drop on the screen."""
-        surface.blit(self.image, (self.x, self.y))
+        """Draw the drop on the screen and return the area it covers."""
+        return surface.blit(self.image, (self.x, self.y))
 
     def check_collection(self, character):
         """Check if the character collides with the drop."""
@@ -41,6 +48,6 @@ class Drop:
         if self.type_of_drop == 'rare_speed':
             if random.random() < 1:  # 50% chance to increase speed
                 character.increase_speed()
-                print("Speed increased!")
+                tracer.info('drops', "Speed increased!")
             else:
-                print("No speed increase this time.")
+                tracer.info('drops', "No speed increase this time.")
@@ -0,0 +1,66 @@
+# font_registry.py
+
+import pygame
+from collections import OrderedDict
+
+class FontRegistry:
+    def __init__(self, cache_size=512):
+        # Loaded fonts keyed by (file, size); file may be None for pygame's default font
+        self.fonts = {}
+
+        # Rendered text surfaces keyed by (font, text, color, antialias), oldest first
+        self.text_cache = OrderedDict()
+        self.cache_size = cache_size
+
+        # Cache statistics
+        self.hits = 0
+        self.misses = 0
+
+    def get_font(self, path, size):
+        """Return a shared font for the given file and size, loading it only once."""
+        key = (path, size)
+        font = self.fonts.get(key)
+        if font is None:
+            font = pygame.font.Font(path, size)
+            self.fonts[key] = font
+        return font
+
+    def render(self, font, text, color, antialias=True):
+        """Return a cached text surface, rendering it only when it is not in the cache.
+
+        The returned surface is shared, so callers must copy it before changing it.
+        """
+        key = (font, text, tuple(color), antialias)
+        surface = self.text_cache.get(key)
+
+        if surface is not None:
+            self.hits += 1
+            self.text_cache.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self.text_cache[key] = surface
+
+        # Evict the least recently used surfaces
+        while len(self.text_cache) > self.cache_size:
+            self.text_cache.popitem(last=False)
+        return surface
+
+    def set_cache_size(self, cache_size):
+        """Change the maximum number of cached text surfaces."""
+        self.cache_size = max(0, cache_size)
+        while len(self.text_cache) > self.cache_size:
+            self.text_cache.popitem(last=False)
+
+    def clear(self):
+        """Drop every cached text surface (fonts stay loaded)."""
+        self.text_cache.clear()
+
+    def stats(self):
+        """Return cache statistics."""
+        return {'hits': self.hits, 'misses': self.misses, 'cached': len(self.text_cache), 'fonts': len(self.fonts)}
+
+
+# Shared registry used by every HUD and menu element
+font_registry = FontRegistry()
@@ -0,0 +1,72 @@
+# frame_presenter.py
+
+import pygame
+
+class FramePresenter:
+    """Collects the screen areas that changed during a frame and shows them with one display update.
+
+    Every area marked in a frame is also updated in the next one, so whatever moved away
+    from it gets erased on screen too. When the dirty area is large (or a full redraw was
+    requested) the whole screen is flipped instead.
+    """
+
+    def __init__(self, full_update_ratio=0.4, max_rects=256):
+        self.full_update_ratio = full_update_ratio  # Dirty fraction of the screen above which the whole screen is flipped
+        self.max_rects = max_rects  # More rectangles than this are flipped as well
+        self.dirty = []
+        self.previous_dirty = []
+        self.full_update = True  # The first frame shows the whole screen
+        self.states = {}  # Last drawn state of each HUD element, keyed by name
+
+        # Presentation statistics
+        self.frames = 0
+        self.full_updates = 0
+        self.updated_area = 0
+
+    def mark(self, rect):
+        """Mark an area of the screen as changed (None is ignored)."""
+        if rect is not None:
+            self.dirty.append(pygame.Rect(rect))
+
+    def mark_many(self, rects):
+        """Mark several areas as changed."""
+        self.dirty.extend(pygame.Rect(rect) for rect in rects)
+
+    def mark_full(self):
+        """Show the whole screen this frame."""
+        self.full_update = True
+
+    def mark_if_changed(self, key, rect, state):
+        """Mark an area only if its element's state differs from the last frame it was drawn in."""
+        if self.states.get(key, self) != state:
+            self.states[key] = state
+            self.mark(rect)
+
+    def present(self):
+        """Show this frame's changes with exactly one display update; returns the number of rectangles (0 for a flip)."""
+        screen = pygame.display.get_surface()
+        screen_rect = screen.get_rect()
+        rects = [rect.clip(screen_rect) for rect in self.previous_dirty + self.dirty]
+        rects = [rect for rect in rects if rect.width and rect.height]
+        dirty_area = sum(rect.width * rect.height for rect in rects)
+
+        self.frames += 1
+        self.previous_dirty = self.dirty
+        self.dirty = []
+
+        if (self.full_update or len(rects) > self.max_rects or
+                dirty_area > screen_rect.width * screen_rect.height * self.full_update_ratio):
+            self.full_update = False
+            self.full_updates += 1
+            self.updated_area += screen_rect.width * screen_rect.height
+            pygame.display.flip()
+            return 0
+
+        if rects:
+            self.updated_area += dirty_area
+            pygame.display.update(rects)
+        return len(rects)
+
+    def stats(self):
+        """Return presentation statistics."""
+        return {'frames': self.frames, 'full_updates': self.full_updates, 'updated_area': self.updated_area}
@@ -0,0 +1,173 @@
+# frame_profiler.py
+
+import time
+import pygame
+from collections import deque
+from scripts.font_registry import font_registry
+
+class FrameProfiler:
+    """Per-frame timings of the game's subsystems, with rolling percentiles and a frame-time histogram.
+
+    Methods are timed by wrapping them on their instance while the profiler is enabled
+    (see enable), and other code reports its own scopes with begin/end. When disabled,
+    the wrappers are removed so the game runs its normal methods without any overhead.
+    """
+
+    def __init__(self, window=300, bin_ms=2, bins=16):
+        self.enabled = False
+        self.window = window  # Number of recent frames kept for percentiles and the histogram
+        self.bin_ms = bin_ms  # Width of a histogram bin in milliseconds
+        self.bins = bins  # Number of bins, the last one also counts slower frames
+
+        self.frame_times = deque(maxlen=window)  # Milliseconds between the ends of consecutive frames
+        self.history = {}  # Scope name -> deque of milliseconds spent in it per frame
+        self.current = {}  # Scope name -> seconds spent in it so far this frame
+        self.starts = {}  # Scope name -> start time of the running scope
+        self.wrapped = []  # (object, method name) pairs wrapped by enable
+        self.last_frame_end = None
+
+        # Overlay surface, refreshed every overlay_interval frames
+        self.overlay = None
+        self.overlay_interval = 15
+        self.frames_since_overlay = 0
+
+    def begin(self, scope):
+        """Start timing a scope."""
+        self.starts[scope] = time.perf_counter()
+
+    def end(self, scope):
+        """Stop timing a scope and add its time to this frame.
+
+        A scope still running when the profiler was disabled (F3 is handled inside the timed
+        handle_events) is dropped.
+        """
+        start = self.starts.pop(scope, None)
+        if start is None:
+            return
+        elapsed = time.perf_counter() - start
+        self.current[scope] = self.current.get(scope, 0.0) + elapsed
+
+    def wrap(self, obj, method_name, scope=None):
+        """Time every call of obj.method_name under scope (the method name by default)."""
+        method = getattr(obj, method_name)
+        scope = scope or method_name
+
+        def timed(*args, **kwargs):
+            self.begin(scope)
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self.end(scope)
+
+        setattr(obj, method_name, timed)
+        self.wrapped.append((obj, method_name))
+
+    def enable(self, obj, method_names):
+        """Start profiling, timing the given methods of obj."""
+        if self.enabled:
+            return
+        self.enabled = True
+        for method_name in method_names:
+            self.wrap(obj, method_name)
+        self.last_frame_end = None
+        self.overlay = None
+
+    def disable(self):
+        """Stop profiling and remove every wrapper (the collected timings are kept)."""
+        self.enabled = False
+        for obj, method_name in reversed(self.wrapped):
+            delattr(obj, method_name)
+        self.wrapped = []
+        self.current.clear()
+        self.starts.clear()
+
+    def end_frame(self):
+        """Record the finished frame."""
+        now = time.perf_counter()
+        if self.last_frame_end is not None:
+            self.frame_times.append((now - self.last_frame_end) * 1000)
+            for scope in self.current.keys() - self.history.keys():
+                self.history[scope] = deque(maxlen=self.window)
+            for scope, times in self.history.items():
+                times.append(self.current.get(scope, 0.0) * 1000)
+        self.current.clear()
+        self.last_frame_end = now
+        self.frames_since_overlay += 1
+
+    @staticmethod
+    def percentiles(values, points=(50, 95, 99)):
+        """Return the nearest-rank percentiles of values (zeros when empty)."""
+        if not values:
+            return tuple(0.0 for _ in points)
+        ordered = sorted(values)
+        return tuple(ordered[min(len(ordered) - 1, max(0, int(round(point / 100 * len(ordered))) - 1))] for point in points)
+
+    def summary(self):
+        """Return (p50, p95, p99) milliseconds for the whole frame and for each scope."""
+        summary = {'frame': self.percentiles(self.frame_times)}
+        for scope, times in self.history.items():
+            summary[scope] = self.percentiles(times)
+        return summary
+
+    def histogram(self):
+        """Return the number of recent frames in each bin_ms wide bin of frame time."""
+        counts = [0] * self.bins
+        for frame_time in self.frame_times:
+            counts[min(self.bins - 1, int(frame_time // self.bin_ms))] += 1
+        return counts
+
+    def export_csv(self, path='frame_timings.csv'):
+        """Write the recent frames (frame time and every scope, in milliseconds) to a CSV file."""
+        scopes = sorted(self.history)
+        frame_times = list(self.frame_times)
+        with open(path, 'w') as csv_file:
+            csv_file.write(",".join(['frame', 'frame_ms'] + scopes) + "\n")
+            for index, frame_time in enumerate(frame_times):
+                row = [str(index), f"{frame_time:.3f}"]
+                for scope in scopes:
+                    times = self.history[scope]
+                    # Scopes first seen late have fewer samples; line them up with the newest frames
+                    offset = len(times) - len(frame_times)
+                    row.append(f"{times[index + offset]:.3f}" if 0 <= index + offset < len(times) else "")
+                csv_file.write(",".join(row) + "\n")
+        return path
+
+    def render_overlay(self, font):
+        """Return the overlay surface: percentiles per scope and the frame-time histogram."""
+        if self.overlay is not None and self.frames_since_overlay < self.overlay_interval:
+            return self.overlay
+        self.frames_since_overlay = 0
+
+        line_height = font.get_linesize()
+        lines = [('ms', 'p50', 'p95', 'p99')]
+        for scope, (p50, p95, p99) in self.summary().items():
+            lines.append((scope, f"{p50:.2f}", f"{p95:.2f}", f"{p99:.2f}"))
+
+        counts = self.histogram()
+        histogram_height = 60
+        width = 420
+        height = line_height * (len(lines) + 1) + histogram_height + 20
+        overlay = pygame.Surface((width, height), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 190))
+
+        for i, columns in enumerate(lines):
+            # Scope name, then the percentiles right-aligned in 70 px columns
+            y = 5 + i * line_height
+            overlay.blit(font_registry.render(font, columns[0], (255, 255, 255)), (10, y))
+            for j, text in enumerate(columns[1:]):
+                text_surface = font_registry.render(font, text, (255, 255, 255))
+                overlay.blit(text_surface, text_surface.get_rect(topright=(width - 10 - (2 - j) * 70, y)))
+
+        # Frame-time histogram, one bar per bin (the last bin includes slower frames)
+        top = 5 + len(lines) * line_height + 5
+        overlay.blit(font_registry.render(font, f"frame time, {self.bin_ms} ms bins", (200, 200, 200)), (10, top))
+        bottom = top + line_height + histogram_height
+        bar_width = (width - 20) // self.bins
+        most = max(counts) or 1
+        for i, count in enumerate(counts):
+            bar_height = int(count / most * histogram_height)
+            color = (0, 200, 0) if (i + 1) * self.bin_ms <= 1000 / 60 else (220, 60, 60)  # Red past a 60 FPS frame
+            pygame.draw.rect(overlay, color, (10 + i * bar_width, bottom - bar_height, bar_width - 2, bar_height))
+
+        self.overlay = overlay
+        return overlay
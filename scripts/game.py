@@ -1,48 +1,135 @@
 # game.py
 
+import math
+import os
 import pygame
 import sys
 import random
+from collections import deque
 from scripts.house import House
 from scripts.settings import Settings
-from scripts.bullet import Bullet
-from scripts.zombie import Zombie
+from scripts.bullet_pool import BulletPool
+from scripts.zombie import Zombie, SPAWN_EDGES, DEFAULT_STATS
+from scripts.zombie_horde import ZombieHorde
 from scripts.day_counter import DayCounter
 from scripts.money_counter import MoneyCounter
-from scripts.main_menu import MainMenu
 from scripts.character import Character
-from scripts.startup_selections import IntroStep, FamilySelectionStep, TeamSelectionStep
 from scripts.drop import Drop
+from scripts.obstacle import Obstacle
+from scripts.navigation import FlowField
+from scripts.wave_scheduler import WaveScheduler, ARCHETYPES
 from scripts.materials_counter import MaterialsCounter
 from scripts.shop import Shop
 from scripts.stat_window import StatWindow
+from scripts.asset_registry import asset_registry
+from scripts.asset_loader import asset_loader
+from scripts.atlas import Atlas
+from scripts.font_registry import font_registry
+from scripts.spatial_hash import SpatialHash
+from scripts.object_pool import ObjectPool
+from scripts.trace import tracer, DEBUG
+from scripts.game_clock import GameClock, SimulatedClock, ReplayClock
+from scripts.game_input import LiveInput, ScriptedInput
+from scripts.input_recording import InputRecorder, InputReplayer
+from scripts.frame_presenter import FramePresenter
+from scripts.compositor import Compositor
+from scripts.hud import Hud
+from scripts.frame_profiler import FrameProfiler
+from scripts.scene_stack import SceneStack
+from scripts.scenes import SCENES
+from scripts.animation import animations
 
 WHITE = (255, 255, 255)
 
 class Game:
-    def __init__(self):
+    # Methods timed while the frame profiler is on
+    PROFILED_METHODS = ('handle_events', 'update_game', 'update_bullets', 'update_zombies',
+                        'check_for_drop_collection', 'render_game')
+
+    # Obstacles around the house: kind and top-left corner as fractions of the screen size
+    OBSTACLE_LAYOUT = (('rubble', 0.465, 0.17), ('rubble', 0.465, 0.72),
+                       ('barrel', 0.3, 0.45), ('barrel', 0.67, 0.45),
+                       ('barrel', 0.25, 0.25), ('barrel', 0.72, 0.75))
+
+    # Images decoded in the background at startup (unless the atlas has them): the menus',
+    # gameplay's, and the large sprite sheets, which stream in behind the menus
+    MENU_IMAGES = ('assets/grass.png',)
+    GAME_IMAGES = ('assets/starterhouseIMG.png', 'assets/ShoppingIMG.png', 'assets/settingsIMG.png',
+                   'assets/5.56Ammo.png', 'assets/AmmoCrateIMG.png', 'assets/FoodBagIMG.png',
+                   'assets/scrapIMG.png', 'assets/Barrel1IMG.png', 'assets/rubbleIMG.png')
+    SHEET_IMAGES = ('assets/CharacterAssets.png', 'assets/ZombiesAssets.png')
+
+    CORPSE_MS = 1500  # How long a dead zombie stays on the ground, playing its die clip
+
+    def __init__(self, brute_force_collisions=False, headless=False, step_ms=1000 / 60,
+                 seed=None, record_path=None, replay_path=None, realtime=True):
+        # Headless games use SDL's dummy drivers, simulated time and scripted input, and never render
+        self.headless = headless
+        self.step_ms = step_ms
+
+        # Replays and recordings: a replay brings its own seed, step length and input
+        self.replayer = InputReplayer(replay_path) if replay_path else None
+        self.record_path = record_path
+        self.realtime = realtime
+        if self.replayer:
+            seed = self.replayer.seed
+            self.step_ms = self.replayer.step_ms
+
+        # Every random number comes from the global random module, so one seed makes a run repeatable
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        random.seed(self.seed)
+        if headless:
+            os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+            os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
         pygame.init()
+        # Pre-scaled images from the offline atlas (python -m scripts.atlas), if it has been built
+        if asset_registry.atlas is None:
+            asset_registry.atlas = Atlas.open()
+        tracer.install_crash_handler()  # Write the trace buffer to trace.log if the game crashes
+        self.brute_force_collisions = brute_force_collisions  # Scan every drop instead of the drop grid (for verification)
         self.initialize_game_elements()
 
     def initialize_game_elements(self):
         self.screen = pygame.display.set_mode((1280, 720))  # Windowed mode for testing
         self.SCREEN_WIDTH, self.SCREEN_HEIGHT = pygame.display.get_surface().get_size()
         pygame.display.set_caption("Fortress of the Undead")
-        self.clock = pygame.time.Clock()
+        # One clock for every subsystem: the simulation runs in fixed steps of step_ms game time
+        if self.replayer:
+            self.clock = ReplayClock(self.replayer, self.realtime)
+            self.input = self.replayer
+        elif self.headless:
+            self.clock = SimulatedClock(self.step_ms)
+            self.input = ScriptedInput()
+        else:
+            self.clock = GameClock(self.step_ms)
+            self.input = LiveInput()
+
+        # Record what the game reads from its input, to replay the run later
+        self.recorder = None
+        if self.record_path:
+            self.recorder = self.input = InputRecorder(self.input, self.record_path, self.seed, self.step_ms)
+
+        # Shows only the changed parts of the screen, with one display update per frame
+        self.presenter = FramePresenter()
+
+        # Frame timings per subsystem, shown with F3 (nothing is timed while it is off)
+        self.profiler = FrameProfiler()
+        self.profiler_font = font_registry.get_font(None, 22)
+
+        # Gameplay is drawn in layers; the ground and the house are cached until they change
+        self.compositor = Compositor((self.SCREEN_WIDTH, self.SCREEN_HEIGHT))
+        self.compositor.add_layer('ground', self.draw_tiled_background, cached=True)
+        self.compositor.add_layer('structures', self.draw_structures, cached=True)
+        self.compositor.add_layer('entities', self.draw_entities)
+        self.compositor.add_layer('hud', self.draw_hud)
+        self.compositor.add_layer('modal', self.draw_modals)
+        self.house_rect = None
 
         # Load the PixelifySans font
-        self.font = pygame.font.Font('assets/pixelify_font/PixelifySans-Regular.ttf', 36)  # Default size 36
-
-        # Load grass image for tiling
-        self.grass_image = pygame.image.load('assets/grass.png').convert()
-        self.grass_image = pygame.transform.scale(self.grass_image, (64, 64))  # Resize to 64x64 tiles, adjust as necessary
+        self.font = font_registry.get_font('assets/pixelify_font/PixelifySans-Regular.ttf', 36)  # Default size 36
 
-        # Game elements
-        self.house = House()
-        self.settings = Settings(self.screen)
-        self.day_counter = DayCounter()
-        self.money_counter = MoneyCounter()
-        self.materials_counter = MaterialsCounter()
+        self.tiled_background = None  # Grass tiled across the screen, built on first use
 
         # Create the stat window for displaying player stats
         self.player_stats = {
@@ -57,66 +144,149 @@ class Game:
         # Initialize the stat window before the shop
         self.stat_window = StatWindow(self.screen, self.player_stats)
 
-        # Other game element initialization...
-        self.team_selection_step = TeamSelectionStep(self.SCREEN_WIDTH, self.SCREEN_HEIGHT, self.stat_window)
+        # Team roles, taken from the team selection step when gameplay starts
+        self.selected_roles = []
 
         # Placeholder for character initialization, it will be initialized after team selection
         self.character = None
 
+        # Outside headless runs, recordings and replays, images the atlas does not provide are
+        # decoded on a worker thread behind a progress screen; the menus appear once theirs are
+        # ready and the game world is built once gameplay's are
+        atlas = asset_registry.atlas
+        self.menu_images, self.game_images, self.pending_sheets = (
+            tuple(path for path in paths if not (atlas and atlas.provides(path)))
+            for paths in (self.MENU_IMAGES, self.GAME_IMAGES, self.SHEET_IMAGES))
+        self.pending_sheets = list(self.pending_sheets)
+        self.world_ready = False
+        self.loader = None
+        background = self.menu_images + self.game_images + tuple(self.pending_sheets)
+        if background and not (self.headless or self.replayer or self.record_path):
+            self.loader = asset_registry.loader = asset_loader
+            self.loader.request(background)
+        else:
+            self.build_world()
+
+        # Game steps, from the main menu to gameplay: each is built when it is reached and
+        # dropped when the next one takes over, and only the top one receives events
+        self.scenes = SceneStack(self, SCENES, base_events=(pygame.QUIT, pygame.VIDEOEXPOSE))
+        self.scenes.push('loading' if self.loader else 'main_menu')
+
+    def build_world(self):
+        """Create the house, the counters, the shop, the entity pools and everything else gameplay needs."""
+        # Game elements
+        self.house = House(clock=self.clock)
+        self.settings = Settings(self.screen)
+        self.day_counter = DayCounter(clock=self.clock)
+        self.money_counter = MoneyCounter()
+        self.materials_counter = MaterialsCounter()
+
         self.player_speed = 0.0  # Initialize player speed
         self.previous_position = (0, 0)  # Track the previous position of the player
         self.speed_history = []  # List to store recent speed values
         self.speed_history_size = 10  # Number of frames to average over
         self.damage_done_in_last_second = 0  # Track total damage done per second
-        self.dps_timer = pygame.time.get_ticks() / 1000.0  # Start timer for DPS calculation
+        self.dps_timer = self.clock.get_ticks() / 1000.0  # Start timer for DPS calculation
 
         self.shots_fired = 0
-        self.sps_timer = pygame.time.get_ticks() / 1000.0  # Timer for SPS calculation
+        self.sps_timer = self.clock.get_ticks() / 1000.0  # Timer for SPS calculation
 
         self.shots_in_last_interval = 0  # Track how many shots fired in the last 0.5 seconds
         self.sps = 0  # Shots per second
+        self.dps = 0  # Damage per second
+        self.kills = 0  # Zombies killed this game
 
         # Initialize the shop after creating the stat window
         self.shop = Shop(self.SCREEN_WIDTH, self.SCREEN_HEIGHT, self.house, self.materials_counter, self.stat_window, self.money_counter)
 
-        self.main_menu = MainMenu(self.SCREEN_WIDTH, self.SCREEN_HEIGHT)
-
-        # Game steps
-        self.intro_step = IntroStep(self.SCREEN_WIDTH, self.SCREEN_HEIGHT)
-        self.family_selection_step = FamilySelectionStep(self.SCREEN_WIDTH, self.SCREEN_HEIGHT)
-        self.team_selection_step = TeamSelectionStep(self.SCREEN_WIDTH, self.SCREEN_HEIGHT, self.stat_window)
-
         # Game state variables
-        self.bullets = []
-        self.zombies = []
+        self.bullets = BulletPool(capacity=1024)  # Bullet state in NumPy arrays, culled once they leave the screen
+        self.zombies = ZombieHorde()  # Zombie state in NumPy arrays, used like a list of zombies
+        self.corpses = deque(maxlen=256)  # (archetype, x, y, width, height, time of death) of recent kills
         self.drops = []
+        self.shot_traces = []  # Hitscan shots on screen: (start, end, game time they fade at)
+
+        # Reusable zombie template and drops, so waves do not allocate new objects
+        self.zombie_pool = ObjectPool(Zombie)
+        self.drop_pool = ObjectPool(Drop)
+
+        # Zombie keyword arguments (width, height, health, speed) for new zombies, tuned by balance sweeps
+        self.zombie_stats = {}
+
+        # Each day's zombies are built during the countdown before it and released over the day
+        self.waves = WaveScheduler(self.build_zombie, self.release_zombie)
+
+        # Zombies walk to the house along a flow field that routes them around the obstacles
+        spawn_buffer = 120  # Covers the off-screen spawn area
+        self.flow_field = FlowField(-spawn_buffer, -spawn_buffer,
+                                    self.SCREEN_WIDTH + 2 * spawn_buffer, self.SCREEN_HEIGHT + 2 * spawn_buffer)
+        self.flow_field.set_goal(self.SCREEN_WIDTH // 2, self.SCREEN_HEIGHT // 2)
+        self.zombies.flow_field = self.flow_field
+        self.obstacles = []
+        self.set_obstacles([Obstacle(kind, int(x * self.SCREEN_WIDTH), int(y * self.SCREEN_HEIGHT))
+                            for kind, x, y in self.OBSTACLE_LAYOUT])
+
+        # Spatial hash for drop collection (zombies answer their own proximity queries)
+        self.drop_grid = SpatialHash(cell_size=64, brute_force=self.brute_force_collisions)
         self.zoom_level = 1.0
-        self.current_step = "main_menu"
         self.last_drop_spawn_time = 0
         self.drop_spawn_interval = 5000
         self.spawn_drops(5)
 
+        # HUD widgets, re-rendered only when the value they show changes
+        self.hud = Hud(self.presenter)
+        self.hud.add('day', (20, 20), lambda: self.day_counter.current_day,
+                     lambda day: self.day_counter.render_day())
+        self.hud.add('next_day_button', self.day_counter.button_rect.topleft,
+                     lambda: (self.day_counter.show_next_day_button, self.day_counter.time_left),
+                     lambda value: self.day_counter.render_button() if value[0] else None)
+        self.hud.add('money', (20, 60), lambda: self.money_counter.money,
+                     lambda money: self.money_counter.render())
+        self.hud.add('health_bar', (0, self.SCREEN_HEIGHT), self.health_bar_value,
+                     self.render_health_bar, align='bottomleft')
+        self.hud.add('materials', (20, 100), self.materials_value,
+                     lambda value: self.materials_counter.render(*value[3:]))
+        self.hud.add('time_scale', (self.SCREEN_WIDTH - 20, 110),
+                     lambda: (self.clock.paused, self.clock.time_scale), self.render_time_scale, align='topright')
+
         # Automatic shooting variables
         self.shooting_interval = 1 / 3  # 3 bullets per second
         self.last_shot_time = 0  # Track the time of the last shot
         self.is_shooting = False  # Track if the player is holding Mouse1 (left-click)
 
+        self.world_ready = True
+
+    @property
+    def current_step(self):
+        """Name of the scene on top of the scene stack."""
+        return self.scenes.top_name
+
+    @property
+    def team_selection_step(self):
+        """The team selection step (built if needed, e.g. to pick the team without the menus)."""
+        return self.scenes.load('team_selection').step
+
     def start_game_after_team_selection(self):
         """Initialize the game with the selected roles."""
-        selected_roles = self.team_selection_step.selected_roles  # Get the selected roles
-        print(f"Selected roles: {selected_roles}")  # Debugging line to ensure roles are selected
+        # Gameplay can start before the background loader is done, the rest is loaded now
+        if not self.world_ready:
+            self.build_world()
+
+        selected_roles = self.selected_roles = list(self.team_selection_step.selected_roles)  # Get the selected roles
+        tracer.info('game', "Selected roles: %s", selected_roles)
 
         # Pass selected roles to the Character class
         self.character = Character(
             self.SCREEN_WIDTH // 2,
             self.SCREEN_HEIGHT // 2,
             player_stats=self.player_stats,
-            selected_roles=selected_roles  # Pass selected roles to the character
+            selected_roles=selected_roles,  # Pass selected roles to the character
+            clock=self.clock
         )
 
-        self.spawn_zombies(5)
         self.day_counter.current_day = 1
-        self.current_step = "game"
+        self.waves.start(1, self.clock.get_ticks())
+        self.scenes.switch_to('game')
     
     def apply_stat_boost(self, stat_name, boost_value):
         """Apply a boost to the given stat and update its total."""
@@ -137,87 +307,94 @@ class Game:
                 self.house.building_regen_rate = self.player_stats['Building Regen Rate'][2]  # Update building regen rate
                 
     def run(self):
-        while True:
+        """Run the game until the window is closed, or until the replay ends; returns the game summary."""
+        while not (self.replayer and self.replayer.finished):
+            if self.loader:
+                self.update_loading()
             self.handle_events()
-            self.update_game()
-            self.render_game()
+            # Bank the frame's time, then run as many fixed simulation steps as it covers
             self.clock.tick(60)
+            for _ in self.clock.steps():
+                self.update_game()
+            if self.recorder:
+                self.recorder.end_frame(self.clock.frame_steps)
+            self.render_game()
+            if self.profiler.enabled:
+                self.profiler.end_frame()
+        return self.get_summary()
+
+    def run_headless(self, max_days=None, max_ticks=None, script=None, roles=("Sniper", "Machine Gunner")):
+        """Simulate the game without rendering, one fixed step per tick, and return a summary.
+
+        script(game, tick) is called before every tick to drive game.input. The run stops after
+        max_days days, after max_ticks ticks, or when the house is destroyed.
+        """
+        if self.recorder or self.replayer:
+            raise ValueError("Headless runs cannot record or replay input")
+
+        # Skip the menus and start with the given team
+        if self.character is None:
+            self.team_selection_step.selected_roles = list(roles)
+            self.team_selection_step.apply_team_boosts(self.team_selection_step.selected_roles)
+            self.start_game_after_team_selection()
+
+        tick = 0
+        while max_ticks is None or tick < max_ticks:
+            if max_days is not None and self.day_counter.current_day > max_days:
+                break
+            if self.house.is_destroyed():
+                break
+
+            if script:
+                script(self, tick)
+            self.handle_events()
+            self.clock.tick()
+            for _ in self.clock.steps():
+                self.update_game()
+            tick += 1
+
+        return self.get_summary(tick)
+
+    def update_loading(self):
+        """Follow the background loader: show the main menu once its images are decoded, build
+        the world once gameplay's are, then convert the sprite sheets, one per frame."""
+        loader = self.loader
+        if self.current_step == 'loading' and loader.is_ready(self.menu_images):
+            self.scenes.switch_to('main_menu')
+        if not self.world_ready:
+            if loader.is_ready(self.game_images):
+                self.build_world()
+        elif self.pending_sheets:
+            if loader.is_ready(self.pending_sheets[:1]):
+                asset_registry.get_image(self.pending_sheets.pop(0), scene="game")
+        else:
+            # Everything is converted: later images are loaded on demand, as before
+            loader.release()
+            self.loader = asset_registry.loader = None
+
+    def get_summary(self, ticks=0):
+        """Return the outcome of the current game."""
+        return {
+            'seed': self.seed,
+            'days': self.day_counter.current_day,
+            'ticks': ticks,
+            'game_seconds': self.clock.get_ticks() / 1000.0,
+            'house_health': self.house.health,
+            'character_health': self.character.current_health if self.character else 0,
+            'money': self.money_counter.money,
+            'kills': self.kills,
+        }
 
     # -------- Event Handling --------
     def handle_events(self):
-        for event in pygame.event.get():
+        for event in self.input.get_events():
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
-
-            # Always check for the shop button click first
-            self.shop.handle_shop_button_click(event)
-
-            # Then handle other events based on the current step
-            self.handle_event_by_step(event)
-
-    
-    def handle_game_events(self, event):
-        # Check for the shop button click first to allow opening/closing the shop
-        self.shop.handle_shop_button_click(event)
-
-        # If the shop is open, handle only shop interactions
-        if self.shop.is_shop_open():
-            self.shop.handle_events(event)
-        else:
-            # Only handle game actions when the shop is not open
-            self.handle_in_game_actions(event)
-            self.settings.handle_events(event)
-            self.check_day_progression(event)
-            
-    def handle_event_by_step(self, event):
-        # Handle shop open state first
-        if self.shop.is_shop_open():
-            # If the shop is open, only handle shop interactions
-            self.shop.handle_events(event)
-        else:
-            # If the shop is not open, handle other game events
-            if self.current_step == "main_menu":
-                self.handle_main_menu_events(event)
-            elif self.current_step == "intro":
-                self.handle_intro_events(event)
-            elif self.current_step == "family_selection":
-                self.handle_family_selection_events(event)
-            elif self.current_step == "team_selection":
-                self.handle_team_selection_events(event)
-            elif self.current_step == "game":
-                self.handle_game_events(event)
-
-    def handle_main_menu_events(self, event):
-        """Handle events in the main menu, like button clicks."""
-        self.main_menu.handle_events(event)  # Process events in the main menu
-        
-        # Check if the game has started by clicking "Start"
-        if self.main_menu.is_game_started():
-            print("Transitioning to Intro")
-            self.current_step = "intro"  # Transition to the intro phase
-
-    def handle_intro_events(self, event):
-        # Check if the "Continue" button in the intro step was clicked or if the user presses Enter/Space
-        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            print("Continue button clicked in Intro Step.")  # Debugging line
-            self.current_step = "family_selection"  # Move to the next phase
-        elif event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
-            print("Enter key pressed in Intro Step.")  # Debugging line
-            self.current_step = "family_selection"
-
-    def handle_family_selection_events(self, event):
-        # Check if a family has been selected and transition to team selection
-        if self.family_selection_step.handle_events(event) == "team_selection":
-            print("Transitioning to Team Selection")  # Debugging line
-            self.current_step = "team_selection"
-
-    def handle_team_selection_events(self, event):
-        """Handle the transition from team selection to game start."""
-        if self.team_selection_step.handle_events(event) == "game_start":
-            print("Transitioning to the Game")
-            self.team_selection_step.apply_team_boosts(self.team_selection_step.selected_roles)  # Apply boosts
-            self.start_game_after_team_selection()  # Initialize the character with selected roles
+            elif event.type == pygame.VIDEOEXPOSE:
+                self.presenter.mark_full()  # The window needs to be shown again in full
+            else:
+                self.scenes.dispatch(event)  # Everything else goes to the current step
 
     def handle_in_game_actions(self, event):
         if event.type == pygame.MOUSEBUTTONDOWN:
@@ -242,6 +419,16 @@ class Game:
             self.check_house_interaction()
         elif event.key == pygame.K_TAB:
             self.stat_window.set_visibility(True)  # Show stat window on Tab key press
+        elif event.key == pygame.K_F9:
+            tracer.flush()  # Write the trace buffer to trace.log
+        elif event.key == pygame.K_p:
+            self.clock.toggle_pause()  # Pause or resume the game
+        elif event.key == pygame.K_f:
+            self.clock.cycle_time_scale()  # Fast-forward: 1x, 2x, 4x
+        elif event.key == pygame.K_F3:
+            self.toggle_profiler()  # Show or hide the frame timing overlay
+        elif event.key == pygame.K_F4 and self.profiler.enabled:
+            self.profiler.export_csv()  # Write the recent frame timings to frame_timings.csv
         elif event.key == pygame.K_ESCAPE:
             pygame.quit()
             sys.exit()
@@ -253,33 +440,38 @@ class Game:
     # -------- Game Logic --------
     def start_game(self):
         """Transition to the game state."""
-        self.current_step = "game"
-        self.spawn_zombies(5)
         self.day_counter.current_day = 1
+        self.waves.start(1, self.clock.get_ticks())
+        self.scenes.switch_to('game')
 
     def shoot_bullet(self):
         """Handle shooting bullets based on player location and ammo count."""
-        mouse_x, mouse_y = pygame.mouse.get_pos()
+        mouse_x, mouse_y = self.input.get_mouse_pos()
 
         # If the player is inside the house, allow shooting freely
         if self.character.in_house:
             bullet_info = self.character.shoot(mouse_x, mouse_y)
-            bullet = Bullet(*bullet_info, self.zoom_level)
-            self.bullets.append(bullet)
+            self.fire(bullet_info)
             self.shots_fired += 1  # Track number of shots fired
-            print(f"Bullet shot at: ({mouse_x}, {mouse_y}) | Player inside the house")
+            tracer.debug('shooting', "Bullet shot at: (%s, %s) | Player inside the house", mouse_x, mouse_y)
         
         # If the player is outside the house, check for ammo
         else:
             if self.materials_counter.ammo > 0:
                 bullet_info = self.character.shoot(mouse_x, mouse_y)
-                bullet = Bullet(*bullet_info, self.zoom_level)
-                self.bullets.append(bullet)
+                self.fire(bullet_info)
                 self.materials_counter.ammo -= 1
                 self.shots_fired += 1  # Track number of shots fired
-                print(f"Bullet shot at: ({mouse_x}, {mouse_y}) | Ammo left: {self.materials_counter.ammo}")
+                tracer.debug('shooting', "Bullet shot at: (%s, %s) | Ammo left: %s", mouse_x, mouse_y, self.materials_counter.ammo)
             else:
-                print("No ammo left!")  # Notify that the player is out of ammo
+                tracer.info('shooting', "No ammo left!")  # Notify that the player is out of ammo
+
+    def fire(self, bullet_info):
+        """Fire a shot from Character.shoot: hitscan with a Sniper on the team, otherwise a bullet."""
+        if "Sniper" in self.selected_roles:
+            self.fire_hitscan(*bullet_info)
+        else:
+            self.bullets.spawn(*bullet_info, self.zoom_level)
 
     def check_house_interaction(self):
         house_center_x = self.SCREEN_WIDTH // 2
@@ -296,7 +488,7 @@ class Game:
             return
         
         # Calculate the current time and reset DPS every second
-        current_time = pygame.time.get_ticks() / 1000.0  # Time in seconds
+        current_time = self.clock.get_ticks() / 1000.0  # Time in seconds
         # Reset SPS every second
         if current_time - self.sps_timer >= 1.0:
             self.sps = self.shots_fired  # Store the number of bullets fired in 1 second
@@ -320,17 +512,6 @@ class Game:
             
         delta_time = self.clock.get_time() / 1000  # Convert milliseconds to seconds
 
-        # Pass the calculated DPS and accuracy_offset to materials_counter.draw
-        self.materials_counter.draw(
-            self.screen, 20, 100, 
-            self.player_speed, 
-            self.character.fire_rate, 
-            self.character.damage_bonus, 
-            self.dps, 
-            self.sps,
-            self.character.accuracy_offset  # Pass accuracy_offset here
-        )
-
         # Update speed history with the current speed
         self.speed_history.append(current_speed)
         # Regenerate health for character and house
@@ -348,61 +529,113 @@ class Game:
         self.previous_position = current_position
 
         # Update other game elements
-        self.character.handle_movement(pygame.key.get_pressed())
+        self.character.handle_movement(self.input.get_keys_pressed())
         self.auto_shoot()
         self.update_bullets()
+        self.waves.update(self.clock.get_ticks())
         self.update_zombies()
         self.check_for_drop_collection()
 
-        if not self.zombies:
+        # The day is over once its wave is out and every zombie is dead; build the next wave meanwhile
+        if not self.zombies and not self.waves.is_releasing():
             if not self.day_counter.timer_start_time:
                 self.day_counter.start_timer()
+                self.waves.prepare(self.day_counter.current_day + 1)
             self.day_counter.show_next_day_button = True
 
-    def update_bullets(self):
-        bullets_to_remove = []
-        for bullet in self.bullets:
-            bullet.update()
-            if bullet.is_off_screen(self.SCREEN_WIDTH, self.SCREEN_HEIGHT):
-                bullets_to_remove.append(bullet)
-            else:
-                print(f"Checking bullet collisions for bullet at ({bullet.x}, {bullet.y})")  # Debugging
-                self.check_bullet_collisions(bullet, bullets_to_remove)
+        # Run the countdown every tick, so the day also starts when no events arrive
+        if self.day_counter.show_next_day_button:
+            self.day_counter.update_timer()
+            if self.day_counter.is_timer_done():
+                self.start_next_day()
 
-        for bullet in bullets_to_remove:
-            if bullet in self.bullets:
-                self.bullets.remove(bullet)
+    def update_bullets(self):
+        # Move every bullet and drop the ones that left the screen
+        self.bullets.update(self.SCREEN_WIDTH, self.SCREEN_HEIGHT)
 
-    def check_bullet_collisions(self, bullet, bullets_to_remove):
-        damage = self.character.damage_bonus if hasattr(self.character, 'damage_bonus') else 0  # Ensure damage is initialized
-        print(f"Damage bonus: {damage}")  # Debugging line
+        self.check_bullet_collisions()
 
-        for zombie in self.zombies[:]:
-            if zombie.check_collision(bullet):
-                zombie.take_damage(damage)  # Apply damage to the zombie
-                bullets_to_remove.append(bullet)
-                self.damage_done_in_last_second += damage  # Add damage to the DPS tracker
-                print(f"Zombie hit! Health: {zombie.current_health}, Damage dealt: {damage}")
-                if zombie.is_dead():
-                    self.zombies.remove(zombie)
-                    self.money_counter.add_money()
+        # Remove the bullets that hit a zombie, and the zombies they killed
+        self.bullets.compact()
+        self.zombies.compact()
 
+    def check_bullet_collisions(self):
+        """Damage every living zombie a bullet's hitbox touched on the path it moved along this step, then remove the bullet."""
+        bullets = self.bullets
+        n = len(bullets)
+        if n == 0 or not self.zombies:
+            return
+        damage = self.character.damage_bonus if hasattr(self.character, 'damage_bonus') else 0  # Ensure damage is initialized
+        tracer.debug('combat', "Damage bonus: %s", damage)
+
+        # Sweep each bullet's hitbox (10x30 scaled by its zoom) from its previous position, so fast
+        # bullets cannot skip over a zombie. Killed zombies stay in the horde until the end of the step
+        zoom_level = bullets.zoom_level[:n]
+        hits = self.zombies.sweep(bullets.previous_x[:n], bullets.previous_y[:n], bullets.x[:n], bullets.y[:n],
+                                  5 * zoom_level, 15 * zoom_level, first=False)
+        trace_bullets = tracer.is_enabled('bullets', DEBUG)  # Checked once, not per bullet
+        for index, bullet_hits in enumerate(hits):
+            if trace_bullets:
+                tracer.debug('bullets', "Bullet at (%s, %s) crossed %s zombies", bullets.x[index], bullets.y[index], len(bullet_hits))
+            for _, zombie_index in bullet_hits:
+                zombie = self.zombies[zombie_index]
+                if not zombie.is_dead():
+                    self.hit_zombie(zombie, damage)
+                    bullets.kill(bullets[index])
+
+    def hit_zombie(self, zombie, damage):
+        """Damage a zombie and pay out for the kill; dead zombies are left for ZombieHorde.compact()."""
+        zombie.take_damage(damage)  # Apply damage to the zombie
+        self.damage_done_in_last_second += damage  # Add damage to the DPS tracker
+        tracer.debug('combat', "Zombie hit! Health: %s, Damage dealt: %s", zombie.current_health, damage)
+        if zombie.is_dead():
+            self.money_counter.add_money()
+            self.kills += 1
+            self.corpses.append((zombie.archetype, zombie.x, zombie.y, zombie.base_width, zombie.base_height,
+                                 self.clock.get_ticks()))
+
+    def fire_hitscan(self, start_x, start_y, target_x, target_y):
+        """Shoot along the line from start through target, out to the edge of the screen, at once.
+
+        The shot stops at the first zombie and hits everything a bullet's hitbox would overlap there.
+        """
+        reach = math.hypot(self.SCREEN_WIDTH, self.SCREEN_HEIGHT)
+        length = math.hypot(target_x - start_x, target_y - start_y) or 1.0
+        end_x = start_x + (target_x - start_x) / length * reach
+        end_y = start_y + (target_y - start_y) / length * reach
+
+        hits = self.zombies.raycast(start_x, start_y, end_x, end_y, first=True)
+        if hits:
+            t = hits[0][0]
+            end_x = start_x + (end_x - start_x) * t
+            end_y = start_y + (end_y - start_y) * t
+            width, height = 10 * self.zoom_level, 30 * self.zoom_level
+            for zombie in self.zombies.query_rect(end_x - width / 2, end_y - height / 2, width, height):
+                self.hit_zombie(zombie, self.character.damage_bonus)
+            self.zombies.compact()
+
+        # Show the shot's path for a moment
+        self.shot_traces.append(((start_x, start_y), (end_x, end_y), self.clock.get_ticks() + 80))
 
     def update_zombies(self):
-        for zombie in self.zombies:
-            if zombie.update(self.clock.get_time(), self.character, self.house):
-                self.house.take_damage(5)
+        # Move every zombie at once; each zombie that reached the house deals 5 damage
+        for _ in range(self.zombies.update(self.clock.get_time(), self.character, self.house)):
+            self.house.take_damage(5)
 
     def check_for_drop_collection(self):
-        for drop in self.drops[:]:
-            if drop.check_collection(self.character):
+        character = self.character
+        nearby_drops = self.drop_grid.query_rect(character.x - 1, character.y - 1, character.base_width + 2, character.base_height + 2)
+        for drop in nearby_drops:
+            if drop.check_collection(character):
                 self.materials_counter.add_material(drop.type_of_drop)
                 self.drops.remove(drop)
+                self.drop_grid.remove(drop)
+                self.drop_pool.release(drop)
                 
     def auto_shoot(self):
         """Automatically shoot bullets if Mouse1 is held down, with an interval adjusted by selected roles."""
-        current_time = pygame.time.get_ticks() / 1000.0  # Current time in seconds
-        mouse_buttons = pygame.mouse.get_pressed()
+        current_time = self.clock.get_ticks() / 1000.0  # Current time in seconds
+        mouse_buttons = self.input.get_mouse_pressed()
 
         # If Mouse1 (left-click) is held down, shoot bullets automatically
         if mouse_buttons[0]:
@@ -417,114 +650,167 @@ class Game:
             self.shoot_bullet()  # Shoot a bullet
             
             # Check if Machine Gunner is selected and apply a faster shooting interval
-            if "Machine Gunner" in self.team_selection_step.selected_roles:
-                print("Machine Gunner active, reducing shooting interval")  # Debugging
+            if "Machine Gunner" in self.selected_roles:
+                tracer.debug('shooting', "Machine Gunner active, reducing shooting interval")
                 shooting_interval = max(0.1, shooting_interval - 0.1)  # Reduce interval, e.g., by 0.1 seconds
             
             self.last_shot_time = current_time  # Update the last shot time
 
 
-    # -------- Handle Day Progression --------
-    def check_day_progression(self, event):
-        """Handle the logic for starting the next day."""
-        if self.day_counter.show_next_day_button:
-            self.day_counter.auto_advance_day_if_needed()
-
-            # Check for button click to advance the day manually
-            if self.day_counter.check_button_click(event):
-                self.advance_day_logic()
-
     # -------- Render Game Background --------
     def draw_tiled_background(self, surface):
-        """Tile the grass image across the given surface."""
-        tile_width, tile_height = self.grass_image.get_size()
-        screen_width, screen_height = surface.get_size()
-        
-        for x in range(0, screen_width, tile_width):
-            for y in range(0, screen_height, tile_height):
-                surface.blit(self.grass_image, (x, y))
+        """Cover the given surface with the grass tiles (pre-tiled once per surface size)."""
+        size = surface.get_size()
+        if self.tiled_background is None or self.tiled_background.get_size() != size:
+            # Grass resized to 64x64 tiles; once tiled, only the scene that built the tiling holds it
+            scene = "game" if self.current_step == 'game' else "menu"
+            grass_image = asset_registry.get_image('assets/grass.png', (64, 64), alpha=False, scene=scene)
+            tile_width, tile_height = grass_image.get_size()
+            self.tiled_background = pygame.Surface(size).convert()
+            for x in range(0, size[0], tile_width):
+                for y in range(0, size[1], tile_height):
+                    self.tiled_background.blit(grass_image, (x, y))
+        surface.blit(self.tiled_background, (0, 0))
 
     # -------- Rendering --------
     def render_game(self):
-        if self.current_step == "main_menu":
-            self.main_menu.draw(self.screen, self)  # Pass self as game_instance
-        elif self.current_step == "intro":
-            self.intro_step.draw(self.screen, self)  # Ensure intro_step takes game_instance too if needed
-        elif self.current_step == "family_selection":
-            self.family_selection_step.draw(self.screen, self)  # Pass self as game_instance here
-        elif self.current_step == "team_selection":
-            self.team_selection_step.draw(self.screen, self)  # Pass self as game_instance here
-        elif self.current_step == "game":
-            self.render_gameplay()
+        self.scenes.draw(self.screen)
 
-            
-    def render_gameplay(self):
-        # First, draw the tiled background
-        self.draw_tiled_background(self.screen)  # Pass self.screen as the argument
+        # Switching to another step changes the whole screen
+        self.presenter.mark_if_changed('step', self.screen.get_rect(), self.current_step)
 
-        # Then, draw all game elements (house, character, etc.)
-        self.house.draw(self.screen, self.zoom_level, self.SCREEN_WIDTH, self.SCREEN_HEIGHT)
-        self.character.draw(self.screen, self.zoom_level)
+        # Frame timing overlay
+        if self.profiler.enabled:
+            overlay = self.profiler.render_overlay(self.profiler_font)
+            self.presenter.mark(self.screen.blit(overlay, (self.SCREEN_WIDTH - overlay.get_width() - 10, 160)))
 
-        for zombie in self.zombies:
-            zombie.draw(self.screen, self.zoom_level)
+        # Show the frame (the only display update of the frame)
+        self.presenter.present()
 
-        for bullet in self.bullets:
-            bullet.draw(self.screen, self.zoom_level)
+    def toggle_profiler(self):
+        """Turn the frame profiler and its overlay on or off."""
+        if self.profiler.enabled:
+            self.profiler.disable()
+            self.compositor.profiler = None
+        else:
+            self.profiler.enable(self, self.PROFILED_METHODS)
+            self.compositor.profiler = self.profiler
+        self.presenter.mark_full()
 
-        for drop in self.drops:
-            drop.draw(self.screen)
+    def render_gameplay(self):
+        # Zooming rescales everything on screen, and the house only changes when zooming or destroyed
+        self.presenter.mark_if_changed('zoom', self.screen.get_rect(), self.zoom_level)
+        if self.compositor.invalidate_if_changed('structures', (self.zoom_level, self.house.is_destroyed())):
+            self.presenter.mark(self.house_rect)
+
+        # Cached ground and structures in one blit, then entities, HUD and modal windows
+        self.compositor.compose(self.screen)
+
+    def draw_structures(self, surface):
+        """Structures layer: the obstacles and the house (or its rubble)."""
+        for obstacle in self.obstacles:
+            obstacle.draw(surface)
+        self.house_rect = self.house.draw(surface, self.zoom_level, self.SCREEN_WIDTH, self.SCREEN_HEIGHT)
+
+    def draw_entities(self, surface):
+        """Entities layer: everything that moves, plus the drops."""
+        presenter = self.presenter
+
+        # Moving entities are drawn between their last two simulation steps
+        alpha = self.clock.get_alpha()
+        presenter.mark(self.character.draw(surface, self.zoom_level, alpha))
+
+        # Recent kills play their die clip under the living zombies
+        now = self.clock.get_ticks()
+        corpses = self.corpses
+        while corpses and now - corpses[0][5] > self.CORPSE_MS:
+            corpses.popleft()
+        for archetype, x, y, width, height, died_at in corpses:
+            width, height = int(width * self.zoom_level), int(height * self.zoom_level)
+            sprite, offset_x, offset_y = animations.get(archetype).frame_at('die', now - died_at, width, height)
+            presenter.mark(surface.blit(sprite, (int(x) + offset_x, int(y) + offset_y)))
+
+        presenter.mark_many(self.zombies.draw(surface, self.zoom_level, alpha))
+
+        presenter.mark_many(self.bullets.draw(surface, self.zoom_level, alpha))
+
+        # Hitscan shots, until they fade
+        self.shot_traces = [trace for trace in self.shot_traces if trace[2] > now]
+        for start, end, _ in self.shot_traces:
+            presenter.mark(pygame.draw.line(surface, (255, 240, 160), start, end, 2))
 
-        self.day_counter.draw(self.screen)
-        self.money_counter.draw(self.screen, 20, 60)
+        for drop in self.drops:
+            presenter.mark(drop.draw(surface))
 
-        # Check if the character is inside the house
-        if self.character.in_house:
-            # Draw the house's health bar at the bottom of the screen
-            self.house.draw_health_bar_bottom(self.screen, self.SCREEN_WIDTH, self.SCREEN_HEIGHT)
-        else:
-            # Draw the character's health bar at the bottom of the screen
-            self.character.draw_health_bar_bottom(self.screen, self.SCREEN_WIDTH, self.SCREEN_HEIGHT)
-
-        # Add the DPS value when calling the draw method, along with accuracy_offset
-        self.materials_counter.draw(
-            self.screen, 20, 100, 
-            self.player_speed, 
-            self.character.fire_rate, 
-            self.character.damage_bonus, 
-            self.dps, 
-            self.sps, 
-            self.character.accuracy_offset  # Add accuracy_offset here
-        )
+    def draw_hud(self, surface):
+        """HUD layer: counters, health bars, buttons and messages."""
+        self.hud.render(surface)
 
-        self.shop.draw_shop_button(self.screen)
-        if self.shop.is_shop_open():
-            self.shop.open_shop_menu(self.screen)
+        self.shop.draw_shop_button(surface)
 
         # Add the settings logo here so it's drawn after everything else
         self.settings.draw_logo()
 
         # Display house interaction message
-        self.draw_house_interaction_message()
+        self.presenter.mark_many(self.draw_house_interaction_message())
+
+    def health_bar_value(self):
+        """Whose health bar is shown at the bottom of the screen, and its width."""
+        if self.character.in_house:
+            return ('house', int(self.house.health / self.house.max_health * self.SCREEN_WIDTH))
+        return ('character', int(self.character.current_health / self.character.max_health * self.SCREEN_WIDTH))
+
+    def render_health_bar(self, value):
+        """The house's health bar while the character is inside, otherwise the character's."""
+        owner = self.house if value[0] == 'house' else self.character
+        return owner.render_health_bar(self.SCREEN_WIDTH)
+
+    def materials_value(self):
+        """Materials and stats shown by the materials counter."""
+        materials_counter = self.materials_counter
+        return (materials_counter.food, materials_counter.ammo, materials_counter.scrap,
+                round(self.player_speed, 2), self.character.fire_rate, self.character.damage_bonus,
+                self.dps, self.sps, self.character.accuracy_offset)
+
+    def draw_modals(self, surface):
+        """Modal layer: the shop, stat and settings windows."""
+        # Opening or closing a window changes the whole screen, closing included
+        self.presenter.mark_if_changed('modals', self.screen.get_rect(),
+                                       (self.shop.is_shop_open(), self.stat_window.show_window,
+                                        self.settings.show_settings_window))
+
+        if self.shop.is_shop_open():
+            self.shop.open_shop_menu(surface)
+            self.presenter.mark_full()
 
         self.stat_window.draw()  # Draw the stats window if it's visible
+        if self.stat_window.show_window:
+            self.presenter.mark_full()
 
         # Check if the settings window should be drawn
         if self.settings.show_settings_window:
             self.settings.draw_settings_window()
+            self.presenter.mark_full()
 
-        # Update display
-        pygame.display.flip()
-
-
+    def render_time_scale(self, value):
+        """Show when the game is paused or fast-forwarded."""
+        paused, time_scale = value
+        if paused:
+            return font_registry.render(self.font, "Paused", (255, 255, 255))
+        if time_scale != 1:
+            return font_registry.render(self.font, f"x{time_scale}", (255, 255, 255))
+        return None
 
     def draw_house_interaction_message(self):
-        """Display a message when the player is inside or near the house for the first 4 seconds, then fade out."""
+        """Display a message when the player is inside or near the house for the first 4 seconds, then fade out.
+
+        Returns the areas drawn.
+        """
         # Do not show indicators if the shop is open
         if self.shop.is_shop_open():
-            return  # Skip drawing the indicator if the shop is open
+            return []  # Skip drawing the indicator if the shop is open
 
-        current_time = pygame.time.get_ticks() / 1000.0  # Current time in seconds
+        current_time = self.clock.get_ticks() / 1000.0  # Current time in seconds
 
         # If the player is inside the house
         if self.character.in_house:
@@ -532,7 +818,7 @@ class Game:
 
             # Only show the message for the first 4 seconds inside the house
             if time_in_house > 4:
-                return  # Stop showing the message after 4 seconds
+                return []  # Stop showing the message after 4 seconds
 
             message = "Press E to exit house"
         else:
@@ -550,23 +836,23 @@ class Game:
 
                 # Show the message for 4 seconds after the player is near the house
                 if time_near_house > 4:
-                    return  # Stop showing the message after 4 seconds
+                    return []  # Stop showing the message after 4 seconds
 
                 message = "Press E to enter house"
             else:
                 # If the player is not near the house, reset the timer
                 self.character.near_house_time = None
-                return  # No message if not near or in the house
+                return []  # No message if not near or in the house
 
         # Font settings for the message
-        regular_font = pygame.font.Font('assets/pixelify_font/PixelifySans-Regular.ttf', 36)
-        e_font = pygame.font.Font('assets/pixelify_font/Monofett-Regular.ttf', 36)
+        regular_font = font_registry.get_font('assets/pixelify_font/PixelifySans-Regular.ttf', 36)
+        e_font = font_registry.get_font('assets/pixelify_font/Monofett-Regular.ttf', 36)
 
         # Split the message to render "E" separately
         parts = message.split("E")
-        text_surface_before_e = regular_font.render(parts[0], True, (255, 255, 255))
-        text_surface_after_e = regular_font.render(parts[1], True, (255, 255, 255)) if len(parts) > 1 else None
-        e_surface = e_font.render("E", True, (255, 255, 255))
+        text_surface_before_e = font_registry.render(regular_font, parts[0], (255, 255, 255))
+        text_surface_after_e = font_registry.render(regular_font, parts[1], (255, 255, 255)) if len(parts) > 1 else None
+        e_surface = font_registry.render(e_font, "E", (255, 255, 255))
 
         before_e_width = text_surface_before_e.get_width()
         e_width = e_surface.get_width()
@@ -582,45 +868,79 @@ class Game:
         else:
             alpha = 255 if time_near_house <= 2 else max(0, 255 - int(255 * (time_near_house - 2) / 2))
 
-        # Apply alpha transparency to surfaces
+        # Apply alpha transparency to copies so the cached text surfaces stay opaque
+        if alpha < 255:
+            text_surface_before_e = text_surface_before_e.copy()
+            e_surface = e_surface.copy()
+            if text_surface_after_e:
+                text_surface_after_e = text_surface_after_e.copy()
         text_surface_before_e.set_alpha(alpha)
         e_surface.set_alpha(alpha)
         if text_surface_after_e:
             text_surface_after_e.set_alpha(alpha)
 
         # Draw the message parts on the screen
-        self.screen.blit(text_surface_before_e, (base_x, base_y))
-        self.screen.blit(e_surface, (base_x + before_e_width, base_y))
+        rects = [self.screen.blit(text_surface_before_e, (base_x, base_y)),
+                 self.screen.blit(e_surface, (base_x + before_e_width, base_y))]
         if text_surface_after_e:
-            self.screen.blit(text_surface_after_e, (base_x + before_e_width + e_width, base_y))
-
-        pygame.display.flip()  # Update the screen
+            rects.append(self.screen.blit(text_surface_after_e, (base_x + before_e_width + e_width, base_y)))
+        return rects
 
 
 
     # -------- Helper Functions --------
+    def set_obstacles(self, obstacles):
+        """Replace the obstacles, re-baking the zombies' flow field and redrawing the structures."""
+        self.obstacles = list(obstacles)
+        # Zombies are placed by their top-left corner, so block the cells where their body would overlap
+        self.flow_field.set_obstacles([obstacle.rect for obstacle in self.obstacles], walker_size=(20, 50))
+        self.compositor.invalidate('structures')
+        self.presenter.mark_full()
+
+    def build_zombie(self, archetype='walker', edges=SPAWN_EDGES):
+        """Return a new zombie of an archetype, outside one of the edges (not in the horde yet)."""
+        stats = dict(self.zombie_stats)
+        for stat, multiplier in ARCHETYPES[archetype].items():
+            stats[stat] = stats.get(stat, DEFAULT_STATS[stat]) * multiplier
+        return self.zombie_pool.acquire(self.SCREEN_WIDTH, self.SCREEN_HEIGHT,
+                                        self.SCREEN_WIDTH // 2, self.SCREEN_HEIGHT // 2, edges=edges,
+                                        archetype=archetype, **stats)
+
+    def release_zombie(self, zombie):
+        """Add a built zombie to the horde (which copies it, so the instance goes back to the pool)."""
+        self.zombies.append(zombie)
+        self.zombie_pool.release(zombie)
+
     def spawn_zombies(self, num_zombies):
         house_center_x = self.SCREEN_WIDTH // 2
         house_center_y = self.SCREEN_HEIGHT // 2
         for _ in range(num_zombies):
-            zombie = Zombie(self.SCREEN_WIDTH, self.SCREEN_HEIGHT, house_center_x, house_center_y)
+            # The horde copies the zombie's state, so the same instance is reused for the next one
+            zombie = self.zombie_pool.acquire(self.SCREEN_WIDTH, self.SCREEN_HEIGHT, house_center_x, house_center_y,
+                                              **self.zombie_stats)
             self.zombies.append(zombie)
+            self.zombie_pool.release(zombie)
 
     def spawn_drops(self, num_drops=None):
         if num_drops is None:
             num_drops = random.randint(3, 7)
         for _ in range(num_drops):
             drop_type = random.choice(['food', 'ammo', 'scrap'])
-            drop = Drop(self.SCREEN_WIDTH, self.SCREEN_HEIGHT, drop_type)
+            drop = self.drop_pool.acquire(self.SCREEN_WIDTH, self.SCREEN_HEIGHT, drop_type)
             self.drops.append(drop)
+            self.drop_grid.insert(drop, drop.x, drop.y, drop.width, drop.height)
 
+    # -------- Handle Day Progression --------
     def check_day_progression(self, event):
-        if self.day_counter.show_next_day_button:
-            self.day_counter.start_timer()
-            if self.day_counter.check_button_click(event) or self.day_counter.is_timer_done():
-                self.day_counter.advance_day()
-                self.spawn_zombies(5 * self.day_counter.current_day)
-                self.spawn_drops()
+        """Start the next day when the "Start Next Day" button is clicked (update_game handles the countdown)."""
+        if self.day_counter.check_button_click(event):
+            self.start_next_day()
+
+    def start_next_day(self):
+        """Advance the day counter, start releasing the new day's wave and spawn its drops."""
+        self.day_counter.advance_day()
+        self.waves.start(self.day_counter.current_day, self.clock.get_ticks())
+        self.spawn_drops()
 
 
 if __name__ == "__main__":
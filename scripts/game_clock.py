@@ -0,0 +1,111 @@
+# game_clock.py
+
+import pygame
+
+# Time scales the game can run at (0 is paused)
+TIME_SCALES = (1, 2, 4)
+
+class GameClock:
+    """Unified game clock driving a fixed-rate simulation.
+
+    Real frame time (scaled by time_scale) goes into an accumulator, and steps() yields once
+    for every whole simulation step it holds, so the game runs at the same speed whatever the
+    frame rate. Game time (get_ticks) only advances with simulation steps: it stops while
+    paused and runs faster when fast-forwarding. get_alpha() tells the renderer how far it
+    is between the last two steps.
+    """
+
+    def __init__(self, step_ms=1000 / 60, max_frame_ms=250):
+        self.clock = pygame.time.Clock()
+        self.step_ms = step_ms  # Length of one simulation step
+        self.max_frame_ms = max_frame_ms  # Longer frames are clamped so a stall cannot snowball
+        self.time_scale = 1
+        self.paused = False
+        self.accumulator = 0.0
+        self.ticks = 0.0  # Game time in milliseconds
+        self.frame_steps = 0  # Simulation steps run since the last tick
+
+    def tick(self, framerate=0):
+        """Wait for the next frame (capped at framerate), bank its scaled time and return the real milliseconds."""
+        frame_ms = self.clock.tick(framerate)
+        self.frame_steps = 0
+        if not self.paused:
+            self.accumulator += min(frame_ms, self.max_frame_ms) * self.time_scale
+        return frame_ms
+
+    def steps(self):
+        """Yield once for every whole simulation step in the accumulator, advancing game time each time."""
+        while self.accumulator >= self.step_ms:
+            self.accumulator -= self.step_ms
+            self.ticks += self.step_ms
+            self.frame_steps += 1
+            yield
+
+    def get_alpha(self):
+        """Fraction of a step left in the accumulator (0 to 1), for interpolated rendering."""
+        return min(1.0, self.accumulator / self.step_ms)
+
+    def get_time(self):
+        """Milliseconds of game time covered by one simulation step."""
+        return self.step_ms
+
+    def get_ticks(self):
+        """Milliseconds of game time since the game started."""
+        return int(self.ticks)
+
+    def get_fps(self):
+        """Rendered frames per second."""
+        return self.clock.get_fps()
+
+    def set_time_scale(self, time_scale):
+        """Run the game time_scale times faster than real time."""
+        self.time_scale = time_scale
+
+    def cycle_time_scale(self):
+        """Switch to the next time scale in TIME_SCALES."""
+        index = TIME_SCALES.index(self.time_scale) if self.time_scale in TIME_SCALES else -1
+        self.set_time_scale(TIME_SCALES[(index + 1) % len(TIME_SCALES)])
+
+    def toggle_pause(self):
+        """Pause or resume game time."""
+        self.paused = not self.paused
+
+
+class SimulatedClock(GameClock):
+    """Clock that banks exactly one step (times time_scale) on every tick, as fast as the CPU allows."""
+
+    def tick(self, framerate=0):
+        """Bank one step without waiting (framerate is ignored) and return the step in milliseconds."""
+        self.frame_steps = 0
+        if not self.paused:
+            self.accumulator += self.step_ms * self.time_scale
+        return self.step_ms
+
+    def get_fps(self):
+        return 1000 / self.step_ms
+
+
+class ReplayClock(GameClock):
+    """Clock that runs exactly the simulation steps an InputReplayer recorded for each frame.
+
+    Frames are paced like the recorded game (realtime) or run as fast as possible. Pausing
+    and fast-forwarding do nothing, the recorded step counts already include them.
+    """
+
+    def __init__(self, replayer, realtime=True):
+        super().__init__(replayer.step_ms)
+        self.replayer = replayer
+        self.realtime = realtime
+
+    def tick(self, framerate=0):
+        self.frame_steps = 0
+        return self.clock.tick(framerate if self.realtime else 0)
+
+    def steps(self):
+        for _ in range(self.replayer.frame_steps):
+            self.ticks += self.step_ms
+            self.frame_steps += 1
+            yield
+
+    def get_alpha(self):
+        return 1.0
@@ -0,0 +1,88 @@
+# game_input.py
+
+import pygame
+
+class LiveInput:
+    """Reads the real mouse, keyboard and event queue."""
+
+    def get_events(self):
+        # MOUSEMOTION never reaches the queue: no scene handles it, so the scene stack blocks it
+        return pygame.event.get()
+
+    def get_mouse_pos(self):
+        return pygame.mouse.get_pos()
+
+    def get_mouse_pressed(self):
+        return pygame.mouse.get_pressed()
+
+    def get_keys_pressed(self):
+        return pygame.key.get_pressed()
+
+
+class KeyState:
+    """Pressed-key lookup that can be indexed like pygame.key.get_pressed()."""
+
+    def __init__(self, pressed=()):
+        self.pressed = set(pressed)
+
+    def __getitem__(self, key):
+        return key in self.pressed
+
+
+class ScriptedInput:
+    """Input driven by a script instead of the player (used by headless simulations)."""
+
+    def __init__(self):
+        self.mouse_pos = (0, 0)
+        self.mouse_buttons = [False, False, False]
+        self.keys = KeyState()
+        self.events = []
+
+    def post(self, event_type, **attributes):
+        """Queue an event for the next call to get_events()."""
+        self.events.append(pygame.event.Event(event_type, **attributes))
+
+    def click(self, pos, button=1):
+        """Queue a full mouse click at pos."""
+        self.mouse_pos = pos
+        self.post(pygame.MOUSEBUTTONDOWN, pos=pos, button=button)
+        self.post(pygame.MOUSEBUTTONUP, pos=pos, button=button)
+
+    def get_events(self):
+        # Drain the real queue too so it never fills up
+        pygame.event.pump()
+        events, self.events = self.events, []
+        return events
+
+    def get_mouse_pos(self):
+        return self.mouse_pos
+
+    def get_mouse_pressed(self):
+        return tuple(self.mouse_buttons)
+
+    def get_keys_pressed(self):
+        return self.keys
+
+
+def defend_house_script(game, tick):
+    """Simple player policy: stay in the house, shoot the zombie closest to it and start each day at once."""
+    house_x = game.SCREEN_WIDTH // 2
+    house_y = game.SCREEN_HEIGHT // 2
+
+    target = game.zombies.nearest(house_x, house_y)
+    if target is not None:
+        game.input.mouse_pos = (target.x + target.base_width / 2, target.y + target.base_height / 2)
+        game.input.mouse_buttons[0] = True
+    else:
+        game.input.mouse_buttons[0] = False
+        if game.day_counter.show_next_day_button:
+            game.input.click(game.day_counter.button_rect.center)
+
+
+def upgrading_script(game, tick):
+    """defend_house_script, also buying the cheapest shop upgrade whenever there is money for it."""
+    defend_house_script(game, tick)
+    shop = game.shop
+    stat_name = min(shop.upgrade_prices, key=shop.upgrade_prices.get)
+    if game.money_counter.money >= shop.upgrade_prices[stat_name]:
+        shop.upgrade_stat(stat_name)
@@ -1,29 +1,39 @@
 import pygame
 import time
+from scripts.asset_registry import asset_registry
+from scripts.font_registry import font_registry
+from scripts.hud import render_health_bar
+from scripts.transform_cache import transform_cache
 
 class House:
-    def __init__(self):
+    def __init__(self, clock=None):
+        # Clock for timers (the wall clock when none is given)
+        self.clock = clock
+
         # Basic properties of the house
         self.base_size = 200
         self.health = 100  # Current health of the house
         self.max_health = 100  # Maximum health
         self.building_regen_rate = 0  # Initialize building regen rate to 0
 
-        # Load the house image
-        try:
-            self.house_image = pygame.image.load('assets/starterhouseIMG.png').convert_alpha()
-            self.house_image = pygame.transform.scale(self.house_image, (self.base_size, self.base_size))
-        except pygame.error as e:
-            print(f"Unable to load house image: {e}")
-            self.house_image = pygame.Surface((self.base_size, self.base_size))
-            self.house_image.fill((100, 100, 100))  # Default to grey if image not found
+        # Load the house image (the registry falls back to grey if the image is not found)
+        self.house_image = asset_registry.get_image('assets/starterhouseIMG.png', (self.base_size, self.base_size), scene="game")
 
         # Load rubble image (replace with an actual rubble image if available)
         self.rubble_image = pygame.Surface((self.base_size, self.base_size))
         self.rubble_image.fill((139, 69, 19))  # Brown color to represent rubble
 
         # Time tracking for house health regeneration (Engineer)
-        self.last_health_regen_time = time.time()
+        self.last_health_regen_time = self.now()
+
+        # Font for the health bar label
+        self.label_font = font_registry.get_font(None, 36)
+
+    def now(self):
+        """Current time in seconds."""
+        if self.clock is not None:
+            return self.clock.get_ticks() / 1000.0
+        return time.time()
 
     def take_damage(self, damage):
         """Reduce the house's health."""
@@ -43,7 +53,7 @@ class House:
 
     def engineer_repair(self):
         """For Engineer: Regenerate house health over time based on Building Regen Rate."""
-        current_time = time.time()
+        current_time = self.now()
         if current_time - self.last_health_regen_time >= 3:
             if self.health < self.max_health:
                 self.health += self.building_regen_rate  # Use the building regen rate
@@ -59,40 +69,23 @@ class House:
                 self.health = self.max_health
 
     def draw(self, surface, zoom_level, screen_width, screen_height):
-        """Draw the house or rubble on the given surface."""
-        # Scale the house based on the zoom level
-        scaled_size = int(self.base_size * zoom_level)
+        """Draw the house or rubble on the given surface and return the area it covers."""
+        # Pick rubble when the house is destroyed, otherwise the house image
+        image = self.rubble_image if self.is_destroyed() else self.house_image
+
+        # Scale the house based on the zoom level (reused until the zoom level changes)
+        scaled_image = transform_cache.get(image, zoom_level)
+        scaled_size = scaled_image.get_width()
         house_x = (screen_width // 2) - (scaled_size // 2)
         house_y = (screen_height // 2) - (scaled_size // 2)
 
-        if self.is_destroyed():
-            # Draw rubble when the house is destroyed
-            scaled_rubble = pygame.transform.scale(self.rubble_image, (scaled_size, scaled_size))
-            surface.blit(scaled_rubble, (house_x, house_y))
-        else:
-            # Draw the house image
-            scaled_house = pygame.transform.scale(self.house_image, (scaled_size, scaled_size))
-            surface.blit(scaled_house, (house_x, house_y))
+        return surface.blit(scaled_image, (house_x, house_y))
+
+    def render_health_bar(self, screen_width):
+        """Return the house's health bar and its label as one surface."""
+        return render_health_bar(screen_width, self.health / self.max_health, "House Health", self.label_font)
 
     def draw_health_bar_bottom(self, surface, screen_width, screen_height):
         """Draw the house's health bar across the bottom of the screen."""
-        bar_height = 30
-        health_bar_width = int((self.health / self.max_health) * screen_width)
-
-        # Create a transparent surface for the health bar
-        bar_surface = pygame.Surface((screen_width, bar_height), pygame.SRCALPHA)
-        bar_surface.fill((255, 0, 0, 150))  # Red with 150 alpha for transparency
-
-        # Foreground (Green) for remaining health
-        health_surface = pygame.Surface((health_bar_width, bar_height), pygame.SRCALPHA)
-        health_surface.fill((0, 255, 0, 150))  # Green with 150 alpha for transparency
-
-        # Draw the health bar background and foreground on the screen
-        surface.blit(bar_surface, (0, screen_height - bar_height))
-        surface.blit(health_surface, (0, screen_height - bar_height))
-
-        # Draw the text label "House Health" above the health bar
-        font = pygame.font.Font(None, 36)
-        label_surface = font.render("House Health", True, (255, 255, 255))
-        label_rect = label_surface.get_rect(center=(screen_width // 2, screen_height - bar_height - 20))
-        surface.blit(label_surface, label_rect)
+        bar_surface = self.render_health_bar(screen_width)
+        return surface.blit(bar_surface, (0, screen_height - bar_surface.get_height()))
@@ -0,0 +1,99 @@
+# hud.py
+
+import pygame
+from scripts.font_registry import font_registry
+
+class HudWidget:
+    """A HUD element that keeps the surface of the last value it showed.
+
+    value() returns what the widget shows; render(value) turns it into a surface (or None
+    to show nothing). The surface is only rebuilt when the value changes, and it is placed
+    with its align point (any pygame.Rect attribute, e.g. "topright") at position.
+    """
+
+    def __init__(self, name, position, value, render, align='topleft'):
+        self.name = name
+        self.position = position
+        self.value = value
+        self.render = render
+        self.align = align
+
+        self.last_value = None
+        self.surface = None
+        self.rect = None  # Screen area of the current surface
+        self.dirty = True  # Render on the first update whatever the value is
+        self.renders = 0
+
+    def update(self):
+        """Re-render if the bound value changed; returns the screen areas that changed."""
+        value = self.value()
+        if not self.dirty and value == self.last_value:
+            return []
+
+        changed = [self.rect] if self.rect else []
+        self.last_value = value
+        self.dirty = False
+        self.surface = self.render(value)
+        self.renders += 1
+        if self.surface is None:
+            self.rect = None
+        else:
+            self.rect = self.surface.get_rect(**{self.align: self.position})
+            changed.append(self.rect)
+        return changed
+
+    def draw(self, surface):
+        """Blit the cached surface."""
+        if self.surface is not None:
+            surface.blit(self.surface, self.rect)
+
+
+class Hud:
+    """Retained HUD: widgets are registered once and rendered together every frame."""
+
+    def __init__(self, presenter=None):
+        self.widgets = []
+        self.presenter = presenter  # Told about the areas of widgets whose value changed
+
+    def add(self, name, position, value, render, align='topleft'):
+        """Register a widget; returns it."""
+        widget = HudWidget(name, position, value, render, align)
+        self.widgets.append(widget)
+        return widget
+
+    def invalidate(self):
+        """Re-render every widget on the next frame."""
+        for widget in self.widgets:
+            widget.dirty = True
+
+    def render(self, surface):
+        """Update and draw every widget in the order they were added."""
+        for widget in self.widgets:
+            changed = widget.update()
+            if changed and self.presenter is not None:
+                self.presenter.mark_many(changed)
+            widget.draw(surface)
+
+    def stats(self):
+        """Number of times each widget was rendered."""
+        return {widget.name: widget.renders for widget in self.widgets}
+
+
+def render_health_bar(width, fraction, label, font, bar_height=30):
+    """Return a bar across width with its label above it, filled green for fraction (red behind)."""
+    label_surface = font_registry.render(font, label, (255, 255, 255))
+    surface = pygame.Surface((width, bar_height + 50), pygame.SRCALPHA)
+
+    # Background (red) and remaining health (green), both with 150 alpha. The green part is
+    # pre-blended with the red under it, so one blit looks like drawing the two bars in turn
+    alpha = 150 / 255
+    combined_alpha = alpha + alpha * (1 - alpha)
+    blended = (round(255 * alpha * (1 - alpha) / combined_alpha), round(255 * alpha / combined_alpha), 0,
+               round(255 * combined_alpha))
+    health_width = int(fraction * width)
+    surface.fill((255, 0, 0, 150), (health_width, 50, width - health_width, bar_height))
+    surface.fill(blended, (0, 50, health_width, bar_height))
+
+    # Label centred 20 px above the bar
+    surface.blit(label_surface, label_surface.get_rect(center=(width // 2, 30)))
+    return surface
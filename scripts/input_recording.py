@@ -0,0 +1,161 @@
+# input_recording.py
+
+import struct
+import pygame
+from scripts.game_input import KeyState
+
+# File layout (little-endian):
+#   header: magic, version, random seed, simulation step in milliseconds
+#   then per frame: event count and the events, followed by the frame state
+#   (simulation steps run, cursor position, mouse buttons and movement keys)
+MAGIC = b'UFIR'
+VERSION = 2
+HEADER = struct.Struct('<4sBQd')
+EVENT_COUNT = struct.Struct('<B')
+EVENT_KIND = struct.Struct('<B')
+MOUSE_EVENT = struct.Struct('<Bhh')  # button, x, y
+KEY_EVENT = struct.Struct('<i')  # key
+FRAME_STATE = struct.Struct('<HhhBB')  # steps, cursor x, cursor y, mouse button bits, key bits
+
+# Event kinds stored in the file (other events do not change the game)
+EVENT_KINDS = {
+    pygame.MOUSEBUTTONDOWN: 1,
+    pygame.MOUSEBUTTONUP: 2,
+    pygame.KEYDOWN: 3,
+    pygame.KEYUP: 4,
+    pygame.QUIT: 5,
+}
+EVENT_TYPES = {kind: event_type for event_type, kind in EVENT_KINDS.items()}
+
+MAX_STEPS = 0xFFFF  # Most simulation steps a frame can record
+
+# Keys the game polls every step, one bit each
+RECORDED_KEYS = (pygame.K_w, pygame.K_a, pygame.K_s, pygame.K_d)
+
+
+def pixel_position(pos):
+    """Round a position to whole pixels, as it is stored (scripted input can aim between pixels)."""
+    return int(round(pos[0])), int(round(pos[1]))
+
+
+class InputRecorder:
+    """Passes another input source through to the game while writing it to a replay file.
+
+    The game calls end_frame(steps) after running a frame's simulation steps.
+    """
+
+    def __init__(self, source, path, seed, step_ms):
+        self.source = source
+        self.path = path
+        self.file = open(path, 'wb')
+        self.file.write(HEADER.pack(MAGIC, VERSION, seed, step_ms))
+        self.frames = 0
+
+    def get_events(self):
+        events = self.source.get_events()
+        recorded = [event for event in events if event.type in EVENT_KINDS]
+
+        # Events are written at once, so a frame that quits the game is still in the file
+        chunks = [EVENT_COUNT.pack(len(recorded))]
+        for event in recorded:
+            kind = EVENT_KINDS[event.type]
+            chunks.append(EVENT_KIND.pack(kind))
+            if event.type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+                chunks.append(MOUSE_EVENT.pack(event.button, *pixel_position(event.pos)))
+            elif event.type in (pygame.KEYDOWN, pygame.KEYUP):
+                chunks.append(KEY_EVENT.pack(event.key))
+        self.file.write(b''.join(chunks))
+        self.file.flush()
+        return events
+
+    def get_mouse_pos(self):
+        # The game sees the cursor as it is written, so a replay aims exactly the same way
+        return pixel_position(self.source.get_mouse_pos())
+
+    def get_mouse_pressed(self):
+        return self.source.get_mouse_pressed()
+
+    def get_keys_pressed(self):
+        return self.source.get_keys_pressed()
+
+    def end_frame(self, steps):
+        """Write the state the simulation steps of this frame read."""
+        mouse_x, mouse_y = self.get_mouse_pos()
+        buttons = sum(1 << i for i, pressed in enumerate(self.source.get_mouse_pressed()[:3]) if pressed)
+        keys_pressed = self.source.get_keys_pressed()
+        keys = sum(1 << i for i, key in enumerate(RECORDED_KEYS) if keys_pressed[key])
+        self.file.write(FRAME_STATE.pack(min(steps, MAX_STEPS), mouse_x, mouse_y, buttons, keys))
+        self.frames += 1
+
+    def close(self):
+        if not self.file.closed:
+            self.file.close()
+
+
+class InputReplayer:
+    """Feeds a recorded input stream back to the game, one recorded frame per get_events() call."""
+
+    def __init__(self, path):
+        with open(path, 'rb') as replay_file:
+            self.data = replay_file.read()
+        magic, version, self.seed, self.step_ms = HEADER.unpack_from(self.data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not an input recording")
+        self.offset = HEADER.size
+
+        self.finished = False
+        self.frame_steps = 0
+        self.mouse_pos = (0, 0)
+        self.mouse_buttons = (False, False, False)
+        self.keys = KeyState()
+        self.frames = 0
+
+    def read(self, record):
+        values = record.unpack_from(self.data, self.offset)
+        self.offset += record.size
+        return values
+
+    def get_events(self):
+        """Return the next frame's events and load the state its simulation steps read."""
+        if self.offset >= len(self.data):
+            self.finished = True
+            self.frame_steps = 0
+            return []
+
+        pygame.event.pump()  # Keep the real queue from filling up
+        events = []
+        (count,) = self.read(EVENT_COUNT)
+        for _ in range(count):
+            (kind,) = self.read(EVENT_KIND)
+            event_type = EVENT_TYPES[kind]
+            if event_type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+                button, x, y = self.read(MOUSE_EVENT)
+                events.append(pygame.event.Event(event_type, button=button, pos=(x, y)))
+            elif event_type in (pygame.KEYDOWN, pygame.KEYUP):
+                (key,) = self.read(KEY_EVENT)
+                events.append(pygame.event.Event(event_type, key=key))
+            else:
+                events.append(pygame.event.Event(event_type))
+
+        # The recording ends after the events when the game quit during this frame
+        if self.offset + FRAME_STATE.size > len(self.data):
+            self.finished = True
+            self.frame_steps = 0
+            return events
+
+        steps, x, y, buttons, keys = self.read(FRAME_STATE)
+        self.frame_steps = steps
+        self.mouse_pos = (x, y)
+        self.mouse_buttons = tuple(bool(buttons & (1 << i)) for i in range(3))
+        self.keys = KeyState(key for i, key in enumerate(RECORDED_KEYS) if keys & (1 << i))
+        self.frames += 1
+        return events
+
+    def get_mouse_pos(self):
+        return self.mouse_pos
+
+    def get_mouse_pressed(self):
+        return self.mouse_buttons
+
+    def get_keys_pressed(self):
+        return self.keys
@@ -1,18 +1,20 @@
 import pygame
+from scripts.font_registry import font_registry
+from scripts.trace import tracer
 
 class MainMenu:
     def __init__(self, screen_width, screen_height):
         # Load the PixelifySans-Bold.ttf for the "Start" button
-        self.font_big = pygame.font.Font('assets/pixelify_font/PixelifySans-Bold.ttf', 72)
+        self.font_big = font_registry.get_font('assets/pixelify_font/PixelifySans-Bold.ttf', 72)
         # Load the Pixelify-Regular.ttf for the "Exit Game" button
-        self.font_small = pygame.font.Font('assets/pixelify_font/PixelifySans-Regular.ttf', 48)
+        self.font_small = font_registry.get_font('assets/pixelify_font/PixelifySans-Regular.ttf', 48)
         
         self.screen_width = screen_width
         self.screen_height = screen_height
         
         # Text for Start and Exit
-        self.start_text = self.font_big.render("Start", True, (255, 255, 255))  # Black text
-        self.exit_text = self.font_small.render("Exit Game", True, (255, 255, 255))  # Black text
+        self.start_text = font_registry.render(self.font_big, "Start", (255, 255, 255))  # Black text
+        self.exit_text = font_registry.render(self.font_small, "Exit Game", (255, 255, 255))  # Black text
 
         # Get positions for text (adjusted positions)
         self.start_rect = self.start_text.get_rect(center=(screen_width // 2, screen_height // 2 - 100))  # Adjusted Y-position
@@ -28,30 +30,24 @@ class MainMenu:
 
         # Draw the rest of the main menu elements
         # For example, drawing buttons, title, etc.
-        title_font = pygame.font.Font('assets/pixelify_font/PixelifySans-Regular.ttf', 72)
-        # title_surface = title_font.render("Fortress of the Undead", True, (255, 255, 255))
-        # title_rect = title_surface.get_rect(center=(self.screen_width // 2, self.screen_height // 4))
-        # surface.blit(title_surface, title_rect)
 
         # Draw "Start" button:
         surface.blit(self.start_text, self.start_rect)
 
         # Draw "Exit Game" button:
         surface.blit(self.exit_text, self.exit_rect)
-        
-        pygame.display.flip()  # Update the screen
 
     def handle_events(self, event):
         """Handle menu clicks."""
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:  # Left click
-            mouse_pos = pygame.mouse.get_pos()
+            mouse_pos = event.pos
 
             # Check if the Start or Exit buttons are clicked
             if self.start_rect.collidepoint(mouse_pos):
-                print("Start button clicked")  # Debugging line
+                tracer.info('menu', "Start button clicked")
                 self.game_started = True  # Start the game when "Start" is clicked
             elif self.exit_rect.collidepoint(mouse_pos):
-                print("Exit button clicked")  # Debugging line
+                tracer.info('menu', "Exit button clicked")
                 pygame.quit()
                 exit()  # Quit the game when "Exit Game" is clicked
 
@@ -1,11 +1,13 @@
 import random
 import pygame
+from scripts.font_registry import font_registry
 
 class MaterialsCounter:
     def __init__(self):
         self.food = 0
         self.ammo = 0
         self.scrap = 0
+        self.font = font_registry.get_font('assets/pixelify_font/PixelifySans-Regular.ttf', 24)
 
     def add_material(self, material_type):
         """Increase the count for the collected material."""
@@ -38,42 +40,28 @@ class MaterialsCounter:
         """Calculate the average damage per second (DPS) the player is outputting."""
         return fire_rate * damage_per_shot
 
-    def draw(self, surface, x, y, speed, fire_rate, damage, dps, sps, accuracy_offset):
-        """Draw the materials, SPS, and accuracy range on the screen."""
-        font = pygame.font.Font('assets/pixelify_font/PixelifySans-Regular.ttf', 24)
-        
-        # Draw materials (food, ammo, scrap) below the accuracy information
-        food_text = font.render(f"Food: {self.food}", True, (255, 255, 255))
-        ammo_text = font.render(f"Ammo: {self.ammo}", True, (255, 255, 255))
-        scrap_text = font.render(f"Scrap: {self.scrap}", True, (255, 255, 255))
-
-        # Display materials on the screen
-        surface.blit(food_text, (x, y + 180))
-        surface.blit(ammo_text, (x, y + 210))
-        surface.blit(scrap_text, (x, y + 240))
-            
-        # Draw Speed, Fire Rate, Damage, DPS, SPS
-        speed_text = font.render(f"Speed: {speed:.2f}", True, (255, 255, 255))
-        fire_rate_text = font.render(f"Fire Rate: {fire_rate:.2f}", True, (255, 255, 255))
-        damage_text = font.render(f"Damage: {damage}", True, (255, 255, 255))
-        dps_text = font.render(f"DPS: {dps}", True, (255, 255, 255))
-        sps_text = font.render(f"SPS: {sps}", True, (255, 255, 255))
-        
-        # Calculate the accuracy range (e.g., ±accuracy_offset)
-        accuracy_range = f"Accuracy Range: ±{accuracy_offset:.2f}"
-
-        # Render all text onto the screen
-        surface.blit(speed_text, (x, y))
-        surface.blit(fire_rate_text, (x, y + 30))
-        surface.blit(damage_text, (x, y + 60))
-        surface.blit(dps_text, (x, y + 90))
-        surface.blit(sps_text, (x, y + 120))
-
-        # Display the accuracy range below the SPS value
-        accuracy_text = font.render(accuracy_range, True, (255, 255, 255))
-        surface.blit(accuracy_text, (x, y + 150))
-
-
-
+    def render(self, speed, fire_rate, damage, dps, sps, accuracy_offset):
+        """Return the stats and materials (one line every 30 px) as one transparent surface."""
+        lines = [
+            f"Speed: {speed:.2f}",
+            f"Fire Rate: {fire_rate:.2f}",
+            f"Damage: {damage}",
+            f"DPS: {dps}",
+            f"SPS: {sps}",
+            f"Accuracy Range: ±{accuracy_offset:.2f}",  # The accuracy range (e.g., ±accuracy_offset)
+            f"Food: {self.food}",
+            f"Ammo: {self.ammo}",
+            f"Scrap: {self.scrap}",
+        ]
+        text_surfaces = [font_registry.render(self.font, line, (255, 255, 255)) for line in lines]
 
+        width = max(text.get_width() for text in text_surfaces)
+        height = 30 * (len(text_surfaces) - 1) + text_surfaces[-1].get_height()
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        for i, text in enumerate(text_surfaces):
+            surface.blit(text, (0, i * 30))
+        return surface
 
+    def draw(self, surface, x, y, speed, fire_rate, damage, dps, sps, accuracy_offset):
+        """Draw the materials, SPS, and accuracy range on the screen."""
+        surface.blit(self.render(speed, fire_rate, damage, dps, sps, accuracy_offset), (x, y))
@@ -0,0 +1,131 @@
+# navigation.py
+
+import heapq
+import math
+import numpy as np
+
+# Neighbouring cells (row, column offsets) and the cost of stepping to them
+NEIGHBOURS = ((-1, 0, 1.0), (1, 0, 1.0), (0, -1, 1.0), (0, 1, 1.0),
+              (-1, -1, math.sqrt(2)), (-1, 1, math.sqrt(2)), (1, -1, math.sqrt(2)), (1, 1, math.sqrt(2)))
+
+class FlowField:
+    """Grid of walking directions toward one goal, routed around blocked cells.
+
+    bake() measures the walking distance from every cell to the goal's cell (Dijkstra over
+    the 8 neighbours, never cutting the corner of a blocked cell) and points each cell at its
+    closest neighbour. Steering is then one array lookup per zombie. The field is baked again
+    on the next lookup after the goal or the obstacles change.
+    """
+
+    def __init__(self, left, top, width, height, cell_size=24):
+        self.left = left  # World position of the grid's top-left corner
+        self.top = top
+        self.cell_size = cell_size
+        self.columns = int(math.ceil(width / cell_size))
+        self.rows = int(math.ceil(height / cell_size))
+
+        self.goal = None  # (x, y) in world coordinates
+        self.obstacles = []  # Rects that cannot be walked through
+        self.walker_size = (0, 0)  # Size of the walkers, whose position is their top-left corner
+
+        self.blocked = np.zeros((self.rows, self.columns), dtype=bool)
+        self.distance = np.full((self.rows, self.columns), np.inf)
+        self.flow_x = np.zeros((self.rows, self.columns))
+        self.flow_y = np.zeros((self.rows, self.columns))
+        self.has_flow = np.zeros((self.rows, self.columns), dtype=bool)  # False at the goal and where it cannot be reached
+
+        self.dirty = True
+        self.bakes = 0
+
+    def set_goal(self, x, y):
+        if self.goal != (x, y):
+            self.goal = (x, y)
+            self.dirty = True
+
+    def set_obstacles(self, rects, walker_size=(0, 0)):
+        """Replace the obstacles; a cell is blocked when a walker of walker_size placed there would overlap one."""
+        self.obstacles = [rect.copy() for rect in rects]
+        self.walker_size = walker_size
+        self.dirty = True
+
+    def cell_of(self, x, y):
+        """Return the (row, column) of the cell containing a world position, clamped to the grid."""
+        column = min(self.columns - 1, max(0, int((x - self.left) // self.cell_size)))
+        row = min(self.rows - 1, max(0, int((y - self.top) // self.cell_size)))
+        return row, column
+
+    def mark_blocked(self):
+        self.blocked[:] = False
+        walker_width, walker_height = self.walker_size
+        for rect in self.obstacles:
+            first_row, first_column = self.cell_of(rect.left - walker_width, rect.top - walker_height)
+            last_row, last_column = self.cell_of(rect.right - 1, rect.bottom - 1)
+            self.blocked[first_row:last_row + 1, first_column:last_column + 1] = True
+
+    def bake(self):
+        """Recompute the distance and flow fields for the current goal and obstacles."""
+        self.mark_blocked()
+        rows, columns = self.rows, self.columns
+        blocked = self.blocked.tolist()
+        distance = [[math.inf] * columns for _ in range(rows)]
+
+        # The goal's cell is always walkable, or nothing could reach it
+        goal_row, goal_column = self.cell_of(*self.goal)
+        blocked[goal_row][goal_column] = False
+        distance[goal_row][goal_column] = 0.0
+        queue = [(0.0, goal_row, goal_column)]
+        while queue:
+            cell_distance, row, column = heapq.heappop(queue)
+            if cell_distance > distance[row][column]:
+                continue
+            for row_step, column_step, cost in NEIGHBOURS:
+                next_row, next_column = row + row_step, column + column_step
+                if not (0 <= next_row < rows and 0 <= next_column < columns) or blocked[next_row][next_column]:
+                    continue
+                if row_step and column_step and (blocked[row][next_column] or blocked[next_row][column]):
+                    continue
+                next_distance = cell_distance + cost
+                if next_distance < distance[next_row][next_column]:
+                    distance[next_row][next_column] = next_distance
+                    heapq.heappush(queue, (next_distance, next_row, next_column))
+
+        # Point every cell (blocked ones too, so a walker pushed into one walks out) at its closest neighbour
+        flow_x = [[0.0] * columns for _ in range(rows)]
+        flow_y = [[0.0] * columns for _ in range(rows)]
+        has_flow = [[False] * columns for _ in range(rows)]
+        for row in range(rows):
+            for column in range(columns):
+                if row == goal_row and column == goal_column:
+                    continue
+                best = distance[row][column]
+                best_step = None
+                for row_step, column_step, cost in NEIGHBOURS:
+                    next_row, next_column = row + row_step, column + column_step
+                    if not (0 <= next_row < rows and 0 <= next_column < columns):
+                        continue
+                    if row_step and column_step and (blocked[row][next_column] or blocked[next_row][column]):
+                        continue
+                    if distance[next_row][next_column] < best:
+                        best = distance[next_row][next_column]
+                        best_step = (column_step, row_step, cost)
+                if best_step is not None:
+                    column_step, row_step, cost = best_step
+                    flow_x[row][column] = column_step / cost
+                    flow_y[row][column] = row_step / cost
+                    has_flow[row][column] = True
+
+        self.distance = np.array(distance)
+        self.flow_x = np.array(flow_x)
+        self.flow_y = np.array(flow_y)
+        self.has_flow = np.array(has_flow)
+        self.dirty = False
+        self.bakes += 1
+
+    def directions(self, x, y):
+        """Return the unit walking direction at each of the positions in arrays x and y, and
+        whether there is one (there is none in the goal's cell, where walkers head straight for it)."""
+        if self.dirty:
+            self.bake()
+        columns = np.clip(((x - self.left) // self.cell_size).astype(int), 0, self.columns - 1)
+        rows = np.clip(((y - self.top) // self.cell_size).astype(int), 0, self.rows - 1)
+        return self.flow_x[rows, columns], self.flow_y[rows, columns], self.has_flow[rows, columns]
@@ -0,0 +1,44 @@
+# object_pool.py
+
+class ObjectPool:
+    """Reuses released objects instead of allocating new ones.
+
+    acquire(*args) calls factory(*args) when the pool is empty, otherwise it takes a
+    released object and calls its reset(*args) method to reinitialize it.
+    """
+
+    def __init__(self, factory, max_free=None):
+        self.factory = factory
+        self.max_free = max_free  # Maximum number of released objects kept (None for no limit)
+        self.free = []
+
+        # Allocation statistics
+        self.created = 0
+        self.reused = 0
+        self.released = 0
+
+    def acquire(self, *args, **kwargs):
+        """Return a ready-to-use object, reusing a released one when possible."""
+        if self.free:
+            obj = self.free.pop()
+            obj.reset(*args, **kwargs)
+            self.reused += 1
+            return obj
+
+        self.created += 1
+        return self.factory(*args, **kwargs)
+
+    def release(self, obj):
+        """Give an object back to the pool so it can be reused."""
+        self.released += 1
+        if self.max_free is None or len(self.free) < self.max_free:
+            self.free.append(obj)
+
+    def in_use(self):
+        """Number of objects handed out and not released yet."""
+        return self.created + self.reused - self.released
+
+    def stats(self):
+        """Return allocation statistics."""
+        return {'created': self.created, 'reused': self.reused, 'released': self.released,
+                'in_use': self.in_use(), 'free': len(self.free)}
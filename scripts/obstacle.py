@@ -0,0 +1,21 @@
+import pygame
+from scripts.asset_registry import asset_registry
+
+# Images and sizes of each kind of obstacle
+OBSTACLE_KINDS = {
+    'barrel': ('assets/Barrel1IMG.png', (40, 40)),
+    'rubble': ('assets/rubbleIMG.png', (90, 60)),
+}
+
+class Obstacle:
+    """Static scenery that zombies walk around."""
+
+    def __init__(self, kind, x, y):
+        self.kind = kind
+        path, (width, height) = OBSTACLE_KINDS[kind]
+        self.image = asset_registry.get_image(path, (width, height), scene="game")
+        self.rect = pygame.Rect(x, y, width, height)
+
+    def draw(self, surface):
+        """Draw the obstacle and return the area it covers."""
+        return surface.blit(self.image, self.rect)
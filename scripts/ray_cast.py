@@ -0,0 +1,230 @@
+# ray_cast.py
+
+import math
+import numpy as np
+
+# Cell coordinates are packed into one integer key: (cell_x + KEY_OFFSET) * KEY_STRIDE + cell_y + KEY_OFFSET
+KEY_OFFSET = 1 << 20
+KEY_STRIDE = 1 << 21
+
+def cell_keys(cell_x, cell_y):
+    return (cell_x + KEY_OFFSET) * KEY_STRIDE + (cell_y + KEY_OFFSET)
+
+def segment_box_entries(x0, y0, x1, y1, left, top, right, bottom):
+    """Return where the segment from (x0, y0) to (x1, y1) enters each box, as a fraction of its
+    length (0 when it starts inside), or infinity for the boxes it misses.
+
+    Box edges are arrays; the segment is either one segment or one per box (arrays as well).
+    """
+    t_enter = np.zeros(np.shape(left))
+    t_exit = np.ones(np.shape(left))
+    for start, delta, low, high in ((x0, np.subtract(x1, x0), left, right), (y0, np.subtract(y1, y0), top, bottom)):
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t_low = (low - start) / delta
+            t_high = (high - start) / delta
+        # Parallel to this axis: the segment is inside the slab everywhere or nowhere
+        parallel = delta == 0
+        t_enter = np.maximum(t_enter, np.where(parallel, -np.inf, np.minimum(t_low, t_high)))
+        t_exit = np.minimum(t_exit, np.where(parallel, np.inf, np.maximum(t_low, t_high)))
+        t_exit = np.where(parallel & ((start < low) | (start > high)), -1.0, t_exit)
+    return np.where(t_enter <= t_exit, t_enter, np.inf)
+
+
+class RayGrid:
+    """Uniform grid of axis-aligned boxes for segment and ray queries.
+
+    build() buckets every box into the cells it covers; a query walks only the cells its
+    segment crosses, in order (a DDA walk), and slab-tests the boxes found there, while
+    query_many() tests a batch of short segments in a few array operations. Queries can be
+    padded, which is the same as testing a box of 2 * pad swept along the segment.
+    """
+
+    def __init__(self, cell_size=64):
+        self.cell_size = cell_size
+        self.cells = {}  # (cell_x, cell_y) -> array of box indices
+        self.left = self.top = self.right = self.bottom = np.zeros(0)
+
+        # The same grouping as sorted arrays, for batched queries: box indices sorted by cell
+        # key, and the key of each occupied cell with the range of its boxes
+        self.boxes = np.zeros(0, dtype=np.int64)
+        self.keys = np.zeros(0, dtype=np.int64)
+        self.starts = np.zeros(0, dtype=np.int64)
+        self.ends = np.zeros(0, dtype=np.int64)
+
+    def build(self, left, top, right, bottom):
+        """Index the boxes given by their edge arrays (a box's index is its position in the arrays)."""
+        self.left, self.top, self.right, self.bottom = left, top, right, bottom
+        self.cells = {}
+        if len(left) == 0:
+            self.boxes = self.keys = self.starts = self.ends = np.zeros(0, dtype=np.int64)
+            return
+
+        size = self.cell_size
+        first_x = np.floor(left / size).astype(np.int64)
+        first_y = np.floor(top / size).astype(np.int64)
+        last_x = np.floor(right / size).astype(np.int64)
+        last_y = np.floor(bottom / size).astype(np.int64)
+
+        # One (cell, box) entry for every cell a box covers
+        indices = np.arange(len(left))
+        cell_xs, cell_ys, boxes = [], [], []
+        for offset_x in range(int((last_x - first_x).max()) + 1):
+            for offset_y in range(int((last_y - first_y).max()) + 1):
+                covers = (first_x + offset_x <= last_x) & (first_y + offset_y <= last_y)
+                cell_xs.append(first_x[covers] + offset_x)
+                cell_ys.append(first_y[covers] + offset_y)
+                boxes.append(indices[covers])
+        cell_xs = np.concatenate(cell_xs)
+        cell_ys = np.concatenate(cell_ys)
+        boxes = np.concatenate(boxes)
+
+        # Group the entries by cell with one sort
+        keys = cell_keys(cell_xs, cell_ys)
+        order = np.argsort(keys, kind='stable')
+        keys, cell_xs, cell_ys, boxes = keys[order], cell_xs[order], cell_ys[order], boxes[order]
+        starts = np.flatnonzero(np.r_[True, np.diff(keys) != 0])
+        ends = np.r_[starts[1:], len(boxes)]
+        self.boxes, self.keys, self.starts, self.ends = boxes, keys[starts], starts, ends
+        for start, end, cell_x, cell_y in zip(starts.tolist(), ends.tolist(),
+                                              cell_xs[starts].tolist(), cell_ys[starts].tolist()):
+            self.cells[(cell_x, cell_y)] = boxes[start:end]
+
+    def walk(self, x0, y0, x1, y1):
+        """Yield each cell the segment crosses, in order, with the fraction of the segment where it leaves the cell."""
+        size = self.cell_size
+        cell_x, cell_y = int(math.floor(x0 / size)), int(math.floor(y0 / size))
+        last_x, last_y = int(math.floor(x1 / size)), int(math.floor(y1 / size))
+        delta_x, delta_y = x1 - x0, y1 - y0
+
+        # Fraction of the segment to the next vertical / horizontal cell border, and between borders
+        step_x = 1 if delta_x > 0 else -1
+        step_y = 1 if delta_y > 0 else -1
+        if delta_x:
+            next_border_x = (cell_x + (step_x > 0)) * size
+            t_max_x = (next_border_x - x0) / delta_x
+            t_delta_x = size / abs(delta_x)
+        else:
+            t_max_x = t_delta_x = math.inf
+        if delta_y:
+            next_border_y = (cell_y + (step_y > 0)) * size
+            t_max_y = (next_border_y - y0) / delta_y
+            t_delta_y = size / abs(delta_y)
+        else:
+            t_max_y = t_delta_y = math.inf
+
+        while True:
+            t_leave = min(t_max_x, t_max_y, 1.0)
+            yield cell_x, cell_y, t_leave
+            if (cell_x == last_x and cell_y == last_y) or t_leave >= 1.0:
+                return
+            if t_max_x < t_max_y:
+                cell_x += step_x
+                t_max_x += t_delta_x
+            else:
+                cell_y += step_y
+                t_max_y += t_delta_y
+
+    def query(self, x0, y0, x1, y1, pad_x=0, pad_y=0, first=True):
+        """Return (t, index) for the boxes the segment hits, nearest first; t is the fraction of the
+        segment where it enters the box. With first, stop at the nearest hit (a list of at most one)."""
+        if not self.cells:
+            return []
+
+        # Padding reaches into neighbouring cells
+        reach_x = int(math.ceil(pad_x / self.cell_size))
+        reach_y = int(math.ceil(pad_y / self.cell_size))
+        seen_cells = set()
+        candidates = []
+        best = math.inf
+        hits = []
+        for cell_x, cell_y, t_leave in self.walk(x0, y0, x1, y1):
+            found = []
+            for near_x in range(cell_x - reach_x, cell_x + reach_x + 1):
+                for near_y in range(cell_y - reach_y, cell_y + reach_y + 1):
+                    if (near_x, near_y) in seen_cells:
+                        continue
+                    seen_cells.add((near_x, near_y))
+                    boxes = self.cells.get((near_x, near_y))
+                    if boxes is not None:
+                        found.append(boxes)
+            if found:
+                boxes = np.unique(np.concatenate(found))
+                if candidates:
+                    boxes = np.setdiff1d(boxes, np.concatenate(candidates), assume_unique=True)
+                candidates.append(boxes)
+                entries = segment_box_entries(x0, y0, x1, y1,
+                                              self.left[boxes] - pad_x, self.top[boxes] - pad_y,
+                                              self.right[boxes] + pad_x, self.bottom[boxes] + pad_y)
+                hit = np.isfinite(entries)
+                hits.extend(zip(entries[hit].tolist(), boxes[hit].tolist()))
+                if hits:
+                    best = min(best, min(t for t, _ in hits))
+
+            # Every point of the segment before t_leave has been covered, so nothing nearer is left
+            if first and best <= t_leave:
+                break
+
+        hits.sort()
+        return hits[:1] if first else hits
+
+    def query_many(self, x0, y0, x1, y1, pad_x=0, pad_y=0, first=True):
+        """Run query() for every segment in the arrays at once; pad_x / pad_y may be arrays too.
+        Returns a list of hit lists, one per segment.
+
+        Meant for many short segments, such as the step of every bullet: instead of walking each
+        one, the cells under each segment's padded bounding box are looked up in a single batch.
+        """
+        count = len(x0)
+        results = [[] for _ in range(count)]
+        if count == 0 or len(self.keys) == 0:
+            return results
+        x0, y0, x1, y1 = (np.asarray(values, dtype=np.float64) for values in (x0, y0, x1, y1))
+        pad_x = np.broadcast_to(np.asarray(pad_x, dtype=np.float64), (count,))
+        pad_y = np.broadcast_to(np.asarray(pad_y, dtype=np.float64), (count,))
+
+        # Cells covered by each segment's bounding box, grown by its padding
+        size = self.cell_size
+        first_x = np.floor((np.minimum(x0, x1) - pad_x) / size).astype(np.int64)
+        first_y = np.floor((np.minimum(y0, y1) - pad_y) / size).astype(np.int64)
+        last_x = np.floor((np.maximum(x0, x1) + pad_x) / size).astype(np.int64)
+        last_y = np.floor((np.maximum(y0, y1) + pad_y) / size).astype(np.int64)
+        segments = np.arange(count)
+        pair_segments, pair_keys = [], []
+        for offset_x in range(int((last_x - first_x).max()) + 1):
+            for offset_y in range(int((last_y - first_y).max()) + 1):
+                covers = (first_x + offset_x <= last_x) & (first_y + offset_y <= last_y)
+                pair_segments.append(segments[covers])
+                pair_keys.append(cell_keys(first_x[covers] + offset_x, first_y[covers] + offset_y))
+        pair_segments = np.concatenate(pair_segments)
+        pair_keys = np.concatenate(pair_keys)
+
+        # Keep the occupied cells and expand each into (segment, box) candidates
+        positions = np.minimum(np.searchsorted(self.keys, pair_keys), len(self.keys) - 1)
+        occupied = self.keys[positions] == pair_keys
+        pair_segments, positions = pair_segments[occupied], positions[occupied]
+        counts = self.ends[positions] - self.starts[positions]
+        total = int(counts.sum())
+        if total == 0:
+            return results
+        offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        candidate_segments = np.repeat(pair_segments, counts)
+        candidate_boxes = self.boxes[np.repeat(self.starts[positions], counts) + offsets]
+
+        # A box in several of a segment's cells is tested once
+        unique = np.unique(candidate_segments * len(self.left) + candidate_boxes)
+        candidate_segments, candidate_boxes = unique // len(self.left), unique % len(self.left)
+
+        entries = segment_box_entries(x0[candidate_segments], y0[candidate_segments],
+                                      x1[candidate_segments], y1[candidate_segments],
+                                      self.left[candidate_boxes] - pad_x[candidate_segments],
+                                      self.top[candidate_boxes] - pad_y[candidate_segments],
+                                      self.right[candidate_boxes] + pad_x[candidate_segments],
+                                      self.bottom[candidate_boxes] + pad_y[candidate_segments])
+        hit = np.isfinite(entries)
+        hit_segments, hit_boxes, hit_entries = candidate_segments[hit], candidate_boxes[hit], entries[hit]
+        order = np.lexsort((hit_boxes, hit_entries, hit_segments))
+        for segment, t, box in zip(hit_segments[order].tolist(), hit_entries[order].tolist(), hit_boxes[order].tolist()):
+            hits = results[segment]
+            if not (first and hits):
+                hits.append((t, box))
+        return results
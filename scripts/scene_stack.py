@@ -0,0 +1,108 @@
+# scene_stack.py
+
+import pygame
+
+class Scene:
+    """One screen of the game (a menu step, gameplay, ...).
+
+    handlers maps event types to the methods handling them; events of other types never
+    reach the scene, and are blocked at the event queue while it is on top. enter() runs
+    when the scene becomes the top of the stack and teardown() when it leaves the stack.
+    """
+    opaque = True  # Covers the whole screen, so the scenes below it are not drawn
+
+    def __init__(self, game):
+        self.game = game
+        self.handlers = {}
+
+    def enter(self):
+        pass
+
+    def teardown(self):
+        pass
+
+    def draw(self, surface):
+        pass
+
+
+class SceneStack:
+    """Scenes built on first use from their factories and dropped once they leave the stack.
+
+    Events go to the handler table of the top scene only. base_events are the event types
+    the game handles itself in every scene; every other type is blocked at the queue unless
+    the top scene has a handler for it.
+    """
+
+    def __init__(self, game, factories, base_events=()):
+        self.game = game
+        self.factories = factories  # name -> factory(game) returning a new scene
+        self.base_events = tuple(base_events)
+        self.loaded = {}  # name -> scene, for the scenes built and not torn down yet
+        self.stack = []  # Names of the scenes on the stack, bottom first
+
+    @property
+    def top_name(self):
+        return self.stack[-1] if self.stack else None
+
+    @property
+    def top(self):
+        return self.loaded[self.stack[-1]] if self.stack else None
+
+    def load(self, name):
+        """Return the scene, building it first if needed (it stays loaded until it leaves the stack)."""
+        scene = self.loaded.get(name)
+        if scene is None:
+            scene = self.loaded[name] = self.factories[name](self.game)
+        return scene
+
+    def unload(self, name):
+        scene = self.loaded.pop(name, None)
+        if scene is not None:
+            scene.teardown()
+
+    def push(self, name):
+        """Put a scene on top of the current one."""
+        scene = self.load(name)
+        self.stack.append(name)
+        scene.enter()
+        self.filter_events()
+
+    def pop(self):
+        """Remove the top scene and tear it down."""
+        name = self.stack.pop()
+        self.unload(name)
+        if self.stack:
+            self.top.enter()
+        self.filter_events()
+
+    def switch_to(self, name):
+        """Tear down every other scene (on the stack or only loaded) and make name the only scene."""
+        self.load(name)
+        for other in list(self.loaded):
+            if other != name:
+                self.unload(other)
+        self.stack = []
+        self.push(name)
+
+    def filter_events(self):
+        """Let only the event types somebody handles into the event queue."""
+        allowed = set(self.base_events)
+        if self.stack:
+            allowed.update(self.top.handlers)
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(sorted(allowed))
+
+    def dispatch(self, event):
+        """Pass the event to the top scene's handler for its type, if it has one."""
+        if self.stack:
+            handler = self.top.handlers.get(event.type)
+            if handler:
+                handler(event)
+
+    def draw(self, surface):
+        """Draw the scenes from the topmost opaque one up."""
+        first = len(self.stack) - 1
+        while first > 0 and not self.loaded[self.stack[first]].opaque:
+            first -= 1
+        for name in self.stack[max(first, 0):]:
+            self.loaded[name].draw(surface)
@@ -0,0 +1,145 @@
+# scenes.py
+
+import pygame
+from scripts.scene_stack import Scene
+from scripts.main_menu import MainMenu
+from scripts.startup_selections import IntroStep, FamilySelectionStep, TeamSelectionStep
+from scripts.asset_registry import asset_registry
+from scripts.font_registry import font_registry
+from scripts.trace import tracer
+
+class LoadingScene(Scene):
+    """Progress bar shown while the background loader decodes the startup images."""
+
+    def __init__(self, game):
+        super().__init__(game)
+        self.paths = game.menu_images + game.game_images
+        self.bar_rect = pygame.Rect(0, 0, game.SCREEN_WIDTH // 2, 24)
+        self.bar_rect.center = (game.SCREEN_WIDTH // 2, game.SCREEN_HEIGHT // 2 + 40)
+
+    def draw(self, surface):
+        game = self.game
+        surface.fill((20, 30, 20))
+        text = font_registry.render(game.font, "Loading...", (255, 255, 255))
+        surface.blit(text, text.get_rect(center=(game.SCREEN_WIDTH // 2, game.SCREEN_HEIGHT // 2 - 20)))
+
+        filled = self.bar_rect.copy()
+        filled.width = int(self.bar_rect.width * game.loader.progress(self.paths))
+        pygame.draw.rect(surface, (90, 160, 70), filled)
+        pygame.draw.rect(surface, (255, 255, 255), self.bar_rect, 2)
+        game.presenter.mark_full()
+
+
+class MenuScene(Scene):
+    """A menu step drawn over the tiled grass; menus change the whole screen every frame."""
+
+    def __init__(self, game, step):
+        super().__init__(game)
+        self.step = step
+        self.handlers = {pygame.MOUSEBUTTONDOWN: self.on_click}
+
+    def on_click(self, event):
+        pass
+
+    def draw(self, surface):
+        self.step.draw(surface, self.game)
+        self.game.presenter.mark_full()
+
+
+class MainMenuScene(MenuScene):
+    def __init__(self, game):
+        super().__init__(game, MainMenu(game.SCREEN_WIDTH, game.SCREEN_HEIGHT))
+
+    def on_click(self, event):
+        self.step.handle_events(event)
+        if self.step.is_game_started():
+            tracer.info('game', "Transitioning to Intro")
+            self.game.scenes.switch_to('intro')
+
+
+class IntroScene(MenuScene):
+    def __init__(self, game):
+        super().__init__(game, IntroStep(game.SCREEN_WIDTH, game.SCREEN_HEIGHT))
+        self.handlers[pygame.KEYDOWN] = self.on_key
+
+    def on_click(self, event):
+        # Any left click continues, not only one on the button
+        if event.button == 1:
+            tracer.info('game', "Continue button clicked in Intro Step.")
+            self.game.scenes.switch_to('family_selection')
+
+    def on_key(self, event):
+        if event.key == pygame.K_RETURN:
+            tracer.info('game', "Enter key pressed in Intro Step.")
+            self.game.scenes.switch_to('family_selection')
+
+
+class FamilySelectionScene(MenuScene):
+    def __init__(self, game):
+        super().__init__(game, FamilySelectionStep(game.SCREEN_WIDTH, game.SCREEN_HEIGHT))
+
+    def on_click(self, event):
+        if self.step.handle_events(event) == "team_selection":
+            tracer.info('game', "Transitioning to Team Selection")
+            self.game.scenes.switch_to('team_selection')
+
+
+class TeamSelectionScene(MenuScene):
+    def __init__(self, game):
+        super().__init__(game, TeamSelectionStep(game.SCREEN_WIDTH, game.SCREEN_HEIGHT, game.stat_window))
+
+    def on_click(self, event):
+        if self.step.handle_events(event) == "game_start":
+            tracer.info('game', "Transitioning to the Game")
+            self.step.apply_team_boosts(self.step.selected_roles)  # Apply boosts
+            self.game.start_game_after_team_selection()  # Initialize the character with selected roles
+
+
+class GameplayScene(Scene):
+    """The game itself, with the shop, stat and settings windows over it."""
+
+    def __init__(self, game):
+        super().__init__(game)
+        self.handlers = {
+            pygame.MOUSEBUTTONDOWN: self.on_mouse_down,
+            pygame.MOUSEBUTTONUP: self.on_game_event,
+            pygame.KEYDOWN: self.on_game_event,
+            pygame.KEYUP: self.on_game_event,
+        }
+
+    def enter(self):
+        # Images only the menus asked for are not needed once gameplay starts
+        asset_registry.evict_scene("menu")
+        self.game.presenter.mark_full()
+
+    def on_mouse_down(self, event):
+        game = self.game
+        shop = game.shop
+        # The shop button opens and closes the shop, and the click goes no further
+        if shop.shop_button_rect.collidepoint(event.pos):
+            shop.handle_shop_button_click(event)
+        elif shop.is_shop_open():
+            shop.handle_events(event)
+        else:
+            game.handle_in_game_actions(event)
+            game.settings.handle_events(event)
+            game.check_day_progression(event)
+
+    def on_game_event(self, event):
+        # Only the shop takes input while it is open
+        if not self.game.shop.is_shop_open():
+            self.game.handle_in_game_actions(event)
+
+    def draw(self, surface):
+        self.game.render_gameplay()
+
+
+# Scene factories by name
+SCENES = {
+    'loading': LoadingScene,
+    'main_menu': MainMenuScene,
+    'intro': IntroScene,
+    'family_selection': FamilySelectionScene,
+    'team_selection': TeamSelectionScene,
+    'game': GameplayScene,
+}
@@ -1,21 +1,17 @@
 import pygame
 import sys
+from scripts.asset_registry import asset_registry
+from scripts.font_registry import font_registry
 
 class Settings:
     def __init__(self, screen):
         self.screen = screen
         
-        # Load the settings logo image
-        try:
-            self.settings_logo_original = pygame.image.load('assets/settingsIMG.png')
-        except pygame.error as e:
-            print(f"Unable to load image: {e}")
-        
         # Scale the settings logo based on the screen size (e.g., 5% of screen height)
         logo_scale_factor = 0.05  # 5% of screen height
         self.logo_width = int(self.screen.get_height() * logo_scale_factor)
         self.logo_height = int(self.logo_width)  # Keep the aspect ratio
-        self.settings_logo = pygame.transform.scale(self.settings_logo_original, (self.logo_width, self.logo_height))
+        self.settings_logo = asset_registry.get_image('assets/settingsIMG.png', (self.logo_width, self.logo_height), scene="game")
 
         self.show_settings_window = False
 
@@ -25,7 +21,7 @@ class Settings:
 
         # Button properties
         # Load the PixelifySans-Regular font for buttons
-        self.button_font = pygame.font.Font('assets/pixelify_font/PixelifySans-Regular.ttf', 36)
+        self.button_font = font_registry.get_font('assets/pixelify_font/PixelifySans-Regular.ttf', 36)
         self.button_color = (70, 130, 180)
         self.button_hover_color = (100, 149, 237)
         self.button_text_color = (255, 255, 255)
@@ -53,18 +49,18 @@ class Settings:
 
         # Draw "Return to Game" button
         pygame.draw.rect(self.screen, self.button_color, self.return_button_rect)
-        return_text = self.button_font.render("Return to game", True, self.button_text_color)
+        return_text = font_registry.render(self.button_font, "Return to game", self.button_text_color)
         self.screen.blit(return_text, (self.return_button_rect.x + 25, self.return_button_rect.y + 10))
 
         # Draw "Quit Game" button
         pygame.draw.rect(self.screen, self.button_color, self.quit_button_rect)
-        quit_text = self.button_font.render("Quit game", True, self.button_text_color)
+        quit_text = font_registry.render(self.button_font, "Quit game", self.button_text_color)
         self.screen.blit(quit_text, (self.quit_button_rect.x + 50, self.quit_button_rect.y + 10))
 
     def handle_events(self, event):
         """Handle click events for settings icon and window buttons."""
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:  # Left mouse click
-            mouse_pos = pygame.mouse.get_pos()
+            mouse_pos = event.pos
             
             # Check if the settings logo is clicked to toggle the settings window
             x = self.screen.get_width() - self.logo_width - 10
@@ -1,10 +1,13 @@
 import pygame
+from scripts.asset_registry import asset_registry
+from scripts.font_registry import font_registry
+from scripts.trace import tracer
 
 class Shop:
     def __init__(self, screen_width, screen_height, house, materials_counter, stat_window, money_counter):
         # Set up fonts
-        self.font = pygame.font.Font('assets/pixelify_font/PixelifySans-Regular.ttf', 25)
-        self.tab_font = pygame.font.Font('assets/pixelify_font/PixelifySans-Regular.ttf', 28)
+        self.font = font_registry.get_font('assets/pixelify_font/PixelifySans-Regular.ttf', 25)
+        self.tab_font = font_registry.get_font('assets/pixelify_font/PixelifySans-Regular.ttf', 28)
 
         # Reference to house, materials counter, stat window, and money counter
         self.house = house
@@ -12,15 +15,9 @@ class Shop:
         self.stat_window = stat_window
         self.money_counter = money_counter
 
-        # Load the shop button image
-        try:
-            self.shop_button_image = pygame.image.load('assets/ShoppingIMG.png').convert_alpha()
-        except pygame.error as e:
-            print(f"Unable to load image: {e}")
-
-        # Resize the shop button image to fit the button area
+        # Load the shop button image, resized to fit the button area
         self.shop_button_width, self.shop_button_height = 80, 50
-        self.shop_button_image = pygame.transform.scale(self.shop_button_image, (self.shop_button_width, self.shop_button_height))
+        self.shop_button_image = asset_registry.get_image('assets/ShoppingIMG.png', (self.shop_button_width, self.shop_button_height), scene="game")
 
         # Shop button rectangle for click detection
         self.shop_button_rect = self.shop_button_image.get_rect(topright=(screen_width - 20, 20))
@@ -28,7 +25,6 @@ class Shop:
         # Shop menu tabs (Buy, Upgrade, Craft, Repairs)
         self.tabs = ['Buy', 'Upgrade', 'Craft', 'Repairs']
         self.active_tab = 'Upgrade'  # Default active tab
-        self.tab_rects = []  # List of tab rects for tab buttons
         self.upgrade_button_rects = []  # List of upgrade button rects
 
         # Shop dimensions (cover almost the entire screen)
@@ -37,6 +33,22 @@ class Shop:
         self.shop_height = screen_height - margin * 2
         self.tab_area = pygame.Rect(margin, margin, self.shop_width, self.shop_height)
 
+        # Tab buttons, stacked down the left side
+        self.tab_height = 60
+        self.tab_rects = [pygame.Rect(self.tab_area.x + 10, 20 + i * self.tab_height, 360, 50) for i in range(len(self.tabs))]
+
+        # Pre-rendered menu parts: background, tab strips per active tab, button gradients and bars
+        self.background = pygame.Surface((self.shop_width, self.shop_height), pygame.SRCALPHA)
+        self.background.fill((0, 0, 0, 180))  # Black with alpha value for transparency
+        self.tab_strips = {}
+        self.gradients = {}
+        self.bars = {}
+
+        # Blits that draw the whole menu, and the state they were built from
+        self.panel_blits = []
+        self.panel_key_drawn = None
+        self.panel_builds = 0
+
         # Close shop button
         self.close_button_rect = pygame.Rect(self.tab_area.x + 20, self.tab_area.bottom - 60, self.shop_width - 40, 40)
         self.close_button_color = (220, 20, 60)
@@ -64,111 +76,154 @@ class Shop:
         surface.blit(self.shop_button_image, self.shop_button_rect)
 
     def open_shop_menu(self, surface):
-        """Display the shop menu with a transparent black background and styled buttons."""
-        self.tab_rects.clear()
-        self.upgrade_button_rects.clear()
-
-        # Draw a transparent black background
-        transparent_black = pygame.Surface((self.shop_width, self.shop_height), pygame.SRCALPHA)
-        transparent_black.fill((0, 0, 0, 180))  # Black with alpha value for transparency
-        surface.blit(transparent_black, (self.tab_area.x, self.tab_area.y))
+        """Display the shop menu with a transparent black background and styled buttons.
+
+        The menu is kept as a list of pre-rendered blits and only rebuilt when the active tab
+        or the state shown in it (prices, house health) changes.
+        """
+        key = self.panel_key()
+        if key != self.panel_key_drawn:
+            self.panel_blits = self.build_panel()
+            self.panel_key_drawn = key
+            self.panel_builds += 1
+        surface.blits(self.panel_blits, doreturn=False)
+
+    def panel_key(self):
+        """State the shop menu is drawn from."""
+        if self.active_tab == 'Upgrade':
+            return (self.active_tab, tuple(self.upgrade_prices.items()))
+        if self.active_tab == 'Repairs':
+            return (self.active_tab, self.house.health, self.house.max_health)
+        return (self.active_tab,)
+
+    def build_panel(self):
+        """Return the blits that draw the whole shop menu."""
+        # Transparent black background
+        blits = [(self.background, self.tab_area.topleft)]
+
+        # Tabs, with the active one highlighted
+        blits.append((self.get_tab_strip(self.active_tab), self.tab_rects[0].topleft))
+
+        # Tab contents
+        blits += self.layout_tab_contents(content_y=20 + len(self.tabs) * self.tab_height + 40)
+
+        # Close shop button with gradient effect
+        blits += self.layout_gradient_button(self.close_button_rect, self.close_button_color, (255, 80, 80), "Close Shop")
+        return blits
+
+    def get_tab_strip(self, active_tab):
+        """Return the tab buttons drawn on a transparent surface, cached per active tab."""
+        strip = self.tab_strips.get(active_tab)
+        if strip is None:
+            origin_x, origin_y = self.tab_rects[0].topleft
+            strip = pygame.Surface((self.tab_rects[-1].right - origin_x, self.tab_rects[-1].bottom - origin_y), pygame.SRCALPHA)
+            for tab, tab_rect in zip(self.tabs, self.tab_rects):
+                local_rect = tab_rect.move(-origin_x, -origin_y)
+                if tab == active_tab:
+                    pygame.draw.rect(strip, (70, 130, 180), local_rect, border_radius=8)  # Active tab with rounded corners
+                else:
+                    pygame.draw.rect(strip, (160, 160, 160), local_rect, border_radius=8)  # Inactive tab with rounded corners
+
+                tab_text = font_registry.render(self.tab_font, tab, (255, 255, 255))
+                strip.blit(tab_text, (local_rect.x + 30, local_rect.y + 10))
+            self.tab_strips[active_tab] = strip
+        return strip
+
+    def get_gradient(self, size, color1, color2):
+        """Return a button background fading from color1 (top) to color2 (bottom), cached by size and colors."""
+        key = (size, color1, color2)
+        gradient = self.gradients.get(key)
+        if gradient is None:
+            width, height = size
+            gradient = pygame.Surface(size)
+            for i in range(height):
+                r = color1[0] + (color2[0] - color1[0]) * i // height
+                g = color1[1] + (color2[1] - color1[1]) * i // height
+                b = color1[2] + (color2[2] - color1[2]) * i // height
+                gradient.fill((r, g, b), (0, i, width, 1))
+            gradient.set_alpha(220)  # Make the button slightly transparent
+            self.gradients[key] = gradient
+        return gradient
+
+    def get_bar(self, width, height, color):
+        """Return a solid bar surface, cached by size and color."""
+        key = (width, height, color)
+        bar = self.bars.get(key)
+        if bar is None:
+            bar = pygame.Surface((width, height))
+            bar.fill(color)
+            self.bars[key] = bar
+        return bar
+
+    def layout_gradient_button(self, rect, color1, color2, text):
+        """Return the blits for a button with a gradient background and centered text."""
+        text_surface = font_registry.render(self.font, text, (255, 255, 255))
+        return [(self.get_gradient(rect.size, color1, color2), rect.topleft),
+                (text_surface, text_surface.get_rect(center=rect.center))]
 
-        # Draw the tabs with improved visuals
-        tab_height = 60
-        for i, tab in enumerate(self.tabs):
-            tab_rect = pygame.Rect(self.tab_area.x + 10, 20 + i * tab_height, 360, 50)
-            self.tab_rects.append(tab_rect)
-
-            if tab == self.active_tab:
-                pygame.draw.rect(surface, (70, 130, 180), tab_rect, border_radius=8)  # Active tab with rounded corners
-            else:
-                pygame.draw.rect(surface, (160, 160, 160), tab_rect, border_radius=8)  # Inactive tab with rounded corners
-
-            tab_text = self.tab_font.render(tab, True, (255, 255, 255))
-            surface.blit(tab_text, (tab_rect.x + 30, tab_rect.y + 10))
-
-        # Display the tab contents
-        self.display_tab_contents(surface, content_y=20 + len(self.tabs) * tab_height + 40)
+    def draw_gradient_button(self, surface, rect, color1, color2, text):
+        """Draw a button with a gradient background."""
+        surface.blits(self.layout_gradient_button(rect, color1, color2, text), doreturn=False)
 
-        # Draw the close shop button with gradient effect
-        self.draw_gradient_button(surface, self.close_button_rect, self.close_button_color, (255, 80, 80), "Close Shop")
+    def layout_repairs(self, x, y):
+        """Return the blits for the Repairs tab content and the repair button's rect (None at full health)."""
+        blits = [(font_registry.render(self.font, "Repairs:", (255, 255, 255)), (x, y))]
 
-    def draw_gradient_button(self, surface, rect, color1, color2, text):
-        """Draw a button with a gradient background and rounded corners."""
-        button_surface = pygame.Surface((rect.width, rect.height))
-        for i in range(rect.height):
-            r = color1[0] + (color2[0] - color1[0]) * i // rect.height
-            g = color1[1] + (color2[1] - color1[1]) * i // rect.height
-            b = color1[2] + (color2[2] - color1[2]) * i // rect.height
-            pygame.draw.line(button_surface, (r, g, b), (0, i), (rect.width, i))
-        button_surface.set_alpha(220)  # Make the button slightly transparent
-        surface.blit(button_surface, rect)
-
-        # Draw the text on the button
-        text_surface = self.font.render(text, True, (255, 255, 255))
-        text_rect = text_surface.get_rect(center=rect.center)
-        surface.blit(text_surface, text_rect)
-
-    def display_repairs(self, surface, x, y):
-        """Display the Repairs tab content."""
-        repair_text = self.font.render("Repairs:", True, (255, 255, 255))
-        surface.blit(repair_text, (x, y))
-
-        house_image = pygame.image.load('assets/starterhouseIMG.png')
-        house_image = pygame.transform.scale(house_image, (60, 60))
-        surface.blit(house_image, (x, y + 50))
+        house_image = asset_registry.get_image('assets/starterhouseIMG.png', (60, 60), scene="game")
+        blits.append((house_image, (x, y + 50)))
 
         health_bar_width = 120
         health_percentage = self.house.health / self.house.max_health
-        pygame.draw.rect(surface, (255, 0, 0), (x + 70, y + 60, health_bar_width, 20))
-        pygame.draw.rect(surface, (0, 255, 0), (x + 70, y + 60, int(health_bar_width * health_percentage), 20))
+        blits.append((self.get_bar(health_bar_width, 20, (255, 0, 0)), (x + 70, y + 60)))
+        green_width = int(health_bar_width * health_percentage)
+        if green_width > 0:
+            blits.append((self.get_bar(green_width, 20, (0, 255, 0)), (x + 70, y + 60)))
 
-        health_text = self.font.render(f"{self.house.health}/{self.house.max_health}", True, (255, 255, 255))
-        surface.blit(health_text, (x + 200, y + 55))
+        health_text = font_registry.render(self.font, f"{self.house.health}/{self.house.max_health}", (255, 255, 255))
+        blits.append((health_text, (x + 200, y + 55)))
 
         if self.house.health < self.house.max_health:
             repair_cost = self.scrap_per_repair * (self.house.max_health - self.house.health)
-            repair_cost_text = self.font.render(f"Cost: {repair_cost} scrap", True, (255, 255, 255))
-            surface.blit(repair_cost_text, (x, y + 120))
+            repair_cost_text = font_registry.render(self.font, f"Cost: {repair_cost} scrap", (255, 255, 255))
+            blits.append((repair_cost_text, (x, y + 120)))
 
             repair_button = pygame.Rect(x + 200, y + 120, 100, 40)
-            self.draw_gradient_button(surface, repair_button, (70, 130, 180), (100, 150, 210), "Repair")
-            return repair_button
+            blits += self.layout_gradient_button(repair_button, (70, 130, 180), (100, 150, 210), "Repair")
+            return blits, repair_button
 
-        return None
+        return blits, None
 
-    def display_upgrade_items(self, surface, x, y):
-        """Display the Upgrade tab content."""
-        upgrade_text = self.font.render("Upgrade abilities:", True, (255, 255, 255))
-        surface.blit(upgrade_text, (x, y))
+    def layout_upgrade_items(self, x, y):
+        """Return the blits for the Upgrade tab content."""
+        blits = [(font_registry.render(self.font, "Upgrade abilities:", (255, 255, 255)), (x, y))]
 
         self.upgrade_button_rects.clear()
 
         for i, (stat_name, price) in enumerate(self.upgrade_prices.items()):
             upgrade_item_text = f"Upgrade {stat_name}: {price} money"
-            upgrade_item_surface = self.font.render(upgrade_item_text, True, (255, 255, 255))
-            surface.blit(upgrade_item_surface, (x, y + 40 * (i + 1)))
+            upgrade_item_surface = font_registry.render(self.font, upgrade_item_text, (255, 255, 255))
+            blits.append((upgrade_item_surface, (x, y + 40 * (i + 1))))
 
             upgrade_button = pygame.Rect(x + 400, y + 40 * (i + 1), 120, 30)
-            self.draw_gradient_button(surface, upgrade_button, (70, 130, 180), (100, 150, 210), "Upgrade")
+            blits += self.layout_gradient_button(upgrade_button, (70, 130, 180), (100, 150, 210), "Upgrade")
             self.upgrade_button_rects.append((stat_name, upgrade_button))
+        return blits
 
-    def display_tab_contents(self, surface, content_y):
-        """Display content based on the active tab."""
+    def layout_tab_contents(self, content_y):
+        """Return the blits for the active tab's content."""
         content_x = self.tab_area.x + 20
-        if self.active_tab == 'Buy':
-            self.display_buy_items(surface, content_x, content_y)
-        elif self.active_tab == 'Upgrade':
-            self.display_upgrade_items(surface, content_x, content_y)
-        elif self.active_tab == 'Craft':
-            self.display_craft_items(surface, content_x, content_y)
-        elif self.active_tab == 'Repairs':
-            self.repair_button = self.display_repairs(surface, content_x, content_y)
+        if self.active_tab == 'Upgrade':
+            return self.layout_upgrade_items(content_x, content_y)
+        if self.active_tab == 'Repairs':
+            blits, self.repair_button = self.layout_repairs(content_x, content_y)
+            return blits
+        # The Buy and Craft tabs have no content yet
+        return []
 
     def handle_events(self, event):
         """Handle events for shop button, menu, and close button."""
         if event.type == pygame.MOUSEBUTTONDOWN:
-            mouse_pos = pygame.mouse.get_pos()
+            mouse_pos = event.pos
 
             # If the shop button is clicked, this is already handled separately
             # Handle internal shop interactions only if the shop is open
@@ -195,7 +250,7 @@ class Shop:
     def handle_shop_button_click(self, event):
         """Handle the click event for the shop button to open/close the shop."""
         if event.type == pygame.MOUSEBUTTONDOWN:
-            mouse_pos = pygame.mouse.get_pos()
+            mouse_pos = event.pos
 
             # If the shop button is clicked, toggle the shop open state
             if self.shop_button_rect.collidepoint(mouse_pos):
@@ -223,13 +278,13 @@ class Shop:
             else:
                 self.stat_window.apply_stat_boost(stat_name, boost_amount)  # Apply character upgrades
 
-            print(f"{stat_name} upgraded by {boost_amount}! Money left: {self.money_counter.money}")
+            tracer.info('shop', "%s upgraded by %s! Money left: %s", stat_name, boost_amount, self.money_counter.money)
             
             # Increase the upgrade price for the next time
             self.upgrade_prices[stat_name] = int(price * 1.2)
-            print(f"New price for {stat_name} upgrade: {self.upgrade_prices[stat_name]}")
+            tracer.info('shop', "New price for %s upgrade: %s", stat_name, self.upgrade_prices[stat_name])
         else:
-            print(f"Not enough money to upgrade {stat_name}.")
+            tracer.info('shop', "Not enough money to upgrade %s.", stat_name)
 
     def repair_house(self):
         """Repair the house if enough scrap is available."""
@@ -237,9 +292,9 @@ class Shop:
         if self.materials_counter.scrap >= repair_cost:
             self.materials_counter.scrap -= repair_cost
             self.house.health = self.house.max_health
-            print(f"House repaired! Scrap left: {self.materials_counter.scrap}")
+            tracer.info('shop', "House repaired! Scrap left: %s", self.materials_counter.scrap)
         else:
-            print("Not enough scrap to repair the house.")
+            tracer.info('shop', "Not enough scrap to repair the house.")
 
     def is_shop_open(self):
         """Return whether the shop is currently open."""
@@ -0,0 +1,159 @@
+# spatial_hash.py
+
+import math
+
+class SpatialHash:
+    def __init__(self, cell_size=64, brute_force=False):
+        self.cell_size = cell_size
+        # When brute_force is True every query scans every object (used to verify the grid)
+        self.brute_force = brute_force
+
+        # Objects in each cell keyed by (cell_x, cell_y)
+        self.cells = {}
+        # Bounding box and covered cells for each object
+        self.bounds = {}
+
+    def __len__(self):
+        return len(self.bounds)
+
+    def __contains__(self, obj):
+        return obj in self.bounds
+
+    def cell_range(self, x, y, width, height):
+        """Return the range of cells covered by a rectangle."""
+        size = self.cell_size
+        return (int(math.floor(x / size)), int(math.floor(y / size)),
+                int(math.floor((x + width) / size)), int(math.floor((y + height) / size)))
+
+    def clear(self):
+        """Remove every object."""
+        self.cells.clear()
+        self.bounds.clear()
+
+    def insert(self, obj, x, y, width=0, height=0):
+        """Add an object with its bounding box (width/height of 0 for a point)."""
+        if obj in self.bounds:
+            self.remove(obj)
+
+        cells = self.cell_range(x, y, width, height)
+        self.bounds[obj] = (x, y, width, height, cells)
+        if self.brute_force:
+            return
+
+        min_cx, min_cy, max_cx, max_cy = cells
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                self.cells.setdefault((cx, cy), []).append(obj)
+
+    def remove(self, obj):
+        """Remove an object if it is in the hash."""
+        entry = self.bounds.pop(obj, None)
+        if entry is None or self.brute_force:
+            return
+
+        min_cx, min_cy, max_cx, max_cy = entry[4]
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                bucket = self.cells.get((cx, cy))
+                if bucket:
+                    bucket.remove(obj)
+                    if not bucket:
+                        del self.cells[(cx, cy)]
+
+    def update(self, obj, x, y, width=0, height=0):
+        """Move an object, only touching the cells when it crosses a cell boundary."""
+        entry = self.bounds.get(obj)
+        cells = self.cell_range(x, y, width, height)
+        if entry is not None and entry[4] == cells:
+            self.bounds[obj] = (x, y, width, height, cells)
+        else:
+            self.insert(obj, x, y, width, height)
+
+    def rebuild(self, objects, get_bounds):
+        """Clear the hash and insert every object, using get_bounds(obj) -> (x, y, width, height)."""
+        self.clear()
+        for obj in objects:
+            self.insert(obj, *get_bounds(obj))
+
+    def candidates(self, x, y, width, height):
+        """Yield each object stored in the cells covered by a rectangle, once."""
+        if self.brute_force:
+            yield from self.bounds
+            return
+
+        min_cx, min_cy, max_cx, max_cy = self.cell_range(x, y, width, height)
+        seen = set()
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                for obj in self.cells.get((cx, cy), ()):
+                    if obj not in seen:
+                        seen.add(obj)
+                        yield obj
+
+    def query_rect(self, x, y, width, height):
+        """Return the objects whose bounding box overlaps the rectangle."""
+        right = x + width
+        bottom = y + height
+        found = []
+        for obj in self.candidates(x, y, width, height):
+            ox, oy, ow, oh, _ = self.bounds[obj]
+            if ox <= right and ox + ow >= x and oy <= bottom and oy + oh >= y:
+                found.append(obj)
+        return found
+
+    def query_radius(self, x, y, radius):
+        """Return the objects whose bounding box is closer than radius to the point."""
+        found = []
+        radius_sq = radius * radius
+        for obj in self.candidates(x - radius, y - radius, radius * 2, radius * 2):
+            if self.distance_sq(obj, x, y) < radius_sq:
+                found.append(obj)
+        return found
+
+    def nearest(self, x, y, max_radius=None):
+        """Return the object closest to the point (or None), searching outward ring by ring."""
+        if not self.bounds:
+            return None
+
+        best = None
+        best_distance_sq = float('inf') if max_radius is None else max_radius * max_radius
+
+        if self.brute_force:
+            for obj in self.bounds:
+                distance_sq = self.distance_sq(obj, x, y)
+                if distance_sq < best_distance_sq:
+                    best, best_distance_sq = obj, distance_sq
+            return best
+
+        size = self.cell_size
+        center_cx = int(math.floor(x / size))
+        center_cy = int(math.floor(y / size))
+
+        # Walk outward until every object has been seen, the ring is farther away
+        # than the best match, or the ring passes the search limit
+        seen = set()
+        ring = 0
+        while len(seen) < len(self.bounds):
+            # Anything in this ring or beyond is at least (ring - 1) cells away
+            if ((ring - 1) * size) ** 2 > best_distance_sq:
+                break
+            for cx in range(center_cx - ring, center_cx + ring + 1):
+                for cy in range(center_cy - ring, center_cy + ring + 1):
+                    if max(abs(cx - center_cx), abs(cy - center_cy)) != ring:
+                        continue
+                    for obj in self.cells.get((cx, cy), ()):
+                        if obj in seen:
+                            continue
+                        seen.add(obj)
+                        distance_sq = self.distance_sq(obj, x, y)
+                        if distance_sq < best_distance_sq:
+                            best, best_distance_sq = obj, distance_sq
+            ring += 1
+        return best
+
+    def distance_sq(self, obj, x, y):
+        """Squared distance from the point to the closest point of the object's bounding box."""
+        ox, oy, ow, oh, _ = self.bounds[obj]
+        dx = max(ox - x, 0, x - (ox + ow))
+        dy = max(oy - y, 0, y - (oy + oh))
+        return dx * dx + dy * dy
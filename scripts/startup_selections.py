@@ -1,10 +1,12 @@
 import pygame
+from scripts.font_registry import font_registry
+from scripts.trace import tracer
 
 # Step 1: Intro Step
 class IntroStep:
     def __init__(self, screen_width, screen_height):
-        self.font = pygame.font.Font('assets/pixelify_font/PixelifySans-Regular.ttf', 25)
-        self.continue_button_font = pygame.font.Font('assets/pixelify_font/PixelifySans-Regular.ttf', 25)
+        self.font = font_registry.get_font('assets/pixelify_font/PixelifySans-Regular.ttf', 25)
+        self.continue_button_font = font_registry.get_font('assets/pixelify_font/PixelifySans-Regular.ttf', 25)
         
         # Explanation text
         self.story_text = [
@@ -14,7 +16,7 @@ class IntroStep:
         ]
         
         # Button to proceed
-        self.continue_text = self.continue_button_font.render("Continue", True, (0, 0, 0))
+        self.continue_text = font_registry.render(self.continue_button_font, "Continue", (0, 0, 0))
         self.continue_rect = self.continue_text.get_rect(center=(screen_width // 2, screen_height // 2 + 150))
 
         self.screen_width = screen_width
@@ -35,32 +37,30 @@ class IntroStep:
         
         y_offset = 100
         for line in story_text:
-            text_surface = self.font.render(line, True, (255, 255, 255))
+            text_surface = font_registry.render(self.font, line, (255, 255, 255))
             text_rect = text_surface.get_rect(center=(self.screen_width // 2, y_offset))
             surface.blit(text_surface, text_rect)
             y_offset += 40
 
         # Draw the continue button
-        continue_surface = self.font.render("Continue", True, (255, 255, 255))
+        continue_surface = font_registry.render(self.font, "Continue", (255, 255, 255))
         continue_rect = continue_surface.get_rect(center=(self.screen_width // 2, self.screen_height - 100))
         surface.blit(continue_surface, continue_rect)
 
-        pygame.display.flip()  # Update the screen
-
     def handle_events(self, event):
         """Handle click on the continue button."""
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            mouse_pos = pygame.mouse.get_pos()
+            mouse_pos = event.pos
             if self.continue_rect.collidepoint(mouse_pos):
-                print("Continue button clicked")  # Debugging line
+                tracer.info('menu', "Continue button clicked")
                 return "continue"
         return None
 
 # Step 2: Family Selection Step
 class FamilySelectionStep:
     def __init__(self, screen_width, screen_height):
-        self.font = pygame.font.Font('assets/pixelify_font/PixelifySans-Regular.ttf', 25)
-        self.button_font = pygame.font.Font('assets/pixelify_font/PixelifySans-Regular.ttf', 25)
+        self.font = font_registry.get_font('assets/pixelify_font/PixelifySans-Regular.ttf', 25)
+        self.button_font = font_registry.get_font('assets/pixelify_font/PixelifySans-Regular.ttf', 25)
 
         # Families to choose from
         self.families = ["The Wellingtons", "The Andersons", "The Harpers"]
@@ -69,7 +69,7 @@ class FamilySelectionStep:
 
         # Create family buttons
         for index, family in enumerate(self.families):
-            button_text = self.button_font.render(family, True, (255, 255, 255))
+            button_text = font_registry.render(self.button_font, family, (255, 255, 255))
             button_rect = button_text.get_rect(center=(screen_width // 2, screen_height // 2 + index * 60))
             self.family_buttons.append((button_text, button_rect))
 
@@ -81,23 +81,22 @@ class FamilySelectionStep:
         game_instance.draw_tiled_background(surface)  # Pass the surface to draw the background
 
         # Draw the family selection text
-        header = self.font.render("Select the family you are protecting:", True, (255, 255, 255))
+        header = font_registry.render(self.font, "Select the family you are protecting:", (255, 255, 255))
         header_rect = header.get_rect(center=(surface.get_width() // 2, surface.get_height() // 4))
         surface.blit(header, header_rect)
 
         # Draw family buttons
         for button_text, button_rect in self.family_buttons:
             surface.blit(button_text, button_rect)
-        pygame.display.flip()
 
     def handle_events(self, event):
         """Handle family selection clicks."""
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:  # Left click
-            mouse_pos = pygame.mouse.get_pos()
+            mouse_pos = event.pos
             for family_text, rect in self.family_buttons:
                 if rect.collidepoint(mouse_pos):
                     self.selected_family = family_text
-                    print(f"Selected family: {self.selected_family}")  # Debugging line
+                    tracer.info('menu', "Selected family: %s", self.selected_family)
                     return "team_selection"  # Proceed to the next step
         return None
 
@@ -112,8 +111,8 @@ class TeamSelectionStep:
     }
 
     def __init__(self, screen_width, screen_height, stat_window):
-        self.font = pygame.font.Font('assets/pixelify_font/PixelifySans-Regular.ttf', 25)
-        self.button_font = pygame.font.Font('assets/pixelify_font/PixelifySans-Regular.ttf', 25)
+        self.font = font_registry.get_font('assets/pixelify_font/PixelifySans-Regular.ttf', 25)
+        self.button_font = font_registry.get_font('assets/pixelify_font/PixelifySans-Regular.ttf', 25)
 
         # Team roles
         self.roles = ["Sniper", "Machine Gunner", "Medic", "Engineer"]
@@ -125,16 +124,16 @@ class TeamSelectionStep:
 
         # Create role buttons
         for index, role in enumerate(self.roles):
-            button_text = self.button_font.render(role, True, (255, 255, 255))
+            button_text = font_registry.render(self.button_font, role, (255, 255, 255))
             button_rect = button_text.get_rect(center=(screen_width // 2, screen_height // 2 + index * 60))
             self.role_buttons.append((role, button_text, button_rect))
 
         # Counter text
-        self.counter_text = self.font.render("0/2 selected", True, (255, 255, 255))
+        self.counter_text = font_registry.render(self.font, "0/2 selected", (255, 255, 255))
         self.counter_rect = self.counter_text.get_rect(center=(screen_width // 2, screen_height // 4 - 50))
 
         # Continue button (initially hidden)
-        self.continue_text = self.button_font.render("Continue", True, (255, 255, 255))
+        self.continue_text = font_registry.render(self.button_font, "Continue", (255, 255, 255))
         self.continue_rect = self.continue_text.get_rect(center=(screen_width // 2, screen_height - 100))
         self.show_continue_button = False
 
@@ -144,7 +143,7 @@ class TeamSelectionStep:
         game_instance.draw_tiled_background(surface)  # Pass the surface to draw the background
 
         # Draw the team selection text
-        header = self.font.render("Select your security team members:", True, (255, 255, 255))
+        header = font_registry.render(self.font, "Select your security team members:", (255, 255, 255))
         header_rect = header.get_rect(center=(surface.get_width() // 2, surface.get_height() // 4))
         surface.blit(header, header_rect)
 
@@ -153,19 +152,17 @@ class TeamSelectionStep:
             surface.blit(button_text, button_rect)
 
         # Draw the counter
-        self.counter_text = self.font.render(f"{len(self.selected_roles)}/2 selected", True, (255, 255, 255))
+        self.counter_text = font_registry.render(self.font, f"{len(self.selected_roles)}/2 selected", (255, 255, 255))
         surface.blit(self.counter_text, self.counter_rect)
 
         # Draw the continue button if 2 selections are made
         if self.show_continue_button:
             surface.blit(self.continue_text, self.continue_rect)
 
-        pygame.display.flip()
-
     def handle_events(self, event):
         """Handle role selection clicks and continue button."""
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:  # Left click
-            mouse_pos = pygame.mouse.get_pos()
+            mouse_pos = event.pos
 
             # Check if the user clicked on a role button
             for role, _, button_rect in self.role_buttons:
@@ -183,7 +180,7 @@ class TeamSelectionStep:
 
             # Check if the user clicked the continue button
             if self.show_continue_button and self.continue_rect.collidepoint(mouse_pos):
-                print("Continue button clicked, applying boosts.")  # Debugging line
+                tracer.info('menu', "Continue button clicked, applying boosts.")
                 self.apply_team_boosts(self.selected_roles)  # Apply boosts
                 return "game_start"
 
@@ -194,7 +191,7 @@ class TeamSelectionStep:
             boosts = self.TEAM_BOOSTS.get(member, {})
             for stat, boost_value in boosts.items():
                 self.stat_window.apply_stat_boost(stat, boost_value)
-                print(f"Boost applied for {member}: {stat} increased by {boost_value}")
+                tracer.info('menu', "Boost applied for %s: %s increased by %s", member, stat, boost_value)
     
     def create_character(self, player_stats):
         """Create the character with the selected roles affecting stats."""
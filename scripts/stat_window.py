@@ -1,9 +1,11 @@
 import pygame
+from scripts.font_registry import font_registry
+from scripts.trace import tracer
 
 class StatWindow:
     def __init__(self, screen, player_stats):
         self.screen = screen
-        self.font = pygame.font.Font('assets/pixelify_font/PixelifySans-Regular.ttf', 25)
+        self.font = font_registry.get_font('assets/pixelify_font/PixelifySans-Regular.ttf', 25)
         self.show_window = False
         self.player_stats = player_stats  # Dictionary holding base stats, boosts, and totals
 
@@ -23,7 +25,7 @@ class StatWindow:
             base_value, boost, total = self.player_stats[stat_name]
             new_boost = boost + boost_value
             self.player_stats[stat_name] = (base_value, new_boost, base_value + new_boost)
-            print(f"Applied {boost_value} boost to {stat_name}. New value: {self.player_stats[stat_name]}")
+            tracer.info('stats', "Applied %s boost to %s. New value: %s", boost_value, stat_name, self.player_stats[stat_name])
 
     def draw(self):
         if self.show_window:
@@ -45,7 +47,7 @@ class StatWindow:
             # Add column headers
             headers = ['Stat', 'Base', 'Boost', 'Total']
             for i, header in enumerate(headers):
-                header_surface = self.font.render(header, True, (255, 255, 255))  # White text
+                header_surface = font_registry.render(self.font, header, (255, 255, 255))  # White text
                 if i == 0:
                     self.screen.blit(header_surface, (self.window_rect.x + x_offset, self.window_rect.y + y_offset))  # First column
                 else:
@@ -63,10 +65,10 @@ class StatWindow:
                 total_text = f"{total_value:.1f}"
 
                 # Display each stat with base value, boost (in green), and total
-                stat_surface = self.font.render(stat_text, True, (255, 255, 255))  # White text
-                base_surface = self.font.render(base_text, True, (255, 255, 255))  # White text
-                boost_surface = self.font.render(boost_text, True, (0, 255, 0))  # Green for boost value
-                total_surface = self.font.render(total_text, True, (255, 255, 255))  # White text
+                stat_surface = font_registry.render(self.font, stat_text, (255, 255, 255))  # White text
+                base_surface = font_registry.render(self.font, base_text, (255, 255, 255))  # White text
+                boost_surface = font_registry.render(self.font, boost_text, (0, 255, 0))  # Green for boost value
+                total_surface = font_registry.render(self.font, total_text, (255, 255, 255))  # White text
 
                 # Adjust the horizontal spacing: first column wider
                 self.screen.blit(stat_surface, (self.window_rect.x + x_offset, self.window_rect.y + y_offset))  # First column
@@ -0,0 +1,115 @@
+# trace.py
+
+import os
+import sys
+import time
+from collections import deque
+
+# Trace levels (lower is more verbose)
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+OFF = 100
+
+LEVEL_NAMES = {DEBUG: 'DEBUG', INFO: 'INFO', WARNING: 'WARNING', ERROR: 'ERROR', OFF: 'OFF'}
+
+class Tracer:
+    """Level-gated trace messages by category, kept in an in-memory ring buffer.
+
+    Messages use %-style arguments that are only formatted when the buffer is written out,
+    so a disabled category costs a dictionary lookup and a comparison.
+    """
+
+    def __init__(self, capacity=10000, default_level=WARNING):
+        self.records = deque(maxlen=capacity)
+        self.default_level = default_level
+        self.levels = {}  # Per-category level, overriding default_level
+        self.echo = False  # Also print each record to stdout as it is logged
+        self.crash_path = None
+        self.previous_excepthook = None
+
+    def set_level(self, category, level):
+        """Set the minimum level recorded for a category."""
+        self.levels[category] = level
+
+    def configure(self, spec):
+        """Set levels from a string like "bullets=debug,combat=info" ("*" sets the default level)."""
+        for entry in spec.split(','):
+            if '=' not in entry:
+                continue
+            category, level_name = (part.strip() for part in entry.split('=', 1))
+            level = next((level for level, name in LEVEL_NAMES.items() if name == level_name.upper()), None)
+            if level is None:
+                continue
+            if category == '*':
+                self.default_level = level
+            else:
+                self.levels[category] = level
+
+    def is_enabled(self, category, level=DEBUG):
+        """Check whether a record of this category and level would be kept."""
+        return level >= self.levels.get(category, self.default_level)
+
+    def log(self, category, level, message, *args):
+        """Record a message if its category is enabled for the level."""
+        if level < self.levels.get(category, self.default_level):
+            return
+        self.records.append((time.perf_counter(), category, level, message, args))
+        if self.echo:
+            print(self.format_record(self.records[-1]))
+
+    def debug(self, category, message, *args):
+        self.log(category, DEBUG, message, *args)
+
+    def info(self, category, message, *args):
+        self.log(category, INFO, message, *args)
+
+    def warning(self, category, message, *args):
+        self.log(category, WARNING, message, *args)
+
+    def error(self, category, message, *args):
+        self.log(category, ERROR, message, *args)
+
+    def format_record(self, record):
+        """Turn a buffered record into a line of text."""
+        timestamp, category, level, message, args = record
+        if args:
+            try:
+                message = message % args
+            except (TypeError, ValueError):
+                message = f"{message} {args}"
+        return f"{timestamp:.6f} {LEVEL_NAMES.get(level, level)} [{category}] {message}"
+
+    def flush(self, path='trace.log'):
+        """Append every buffered record to a file and empty the buffer; returns the number written."""
+        count = len(self.records)
+        if count == 0:
+            return 0
+        with open(path, 'a') as trace_file:
+            while self.records:
+                trace_file.write(self.format_record(self.records.popleft()) + "\n")
+        return count
+
+    def install_crash_handler(self, path='trace.log'):
+        """Flush the buffer to a file when the game crashes with an uncaught exception."""
+        if self.previous_excepthook is not None:
+            self.crash_path = path
+            return
+
+        self.crash_path = path
+        self.previous_excepthook = sys.excepthook
+
+        def excepthook(exc_type, exc_value, traceback):
+            self.error('crash', "%s: %s", exc_type.__name__, exc_value)
+            try:
+                self.flush(self.crash_path)
+            finally:
+                self.previous_excepthook(exc_type, exc_value, traceback)
+
+        sys.excepthook = excepthook
+
+
+# Shared tracer; levels can be set with UNDEAD_TRACE="bullets=debug,combat=info"
+tracer = Tracer()
+tracer.configure(os.environ.get('UNDEAD_TRACE', ''))
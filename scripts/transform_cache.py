@@ -0,0 +1,75 @@
+# transform_cache.py
+
+import pygame
+from collections import OrderedDict
+
+class TransformCache:
+    def __init__(self, cache_size=256, angle_step=5, zoom_step=0.05):
+        # Transformed surfaces keyed by (source surface, zoom bucket, angle bucket), oldest first
+        self.cache = OrderedDict()
+        self.cache_size = cache_size
+
+        # Quantization steps (degrees and zoom factor)
+        self.angle_step = angle_step
+        self.zoom_step = zoom_step
+
+        # Cache statistics
+        self.hits = 0
+        self.misses = 0
+
+    def zoom_bucket(self, zoom_level):
+        """Snap a zoom level to the nearest zoom bucket."""
+        return round(round(zoom_level / self.zoom_step) * self.zoom_step, 4)
+
+    def angle_bucket(self, angle):
+        """Snap an angle in degrees to the nearest angle bucket in [0, 360)."""
+        return (round(angle / self.angle_step) * self.angle_step) % 360
+
+    def get(self, surface, zoom_level=1.0, angle=0):
+        """Return the surface scaled by zoom_level and rotated by angle, reusing earlier results."""
+        zoom = self.zoom_bucket(zoom_level)
+        rotation = self.angle_bucket(angle) if angle else 0
+
+        # Nothing to transform
+        if zoom == 1.0 and rotation == 0:
+            return surface
+
+        key = (surface, zoom, rotation)
+        transformed = self.cache.get(key)
+        if transformed is not None:
+            self.hits += 1
+            self.cache.move_to_end(key)
+            return transformed
+
+        self.misses += 1
+        transformed = surface
+        if zoom != 1.0:
+            width = max(1, int(surface.get_width() * zoom))
+            height = max(1, int(surface.get_height() * zoom))
+            transformed = pygame.transform.scale(transformed, (width, height))
+        if rotation:
+            transformed = pygame.transform.rotate(transformed, rotation)
+
+        self.cache[key] = transformed
+
+        # Evict the least recently used surfaces
+        while len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+        return transformed
+
+    def set_angle_step(self, angle_step):
+        """Change the rotation quantization and drop the surfaces built with the old step."""
+        self.angle_step = angle_step
+        self.cache.clear()
+
+    def clear(self):
+        """Drop every cached surface."""
+        self.cache.clear()
+
+    def stats(self):
+        """Return cache statistics."""
+        return {'hits': self.hits, 'misses': self.misses, 'cached': len(self.cache)}
+
+
+# Shared cache used by every sprite that is zoomed or rotated
+transform_cache = TransformCache()
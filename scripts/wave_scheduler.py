@@ -0,0 +1,94 @@
+# wave_scheduler.py
+
+from collections import deque
+from scripts.zombie import SPAWN_EDGES
+
+# Multipliers on the game's base zombie stats for each archetype, so swept base stats carry over
+ARCHETYPES = {
+    'walker': {},
+    'runner': {'speed': 1.6, 'health': 0.6},
+}
+
+class WaveGroup:
+    """Part of a wave: count zombies of one archetype, one every cadence_ms after delay_ms, from the given edges."""
+
+    def __init__(self, count, archetype='walker', cadence_ms=200, edges=SPAWN_EDGES, delay_ms=0):
+        self.count = count
+        self.archetype = archetype
+        self.cadence_ms = cadence_ms
+        self.edges = edges
+        self.delay_ms = delay_ms
+
+
+def default_wave(day):
+    """The zombies of a day: five walkers per day number, from every edge."""
+    return [WaveGroup(5 * day)]
+
+
+class WaveScheduler:
+    """Builds a day's zombies ahead of time and releases them over the day, a few at a time.
+
+    prepare(day) queues the day's wave (usually during the countdown before it) and every
+    update() builds up to build_budget of its zombies, so they are ready when the day starts.
+    start() releases them on their schedule, at most spawn_budget per update.
+
+    build(archetype, edges) must return a new zombie and release(zombie) adds it to the game.
+    """
+
+    def __init__(self, build, release, waves=default_wave, build_budget=8, spawn_budget=4):
+        self.build = build
+        self.release = release
+        self.waves = waves  # waves(day) -> list of WaveGroup
+        self.build_budget = build_budget  # Zombies built per update
+        self.spawn_budget = spawn_budget  # Zombies released per update
+
+        self.day = None  # Day of the prepared wave
+        self.to_build = deque()  # (release offset in ms, archetype, edges), in release order
+        self.built = deque()  # (release offset in ms, zombie), in release order
+        self.started_at = None  # Game time the wave started at, None until it starts
+
+    def prepare(self, day):
+        """Queue the wave for day (nothing happens if it is already prepared)."""
+        if self.day == day:
+            return
+        self.clear()
+        self.day = day
+        schedule = []
+        for group in self.waves(day):
+            for i in range(group.count):
+                schedule.append((group.delay_ms + i * group.cadence_ms, group.archetype, group.edges))
+        schedule.sort(key=lambda entry: entry[0])
+        self.to_build.extend(schedule)
+
+    def start(self, day, now):
+        """Start releasing the wave for day at game time now (preparing it first if needed)."""
+        self.prepare(day)
+        self.started_at = now
+
+    def clear(self):
+        """Drop the prepared wave."""
+        self.day = None
+        self.to_build.clear()
+        self.built.clear()
+        self.started_at = None
+
+    def is_releasing(self):
+        """Whether the started wave still has zombies to release."""
+        return self.started_at is not None and bool(self.to_build or self.built)
+
+    def update(self, now):
+        """Build the next zombies within the build budget and release the ones due, within the spawn budget."""
+        for _ in range(min(self.build_budget, len(self.to_build))):
+            offset, archetype, edges = self.to_build.popleft()
+            self.built.append((offset, self.build(archetype, edges)))
+
+        if self.started_at is None:
+            return 0
+        released = 0
+        while self.built and released < self.spawn_budget and self.built[0][0] <= now - self.started_at:
+            self.release(self.built.popleft()[1])
+            released += 1
+        if not self.to_build and not self.built:
+            self.started_at = None
+            self.day = None
+        return released
@@ -1,17 +1,37 @@
 import pygame
 import math
 import random
+from scripts.trace import tracer
+from scripts.animation import animations
+
+# Screen edges zombies can come from
+SPAWN_EDGES = ("top", "bottom", "left", "right")
+
+# Stats of a zombie built without overrides
+DEFAULT_STATS = {'health': 100, 'speed': 1}
 
 class Zombie:
-    def __init__(self, screen_width, screen_height, house_x, house_y, width=20, height=50, health=100, speed=1):
+    __slots__ = ('base_width', 'base_height', 'max_health', 'current_health', 'speed', 'x', 'y',
+                 'house_x', 'house_y', 'velocity_x', 'velocity_y', 'reached_house', 'damage_timer',
+                 'archetype', 'animation_time')
+
+    def __init__(self, screen_width, screen_height, house_x, house_y, width=20, height=50,
+                 health=DEFAULT_STATS['health'], speed=DEFAULT_STATS['speed'], edges=SPAWN_EDGES, archetype='walker'):
+        self.reset(screen_width, screen_height, house_x, house_y, width, height, health, speed, edges, archetype)
+
+    def reset(self, screen_width, screen_height, house_x, house_y, width=20, height=50,
+              health=DEFAULT_STATS['health'], speed=DEFAULT_STATS['speed'], edges=SPAWN_EDGES, archetype='walker'):
+        """(Re)initialize the zombie so a pooled instance can be reused."""
+        self.archetype = archetype  # Which animation set draws the zombie
+        self.animation_time = 0  # Time spent walking, in ms, for the walk clip
         self.base_width = width
         self.base_height = height
         self.max_health = health
         self.current_health = health
         self.speed = speed
 
-        # Randomly spawn outside the screen
-        self.x, self.y = self.random_spawn_location(screen_width, screen_height)
+        # Randomly spawn outside the screen, beyond one of the given edges
+        self.x, self.y = self.random_spawn_location(screen_width, screen_height, edges)
 
         # Calculate movement direction toward the house
         self.house_x = house_x
@@ -21,10 +41,10 @@ class Zombie:
         self.reached_house = False  # Tracks if the zombie has reached the house
         self.damage_timer = 0  # Timer to track when the zombie deals damage
 
-    def random_spawn_location(self, screen_width, screen_height):
+    def random_spawn_location(self, screen_width, screen_height, edges=SPAWN_EDGES):
         """Spawn randomly outside the screen."""
         spawn_buffer = 100  # Extra space outside the screen to spawn the zombies
-        side = random.choice(["top", "bottom", "left", "right"])
+        side = random.choice(edges)
         if side == "top":
             return random.randint(-spawn_buffer, screen_width + spawn_buffer), -spawn_buffer
         elif side == "bottom":
@@ -62,6 +82,7 @@ class Zombie:
         # Move the zombie
         self.x += self.velocity_x
         self.y += self.velocity_y
+        self.animation_time += delta_time
 
         # Check if the zombie should attack the character or house
         if distance_to_character < 20 and not character.is_dead() and not character.in_house:  # Attack character
@@ -79,7 +100,7 @@ class Zombie:
 
     def take_damage(self, damage):
         self.current_health -= damage
-        print(f"Zombie took {damage} damage. Health is now {self.current_health}")  # Debugging line
+        tracer.debug('combat', "Zombie took %s damage. Health is now %s", damage, self.current_health)
 
         if self.current_health < 0:
             self.current_health = 0
@@ -103,13 +124,13 @@ class Zombie:
         zombie_rect = pygame.Rect(self.x, self.y, self.base_width, self.base_height)
 
         # Debugging: Print out rectangles to see if they overlap
-        print(f"Bullet rect: {bullet_rect}, Zombie rect: {zombie_rect}")
+        tracer.debug('collisions', "Bullet rect: %s, Zombie rect: %s", bullet_rect, zombie_rect)
 
         # Check for collision
         collision = zombie_rect.colliderect(bullet_rect)
 
         if collision:
-            print("Collision detected!")  # Debugging line to confirm collision
+            tracer.debug('collisions', "Collision detected!")
 
         return collision
 
@@ -120,8 +141,10 @@ class Zombie:
         scaled_width = int(self.base_width * zoom_level)
         scaled_height = int(self.base_height * zoom_level)
 
-        # Draw the zombie
-        pygame.draw.rect(surface, (0, 255, 0), (self.x, self.y, scaled_width, scaled_height))
+        # Draw the zombie's walk frame, standing on the bottom of its box
+        sprite, offset_x, offset_y = animations.get(self.archetype).frame_at('walk', self.animation_time,
+                                                                              scaled_width, scaled_height)
+        surface.blit(sprite, (self.x + offset_x, self.y + offset_y))
 
         # Draw the health bar
         health_bar_width = int((self.current_health / self.max_health) * scaled_width)
@@ -0,0 +1,362 @@
+# zombie_horde.py
+
+import numpy as np
+import pygame
+from scripts.zombie import Zombie
+from scripts.array_views import array_property
+from scripts.object_pool import ObjectPool
+from scripts.ray_cast import RayGrid
+from scripts.animation import animations, ZOMBIE_ARCHETYPES, ARCHETYPE_IDS
+
+# Per-zombie state stored as one NumPy array per field
+FIELDS = ('x', 'y', 'velocity_x', 'velocity_y', 'current_health', 'max_health',
+          'speed', 'base_width', 'base_height', 'damage_timer', 'house_x', 'house_y', 'target',
+          'previous_x', 'previous_y', 'animation_time', 'animation', 'attacking')
+
+# Fields that are not copied from the appended Zombie
+HORDE_FIELDS = ('target', 'previous_x', 'previous_y', 'animation', 'attacking')
+
+# Values for the target array
+TARGET_HOUSE = 0
+TARGET_CHARACTER = 1
+
+class HordeZombie(Zombie):
+    """A Zombie whose state lives in a ZombieHorde, so every Zombie method keeps working.
+
+    Views are recycled once their zombie leaves the horde, so do not keep them around.
+    """
+    __slots__ = ('horde', 'index')
+
+    def __init__(self, horde, index):
+        # Zombie.__init__ is not called, the state is already in the horde arrays
+        self.reset(horde, index)
+
+    def reset(self, horde, index):
+        """Point the view at a horde slot."""
+        self.horde = horde
+        self.index = index
+        self.reached_house = False
+
+    x = array_property('x')
+    y = array_property('y')
+    velocity_x = array_property('velocity_x')
+    velocity_y = array_property('velocity_y')
+    current_health = array_property('current_health')
+    max_health = array_property('max_health')
+    speed = array_property('speed')
+    base_width = array_property('base_width')
+    base_height = array_property('base_height')
+    damage_timer = array_property('damage_timer')
+    house_x = array_property('house_x')
+    house_y = array_property('house_y')
+    animation_time = array_property('animation_time')
+
+    @property
+    def archetype(self):
+        return ZOMBIE_ARCHETYPES[int(self.horde.animation[self.index])]
+
+
+class ZombieHorde:
+    """Structure-of-arrays storage for every zombie, updated with batched NumPy operations.
+
+    The horde behaves like the old list of zombies (len, iteration, append, remove),
+    handing out HordeZombie views that read and write the arrays.
+    """
+
+    def __init__(self, capacity=256):
+        self.count = 0
+        self.capacity = capacity
+        for name in FIELDS:
+            setattr(self, name, np.zeros(capacity, dtype=np.float64))
+        self.views = []
+        self.view_pool = ObjectPool(HordeZombie)
+
+        # Pre-drawn health bar backgrounds keyed by (width, full_health)
+        self.health_bars = {}
+
+        # Optional FlowField that zombies walking to the house follow (straight lines without one)
+        self.flow_field = None
+
+        # Grid of the zombies' bounding boxes for ray casts, rebuilt on the first cast after they change
+        self.ray_grid = RayGrid(cell_size=64)
+        self.ray_grid_dirty = True
+
+    def __len__(self):
+        return self.count
+
+    def __bool__(self):
+        return self.count > 0
+
+    def __iter__(self):
+        return iter(self.views[:self.count])
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.views[:self.count][index]
+        # Index the views directly, without copying the list
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("zombie index out of range")
+        return self.views[index]
+
+    def grow(self, capacity):
+        """Resize every array to hold at least capacity zombies."""
+        while self.capacity < capacity:
+            self.capacity *= 2
+        for name in FIELDS:
+            array = np.zeros(self.capacity, dtype=np.float64)
+            array[:self.count] = getattr(self, name)[:self.count]
+            setattr(self, name, array)
+
+    def append(self, zombie):
+        """Add a zombie to the horde, copying its state into the arrays; returns its view."""
+        if self.count == self.capacity:
+            self.grow(self.count + 1)
+
+        index = self.count
+        for name in FIELDS:
+            if name not in HORDE_FIELDS:
+                getattr(self, name)[index] = getattr(zombie, name)
+        self.target[index] = TARGET_HOUSE
+        self.previous_x[index] = zombie.x
+        self.previous_y[index] = zombie.y
+        self.animation[index] = ARCHETYPE_IDS.get(zombie.archetype, 0)
+        self.attacking[index] = 0
+
+        view = self.view_pool.acquire(self, index)
+        view.reached_house = zombie.reached_house
+        self.views.append(view)
+        self.count += 1
+        self.ray_grid_dirty = True
+        return view
+
+    def remove(self, zombie):
+        """Remove a zombie by moving the last zombie into its slot."""
+        index = zombie.index
+        if index < 0 or index >= self.count or self.views[index] is not zombie:
+            raise ValueError("zombie is not in the horde")
+
+        last = self.count - 1
+        if index != last:
+            for name in FIELDS:
+                array = getattr(self, name)
+                array[index] = array[last]
+            moved = self.views[last]
+            moved.index = index
+            self.views[index] = moved
+
+        self.views.pop()
+        self.release_view(zombie)
+        self.count = last
+        self.ray_grid_dirty = True
+
+    def compact(self):
+        """Remove every dead zombie in one pass; returns the number removed."""
+        alive = self.current_health[:self.count] > 0
+        removed = self.count - int(alive.sum())
+        if removed == 0:
+            return 0
+
+        for index in np.flatnonzero(~alive):
+            self.release_view(self.views[index])
+
+        keep = np.flatnonzero(alive)
+        for name in FIELDS:
+            array = getattr(self, name)
+            array[:len(keep)] = array[keep]
+
+        self.views = [self.views[i] for i in keep]
+        for index, view in enumerate(self.views):
+            view.index = index
+
+        self.count = len(keep)
+        self.ray_grid_dirty = True
+        return removed
+
+    def clear(self):
+        """Remove every zombie."""
+        for view in self.views:
+            self.release_view(view)
+        self.views = []
+        self.count = 0
+        self.ray_grid_dirty = True
+
+    def release_view(self, view):
+        """Detach a view from its slot and keep it for the next appended zombie."""
+        view.index = -1
+        self.view_pool.release(view)
+
+    def update(self, delta_time, character, house):
+        """Move every zombie and tick its damage timer; returns how many zombies hit the house.
+
+        Mirrors Zombie.update: zombies within 100 px of a character outside the house chase
+        the character, the others walk to the house, and a zombie deals 5 damage every second
+        it spends within 20 px of its target.
+        """
+        n = self.count
+        if n == 0:
+            return 0
+
+        x, y = self.x[:n], self.y[:n]
+        velocity_x, velocity_y = self.velocity_x[:n], self.velocity_y[:n]
+        speed = self.speed[:n]
+        house_x, house_y = self.house_x[:n], self.house_y[:n]
+        damage_timer = self.damage_timer[:n]
+
+        # Distance to the character before moving
+        can_target_character = not character.is_dead() and not character.in_house
+        if can_target_character:
+            distance_to_character = np.hypot(character.x - x, character.y - y)
+            chasing = distance_to_character < 100
+        else:
+            distance_to_character = None
+            chasing = np.zeros(n, dtype=bool)
+        self.target[:n] = np.where(chasing, TARGET_CHARACTER, TARGET_HOUSE)
+
+        # Movement direction toward the house or the character
+        delta_x = np.where(chasing, character.x, house_x) - x
+        delta_y = np.where(chasing, character.y, house_y) - y
+        distance = np.hypot(delta_x, delta_y)
+        moving = distance != 0
+        safe_distance = np.where(moving, distance, 1.0)
+        velocity_x[:] = np.where(moving, delta_x / safe_distance * speed, 0.0)
+        velocity_y[:] = np.where(moving, delta_y / safe_distance * speed, 0.0)
+
+        # Zombies on their way to the house follow the flow field, except in the house's own cell
+        if self.flow_field is not None:
+            flow_x, flow_y, has_flow = self.flow_field.directions(x, y)
+            following = ~chasing & has_flow
+            velocity_x[following] = flow_x[following] * speed[following]
+            velocity_y[following] = flow_y[following] * speed[following]
+
+        # Move the zombies, keeping the old position for interpolated drawing
+        self.previous_x[:n] = x
+        self.previous_y[:n] = y
+        x += velocity_x
+        y += velocity_y
+        self.ray_grid_dirty = True
+
+        # Attack the character if close enough, otherwise the house
+        if can_target_character:
+            attacking_character = distance_to_character < 20
+        else:
+            attacking_character = np.zeros(n, dtype=bool)
+        attacking_house = ~attacking_character & (np.hypot(x - house_x, y - house_y) < 20)
+
+        attacking = attacking_character | attacking_house
+        self.attacking[:n] = attacking
+        self.animation_time[:n] += delta_time
+        damage_timer[attacking] += delta_time
+        dealing_damage = attacking & (damage_timer >= 1000)  # 1 second interval for damage
+        damage_timer[dealing_damage] = 0
+
+        for _ in range(int(np.count_nonzero(dealing_damage & attacking_character))):
+            character.take_damage(5)  # Deal 5 damage to the character
+
+        return int(np.count_nonzero(dealing_damage & attacking_house))
+
+    def query_rect(self, x, y, width, height):
+        """Return the zombies whose bounding box overlaps the rectangle."""
+        n = self.count
+        if n == 0:
+            return []
+        zombie_x, zombie_y = self.x[:n], self.y[:n]
+        overlapping = ((zombie_x <= x + width) & (zombie_x + self.base_width[:n] >= x) &
+                       (zombie_y <= y + height) & (zombie_y + self.base_height[:n] >= y))
+        return [self.views[i] for i in np.flatnonzero(overlapping)]
+
+    def query_radius(self, x, y, radius):
+        """Return the zombies whose position is closer than radius to the point."""
+        n = self.count
+        if n == 0:
+            return []
+        inside = np.hypot(self.x[:n] - x, self.y[:n] - y) < radius
+        return [self.views[i] for i in np.flatnonzero(inside)]
+
+    def raycast(self, x0, y0, x1, y1, pad_x=0, pad_y=0, first=True):
+        """Return (t, zombie) for the zombies whose bounding box the segment from (x0, y0) to (x1, y1)
+        crosses, nearest first (only the nearest with first). See RayGrid.query."""
+        return [(t, self.views[index]) for t, index in self.get_ray_grid().query(x0, y0, x1, y1, pad_x, pad_y, first)]
+
+    def sweep(self, x0, y0, x1, y1, pad_x=0, pad_y=0, first=True):
+        """Cast every segment in the arrays at once; returns a list of (t, index) hit lists, one per segment."""
+        return self.get_ray_grid().query_many(x0, y0, x1, y1, pad_x, pad_y, first)
+
+    def get_ray_grid(self):
+        if self.ray_grid_dirty:
+            n = self.count
+            x, y = self.x[:n].copy(), self.y[:n].copy()
+            self.ray_grid.build(x, y, x + self.base_width[:n], y + self.base_height[:n])
+            self.ray_grid_dirty = False
+        return self.ray_grid
+
+    def nearest(self, x, y):
+        """Return the zombie whose position is closest to the point, or None if the horde is empty."""
+        n = self.count
+        if n == 0:
+            return None
+        return self.views[int(np.argmin(np.hypot(self.x[:n] - x, self.y[:n] - y)))]
+
+    def get_health_bar(self, width, full_health):
+        """Return a cached health bar background: all green at full health, red otherwise."""
+        key = (width, full_health)
+        health_bar = self.health_bars.get(key)
+        if health_bar is None:
+            health_bar = pygame.Surface((max(1, width), 5))
+            health_bar.fill((0, 255, 0) if full_health else (255, 0, 0))
+            self.health_bars[key] = health_bar
+        return health_bar
+
+    def draw(self, surface, zoom_level, alpha=1.0):
+        """Draw every zombie's animation frame and health bar in one batch of blits.
+
+        Attacking zombies play their attack clip in step with their damage timer, the others
+        their walk clip; every zombie of an archetype shares that archetype's frames.
+        alpha places each zombie between its previous and current position (1.0 is the current one).
+        Returns the areas drawn, two per zombie (frame and health bar).
+        """
+        n = self.count
+        if n == 0:
+            return []
+
+        x, y = self.x[:n], self.y[:n]
+        if alpha != 1.0:
+            previous_x, previous_y = self.previous_x[:n], self.previous_y[:n]
+            x = previous_x + (x - previous_x) * alpha
+            y = previous_y + (y - previous_y) * alpha
+        xs = x.astype(int).tolist()
+        ys = y.astype(int).tolist()
+        widths = (self.base_width[:n] * zoom_level).astype(int).tolist()
+        heights = (self.base_height[:n] * zoom_level).astype(int).tolist()
+        health_fraction = (self.current_health[:n] / self.max_health[:n]).tolist()
+
+        # Frame of each zombie's clip
+        archetypes = self.animation[:n].astype(int)
+        attacking = self.attacking[:n] > 0
+        walk_ms, walk_frames = animations.timing('walk')
+        attack_ms, attack_frames = animations.timing('attack')
+        elapsed = np.where(attacking, self.damage_timer[:n], self.animation_time[:n])
+        frame_ms = np.where(attacking, attack_ms[archetypes], walk_ms[archetypes])
+        frame_counts = np.where(attacking, attack_frames[archetypes], walk_frames[archetypes])
+        frames = ((elapsed // frame_ms).astype(int) % frame_counts).tolist()
+        animation_sets = [animations.get(name) for name in ZOMBIE_ARCHETYPES]
+
+        blits = []
+        health_bars = []
+        for x, y, width, height, fraction, archetype, attack, frame in zip(
+                xs, ys, widths, heights, health_fraction, archetypes.tolist(), attacking.tolist(), frames):
+            sprite, offset_x, offset_y = animation_sets[archetype].fitted('attack' if attack else 'walk',
+                                                                          frame, width, height)
+            blits.append((sprite, (x + offset_x, y + offset_y)))
+            full_health = fraction >= 1
+            blits.append((self.get_health_bar(width, full_health), (x, y + height + 5)))
+            if not full_health:
+                health_bars.append((x, y + height + 5, int(fraction * width), 5))
+
+        rects = surface.blits(blits)
+
+        # Green for the remaining health of damaged zombies
+        for health_bar in health_bars:
+            pygame.draw.rect(surface, (0, 255, 0), health_bar)
+        return rects
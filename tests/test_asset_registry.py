@@ -0,0 +1,30 @@
+# test_asset_registry.py
+
+from scripts.asset_registry import AssetRegistry, asset_registry
+from scripts.game import Game
+
+GRASS = ('assets/grass.png', (64, 64), False)
+HOUSE = ('assets/starterhouseIMG.png', (200, 200), True)
+
+
+def test_evict_scene_keeps_shared_images():
+    registry = AssetRegistry()
+    registry.get_image('assets/grass.png', (64, 64), alpha=False, scene="menu")
+    registry.get_image('assets/starterhouseIMG.png', (200, 200), scene="menu")
+    registry.get_image('assets/starterhouseIMG.png', (200, 200), scene="game")
+
+    registry.evict_scene("menu")
+    assert GRASS not in registry.images
+    assert HOUSE in registry.images
+    assert registry.scenes[HOUSE] == {"game"}
+
+
+def test_menu_images_are_evicted_when_gameplay_starts():
+    game = Game(headless=True, seed=1)
+    game.draw_tiled_background(game.screen)  # The menus tile the grass
+    assert "menu" in asset_registry.scenes[GRASS]
+
+    game.start_game_after_team_selection()
+    assert GRASS not in asset_registry.images
+    assert HOUSE in asset_registry.images  # Gameplay images stay
+    game.draw_tiled_background(game.screen)  # The tiling built by the menus is reused
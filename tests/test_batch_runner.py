@@ -0,0 +1,22 @@
+# test_batch_runner.py
+
+from scripts.batch_runner import apply_params
+from scripts.game import Game
+
+
+def test_swept_zombie_stats_reach_runners():
+    game = Game(headless=True, seed=1)
+    apply_params(game, [('zombie.speed', 1.25), ('zombie.health', 200)])
+
+    walker = game.build_zombie('walker')
+    assert (walker.speed, walker.max_health) == (1.25, 200)
+
+    # Runners scale the swept stats instead of replacing them
+    runner = game.build_zombie('runner')
+    assert runner.speed == 1.25 * 1.6
+    assert runner.max_health == 200 * 0.6
+
+
+def test_default_runner_stats():
+    runner = Game(headless=True, seed=1).build_zombie('runner')
+    assert (runner.speed, runner.max_health) == (1.6, 60)
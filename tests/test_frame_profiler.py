@@ -0,0 +1,26 @@
+# test_frame_profiler.py
+
+import pygame
+from scripts.game import Game
+
+
+def press(game, key):
+    game.input.post(pygame.KEYDOWN, key=key)
+    game.handle_events()
+
+
+def test_toggling_profiler_twice_through_events():
+    game = Game(headless=True, seed=1)
+    game.start_game_after_team_selection()
+
+    press(game, pygame.K_F3)
+    assert game.profiler.enabled
+    game.profiler.end_frame()
+
+    # Disabling from inside the timed handle_events must not break its wrapper
+    press(game, pygame.K_F3)
+    assert not game.profiler.enabled
+    assert 'handle_events' not in vars(game)
+
+    press(game, pygame.K_F3)
+    assert game.profiler.enabled